@@ -8,7 +8,10 @@ Flow of pipeline:
 3. Runs Segmenters criteria into Grid
 4. Runs Filter functions to delete unnecessary voxels/point clouds
 5. Runs chosen backend and produces BackendOutput result with all necessary information
-6. Saves visualization to specified directory
+6. Saves optimised poses (and visualization in debug mode) to output directory
+
+Independent patches are processed in parallel by `pipeline.workers` processes.
+With single worker, the next patch is read in background while the current one is optimised.
 
 Arguments of CLI:
 configuration_path: str
@@ -21,25 +24,25 @@ python3 examples/pipeline.py --configuration_path examples/configurations/hilti.
 """
 from typing import Tuple
 
+import numpy as np
 import open3d as o3d
-from octreelib.grid import VisualizationConfig
 
 import argparse
 import copy
+import logging
 import os
 import random
 import sys
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from sova.pipeline import (
-    SequentialPipeline,
-    SequentialPipelineRuntimeParameters,
-    YAMLConfigurationReader,
-)
+from sova.pipeline import PatchRunner, YAMLConfigurationReader
 from sova.utils import (
+    CachedReader,
     DatasetReader,
     HiltiReader,
     KittiReader,
+    KittiVelodyneReader,
+    LRUCachedReader,
     NuscenesReader,
     OptimisedPoseReadWriter,
 )
@@ -57,113 +60,95 @@ def prepare_output_directories(
 
     visualization_dir = os.path.join(configuration.output_directory, "visualization")
     if configuration.debug:
-        if not os.path.join(visualization_dir):
+        if not os.path.exists(visualization_dir):
             os.makedirs(visualization_dir)
 
     return poses_dir, visualization_dir
 
 
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser(prog="Pipeline")
-    parser.add_argument("--configuration_path", type=str, required=True)
-    args = parser.parse_args()
-
-    configuration_reader = YAMLConfigurationReader(args.configuration_path)
-
-    dataset_reader = DatasetReader
-    if "hilti" in configuration_reader.dataset_type.lower():
+def create_dataset_reader(configuration: YAMLConfigurationReader) -> DatasetReader:
+    dataset_type = configuration.dataset_type.lower()
+    if "hilti" in dataset_type:
         dataset_reader = HiltiReader()
-    elif "kitti" in configuration_reader.dataset_type.lower():
+    elif "kitti_velodyne" in dataset_type:
+        dataset_reader = KittiVelodyneReader()
+    elif "kitti" in dataset_type:
         dataset_reader = KittiReader()
-    elif "nuscenes" in configuration_reader.dataset_type.lower():
+    elif "nuscenes" in dataset_type:
         dataset_reader = NuscenesReader()
     else:
         raise ValueError("Unrecognisable type of dataset")
-    posesWriter = OptimisedPoseReadWriter()
-
-    poses_dir, visualization_dir = prepare_output_directories(configuration_reader)
 
-    for ind in range(
-        configuration_reader.patches_start,
-        configuration_reader.patches_end,
-        configuration_reader.patches_step,
+    if configuration.dataset_cache_path is not None:
+        dataset_reader = CachedReader(dataset_reader, configuration.dataset_cache_path)
+    # Memory cache isn't shared by worker processes and patches don't overlap, so scans are
+    # served from it only when the debug view reads them again in the same process
+    if (
+        configuration.dataset_memory_cache_bytes > 0
+        and configuration.workers_number == 1
+        and configuration.debug
     ):
-        start = ind
-        end = min(
-            configuration_reader.patches_end, ind + configuration_reader.patches_step
+        dataset_reader = LRUCachedReader(
+            dataset_reader, configuration.dataset_memory_cache_bytes
         )
 
-        print(f"Processing {start} to {end-1}...")
+    return dataset_reader
 
-        point_clouds = []
-        initial_poses = []
-        for s in range(start, end):
-            point_cloud_path = os.path.join(
-                configuration_reader.dataset_path, "clouds", str(s) + ".pcd"
-            )
-            pose_path = os.path.join(
-                configuration_reader.dataset_path, "poses", str(s) + ".txt"
-            )
 
-            point_cloud = dataset_reader.read_point_cloud(filename=point_cloud_path)
-            initial_pose = dataset_reader.read_pose(filename=pose_path)
-
-            point_clouds.append(point_cloud)
-            initial_poses.append(initial_pose)
-
-        poses = copy.deepcopy(initial_poses)
-        for iteration_ind in range(configuration_reader.patches_iterations):
-            pipeline = SequentialPipeline(
-                point_clouds=point_clouds,
-                poses=poses,
-                subdividers=configuration_reader.subdividers,
-                segmenters=configuration_reader.segmenters,
-                filters=configuration_reader.filters,
-                backend=configuration_reader.backend(start, end),
-                debug=configuration_reader.debug,
-            )
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="Pipeline")
+    parser.add_argument("--configuration_path", type=str, required=True)
+    args = parser.parse_args()
+    # Progress of patches is logged by PatchRunner
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
 
-            output = pipeline.run(
-                SequentialPipelineRuntimeParameters(
-                    grid_configuration=configuration_reader.grid_configuration,
-                    visualization_config=VisualizationConfig(
-                        filepath=f"{visualization_dir}/{start}-{end - 1}_{iteration_ind}.html"
-                    ),
-                    initial_point_cloud_number=(end - start) // 2,
-                )
-            )
-            print(f"Iteration: {iteration_ind}:\n{output}")
+    configuration_reader = YAMLConfigurationReader(args.configuration_path)
+    poses_dir, visualization_dir = prepare_output_directories(configuration_reader)
 
-            for pose_ind in range(len(initial_poses)):
-                poses[pose_ind] = output.poses[pose_ind] @ poses[pose_ind]
+    dataset_reader = create_dataset_reader(configuration_reader)
+    posesWriter = OptimisedPoseReadWriter()
 
-            if configuration_reader.debug:
-                random.seed(42)
-                initial_point_cloud = o3d.geometry.PointCloud(
-                    o3d.utility.Vector3dVector()
-                )
-                optimised_point_cloud = o3d.geometry.PointCloud(
-                    o3d.utility.Vector3dVector()
-                )
-                for point_cloud, initial_pose, optimised_pose in zip(
-                    point_clouds, initial_poses, poses
-                ):
-                    color = [random.random(), random.random(), random.random()]
-                    before = copy.deepcopy(point_cloud).transform(initial_pose)
-                    before.paint_uniform_color(color)
-                    initial_point_cloud += before
-
-                    after = copy.deepcopy(point_cloud).transform(optimised_pose)
-                    after.paint_uniform_color(color)
-                    optimised_point_cloud += after
-
-                print("Initial point clouds is going to be printed")
-                o3d.visualization.draw(initial_point_cloud)
-                print("Optimised point clouds is going to be printed")
-                o3d.visualization.draw(optimised_point_cloud)
+    runner = PatchRunner(
+        configuration=configuration_reader,
+        dataset_reader=dataset_reader,
+        visualization_directory=visualization_dir,
+    )
 
+    for start, end, poses in runner.run():
         for optimised_pose_number in range(start, end):
             posesWriter.write(
                 os.path.join(poses_dir, f"{optimised_pose_number}.txt"),
                 poses[optimised_pose_number - start],
             )
+
+        if configuration_reader.debug:
+            random.seed(42)
+            initial_point_cloud = o3d.geometry.PointCloud(o3d.utility.Vector3dVector())
+            optimised_point_cloud = o3d.geometry.PointCloud(
+                o3d.utility.Vector3dVector()
+            )
+            for s, optimised_pose in zip(range(start, end), poses):
+                # Scans are read by the dataset reader, so every dataset layout is supported
+                points, initial_pose = dataset_reader.read_scan(
+                    configuration_reader.dataset_path, s
+                )
+                point_cloud = (
+                    points
+                    if isinstance(points, o3d.geometry.PointCloud)
+                    else o3d.geometry.PointCloud(
+                        o3d.utility.Vector3dVector(np.asarray(points, dtype=float))
+                    )
+                )
+                color = [random.random(), random.random(), random.random()]
+                before = copy.deepcopy(point_cloud).transform(initial_pose)
+                before.paint_uniform_color(color)
+                initial_point_cloud += before
+
+                after = copy.deepcopy(point_cloud).transform(optimised_pose)
+                after.paint_uniform_color(color)
+                optimised_point_cloud += after
+
+            print("Initial point clouds is going to be printed")
+            o3d.visualization.draw(initial_point_cloud)
+            print("Optimised point clouds is going to be printed")
+            o3d.visualization.draw(optimised_point_cloud)
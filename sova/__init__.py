@@ -1 +1,11 @@
-from sova import backend, filter, pipeline, segmenter, subdivider, typing, utils
+from sova import (
+    backend,
+    executor,
+    filter,
+    grid,
+    pipeline,
+    segmenter,
+    subdivider,
+    typing,
+    utils,
+)
@@ -55,6 +55,8 @@ class BackendOutput:
         Metrics which allows to evaluate the resulting optimizations
     unused_features: List[int]
         Represents features which were unused on optimization stage
+    converged: bool
+        Represents whether optimisation has converged. Otherwise poses are the best ones found before it was stopped
     """
 
     def __init__(
@@ -62,10 +64,12 @@ class BackendOutput:
         poses: ArrayNx4x4[float],
         metrics: List[Metric],
         unused_features: List[int] = [],
+        converged: bool = True,
     ) -> None:
         self._poses: ArrayNx4x4[float] = poses
         self._metrics: List[Metric] = metrics
         self._unused_features: List[int] = unused_features
+        self._converged: bool = converged
 
     @property
     def poses(self) -> ArrayNx4x4[float]:
@@ -79,6 +83,18 @@ class BackendOutput:
         """
         return self._poses
 
+    @property
+    def metrics(self) -> List[Metric]:
+        """
+        Represents method to get metrics of optimisation
+
+        Returns
+        -------
+        metrics: List[Metric]
+            Metrics of optimisation
+        """
+        return self._metrics
+
     @property
     def unused_features(self) -> List[int]:
         """
@@ -91,6 +107,18 @@ class BackendOutput:
         """
         return self._unused_features
 
+    @property
+    def converged(self) -> bool:
+        """
+        Represents method to get convergence flag of optimisation
+
+        Returns
+        -------
+        converged: bool
+            True if optimisation has converged
+        """
+        return self._converged
+
     def __str__(self) -> str:
         """
         Represents implementation of str dunder method to produce SLAM output pretty print
@@ -1,32 +1,27 @@
-from octreelib.grid import GridBase
-
 from sova.backend.mrob_backend import MROBBackend
+from sova.grid.voxel_index import VoxelIndex
 
 __all__ = ["BaregBackend"]
 
 
 class BaregBackend(MROBBackend):
-    def _init_point_clouds(self, grid: GridBase) -> None:
+    def _init_point_clouds(self, voxel_index: VoxelIndex) -> None:
         """
         Initializes plane features in graph using bareg backend
 
         Parameters
         ----------
-        grid: GridBase
-            Represents grid with all inserted point clouds
+        voxel_index: VoxelIndex
+            Represents index of voxels of grid with all inserted point clouds
         """
-        for pose_number in range(self._poses_number):
-            leaf_voxels = grid.get_leaf_points(
-                pose_number=pose_number,
-            )
-            for voxel in leaf_voxels:
-                if voxel.id not in self._planes.keys():
-                    bareg_plane_id = self._graph.add_bareg_plane()
-                    self._planes[voxel.id] = bareg_plane_id
-
+        for voxel_id, poses_points in voxel_index.items(min_poses_number=2):
+            self._planes[voxel_id] = self._graph.add_bareg_plane()
+            for pose_number, points in poses_points:
+                limited_points = self._limit_points(points)
+                # Weight restores the share of subsampled points (mrob 0.0.12 ignores it)
                 self._graph.eigen_factor_plane_add_points_array(
-                    planeEigenId=self._planes[voxel.id],
+                    planeEigenId=self._planes[voxel_id],
                     nodePoseId=pose_number,
-                    pointsArray=voxel.get_points(),
-                    W=1.0,
+                    pointsArray=limited_points,
+                    W=len(points) / len(limited_points),
                 )
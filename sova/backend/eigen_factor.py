@@ -1,32 +1,138 @@
-from octreelib.grid import GridBase
+import mrob
+
+from typing import List, Optional, Tuple
 
 from sova.backend.mrob_backend import MROBBackend
+from sova.filter.feature_filter import FeatureFilter
+from sova.grid.voxel_index import VoxelIndex
+from sova.typing.hints import ArrayNx3, ArrayNx4x4
+from sova.utils.voxel_statistics import VoxelStatistics
 
 __all__ = ["EigenFactorBackend"]
 
 
 class EigenFactorBackend(MROBBackend):
-    def _init_point_clouds(self, grid: GridBase) -> None:
+    """
+    Represents mrob backend which optimises poses using eigen factors of planes
+
+    Parameters
+    ----------
+    poses_number: int
+        Number of poses in provided map
+    iterations_number: int
+        Number of iterations that will be produced by chosen MROB backend
+    robust_type: int
+        Represents type of robust optimisations
+    solve_attempts: int
+        Maximum number of solver runs: if solver hasn't converged, it is run again from the reached state
+    time_budget: Optional[float]
+        Time in seconds after which no new solver runs are started (the first run is always made).
+        Time isn't limited if it is not specified
+    initial_poses: Optional[ArrayNx4x4[float]]
+        Initial estimates of poses which optimisation starts from. The first pose is anchored.
+        Optimisation starts from identity poses if they are not specified
+    max_points: Optional[int]
+        Maximum number of points of every voxel and pose which are added to graph (or compressed).
+        Points aren't subsampled if it is not specified
+    subsampling: str
+        Subsampling method: "uniform" chooses points at random, "stratified" spreads them over the voxel
+    seed: Optional[int]
+        Seed of random generator which subsamples points
+    feature_filters: Optional[List[FeatureFilter]]
+        Filters which are applied in the given order to voxels of grid before graph is built
+    compression_ratio: Optional[float]
+        If it is specified, points of every voxel and pose are replaced by about `compression_ratio` times
+        less points with the same mean and covariance before they are added to graph, so graph size depends
+        on the number of voxels instead of the number of points. Every pose keeps at least six points,
+        so voxel is compressed by `min(compression_ratio, n / 6)`, where `n` is the least number of points
+        of its poses, and voxels with less than six points of some pose aren't compressed.
+        Added points are weighted by the ratio of original and added numbers of points, which restores
+        the cost of every voxel and pose. Ratios differ between voxels and are rounded to whole points,
+        so compression requires mrob which honours weights (see `honours_point_weights`)
+        and is refused otherwise: mrob 0.0.12 ignores weights, and the optimum would move
+    """
+
+    def __init__(
+        self,
+        poses_number: int,
+        iterations_number: int,
+        robust_type: int = mrob.HUBER,
+        solve_attempts: int = 10,
+        time_budget: Optional[float] = None,
+        initial_poses: Optional[ArrayNx4x4[float]] = None,
+        max_points: Optional[int] = None,
+        subsampling: str = "uniform",
+        seed: Optional[int] = None,
+        feature_filters: Optional[List[FeatureFilter]] = None,
+        compression_ratio: Optional[float] = None,
+    ) -> None:
+        if compression_ratio is not None and compression_ratio < 1:
+            raise ValueError("Compression ratio must be more or equal than one")
+        if (
+            compression_ratio is not None
+            and compression_ratio > 1
+            and not self.honours_point_weights()
+        ):
+            raise ValueError(
+                "Compression requires weights of points, but installed mrob ignores them"
+            )
+
+        super().__init__(
+            poses_number,
+            iterations_number,
+            robust_type,
+            solve_attempts,
+            time_budget,
+            initial_poses,
+            max_points,
+            subsampling,
+            seed,
+            feature_filters,
+        )
+        self._compression_ratio: Optional[float] = compression_ratio
+
+    def _init_point_clouds(self, voxel_index: VoxelIndex) -> None:
         """
         Initializes plane features using eigen factor backend
 
         Parameters
         ----------
-        grid: GridBase
-            Represents grid with all inserted point clouds
+        voxel_index: VoxelIndex
+            Represents index of voxels of grid with all inserted point clouds
         """
-        for pose_number in range(self._poses_number):
-            leaf_voxels = grid.get_leaf_points(
-                pose_number=pose_number,
-            )
-            for voxel in leaf_voxels:
-                if voxel.id not in self._planes.keys():
-                    factor_plane_id = self._graph.add_eigen_factor_plane_center()
-                    self._planes[voxel.id] = factor_plane_id
+        for voxel_id, poses_points in voxel_index.items(min_poses_number=2):
+            self._planes[voxel_id] = self._graph.add_eigen_factor_plane_center()
+            limited_poses_points = [
+                (pose_number, self._limit_points(points))
+                for pose_number, points in poses_points
+            ]
+            compression_ratio = self.__compression_ratio(limited_poses_points)
+            for (pose_number, original_points), (_, points) in zip(
+                poses_points, limited_poses_points
+            ):
+                if compression_ratio > 1:
+                    points = VoxelStatistics(points).equivalent_points(
+                        round(len(points) / compression_ratio)
+                    )
 
                 self._graph.eigen_factor_plane_add_points_array(
-                    planeEigenId=self._planes[voxel.id],
+                    planeEigenId=self._planes[voxel_id],
                     nodePoseId=pose_number,
-                    pointsArray=voxel.get_points(),
-                    W=1.0,
+                    pointsArray=points,
+                    W=len(original_points) / len(points),
                 )
+
+    def __compression_ratio(
+        self, poses_points: List[Tuple[int, ArrayNx3[float]]]
+    ) -> float:
+        """
+        Finds ratio which all poses of voxel are compressed by, so every pose keeps at least six points.
+        Voxel isn't compressed if the ratio isn't more than one
+        """
+        if self._compression_ratio is None:
+            return 1.0
+
+        return min(
+            self._compression_ratio,
+            min(len(points) for _, points in poses_points) / 6,
+        )
@@ -1,10 +1,18 @@
 import mrob
+import numpy as np
 from octreelib.grid import GridBase
 
+import functools
+import time
+import warnings
 from abc import abstractmethod
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from sova.backend.backend import Backend, BackendOutput, Metric
+from sova.filter.feature_filter import FeatureFilter
+from sova.grid.voxel_index import VoxelIndex
+from sova.typing.hints import ArrayNx3, ArrayNx4x4
+from sova.utils.subsampling import stratified_subsample, uniform_subsample
 
 __all__ = ["MROBBackend"]
 
@@ -13,6 +21,10 @@ class MROBBackend(Backend):
     """
     Represents abstract class for mrob-like backends
     Library: https://github.com/prime-slam/mrob
+    Factor graph is built from scratch on every `process` call (mrob can't remove points from plane factors),
+    so the same backend may optimise several grids one after another, for example, every iteration of patch.
+    Graph is built in one pass over voxels of VoxelIndex. Voxels seen by only one pose are skipped:
+    cost of their plane doesn't depend on poses, so they would only enlarge the graph.
 
     Parameters
     ----------
@@ -22,33 +34,190 @@ class MROBBackend(Backend):
         Number of iterations that will be produced by chosen MROB backend
     robust_type: int
         Represents type of robust optimisations
+    solve_attempts: int
+        Maximum number of solver runs: if solver hasn't converged, it is run again from the reached state
+    time_budget: Optional[float]
+        Time in seconds after which no new solver runs are started. The first run is always made and
+        solver run can't be interrupted, so the budget may be exceeded by the last run.
+        Time isn't limited if it is not specified
+    initial_poses: Optional[ArrayNx4x4[float]]
+        Initial estimates of poses which optimisation starts from. The first pose is anchored.
+        Optimisation starts from identity poses if they are not specified
+    max_points: Optional[int]
+        Maximum number of points of every voxel and pose which are added to graph, so memory and solve time
+        don't depend on density of scans. Subsampled points are added with weight `count / max_points`,
+        which keeps weight of dense voxels. If installed mrob ignores weights (see `honours_point_weights`),
+        costs of subsampled voxels are scaled by `max_points / count`, dense voxels lose weight relative
+        to sparse ones and the optimum moves, so backend warns about it.
+        Points aren't subsampled if it is not specified
+    subsampling: str
+        Subsampling method: "uniform" chooses points at random, "stratified" spreads them over the voxel
+    seed: Optional[int]
+        Seed of random generator which subsamples points
+    feature_filters: Optional[List[FeatureFilter]]
+        Filters which are applied in the given order to voxels of grid before graph is built
     """
 
     def __init__(
-        self, poses_number: int, iterations_number: int, robust_type: int = mrob.HUBER
+        self,
+        poses_number: int,
+        iterations_number: int,
+        robust_type: int = mrob.HUBER,
+        solve_attempts: int = 10,
+        time_budget: Optional[float] = None,
+        initial_poses: Optional[ArrayNx4x4[float]] = None,
+        max_points: Optional[int] = None,
+        subsampling: str = "uniform",
+        seed: Optional[int] = None,
+        feature_filters: Optional[List[FeatureFilter]] = None,
     ) -> None:
+        if solve_attempts < 1:
+            raise ValueError("Number of solve attempts must be positive")
+        if time_budget is not None and time_budget <= 0:
+            raise ValueError("Time budget must be positive")
+        if max_points is not None and max_points < 3:
+            raise ValueError(
+                "Maximum number of points must be more or equal than three"
+            )
+
+        subsampling_methods = {
+            "uniform": uniform_subsample,
+            "stratified": stratified_subsample,
+        }
+        if subsampling not in subsampling_methods:
+            raise ValueError(f"Unknown subsampling method {subsampling}")
+
+        if max_points is not None and not self.honours_point_weights():
+            warnings.warn(
+                "Installed mrob ignores weights of points, so voxels capped by max_points "
+                "lose weight relative to sparse ones and optimised poses change",
+                RuntimeWarning,
+            )
+
+        self._robust_type: int = robust_type
         self._graph: mrob.FGraph = mrob.FGraph(robust_type)
         self._poses_number: int = poses_number
         self._iterations_number: int = iterations_number
+        self._solve_attempts: int = solve_attempts
+        self._time_budget: Optional[float] = time_budget
         self._planes: Dict[int, int] = {}
+        self._max_points: Optional[int] = max_points
+        self._subsample = subsampling_methods[subsampling]
+        self._random_generator: np.random.Generator = np.random.default_rng(seed)
+        self._feature_filters: List[FeatureFilter] = feature_filters or []
+        self.initial_poses = initial_poses
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def honours_point_weights() -> bool:
+        """
+        Checks once whether installed mrob applies weight `W` of points added to plane factors.
+        Two graphs which differ only by weight of points of the same plane are compared
+        (mrob 0.0.12 ignores weights, so their errors are equal)
+
+        Returns
+        -------
+        honours_point_weights: bool
+            True if error of plane factor depends on weight of its points
+        """
+        points = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [1, 1, 0]], dtype=float)
+        errors = []
+        for weight in [1.0, 2.0]:
+            graph = mrob.FGraph(mrob.QUADRATIC)
+            anchor_id = graph.add_node_pose_3d(
+                mrob.geometry.SE3(np.eye(4)), mrob.NODE_ANCHOR
+            )
+            pose_id = graph.add_node_pose_3d(
+                mrob.geometry.SE3(np.eye(4)), mrob.NODE_STANDARD
+            )
+            plane_id = graph.add_eigen_factor_plane_center()
+            graph.eigen_factor_plane_add_points_array(
+                planeEigenId=plane_id, nodePoseId=anchor_id, pointsArray=points, W=1.0
+            )
+            graph.eigen_factor_plane_add_points_array(
+                planeEigenId=plane_id,
+                nodePoseId=pose_id,
+                pointsArray=points + [0, 0, 1],
+                W=weight,
+            )
+            errors.append(graph.chi2(True))
+
+        return not np.isclose(errors[0], errors[1])
+
+    @property
+    def initial_poses(self) -> Optional[ArrayNx4x4[float]]:
+        """
+        Represents initial estimates of poses which the next optimisation starts from
+
+        Returns
+        -------
+        initial_poses: Optional[ArrayNx4x4[float]]
+            Initial poses or None if optimisation starts from identity poses
+        """
+        return self._initial_poses
+
+    @initial_poses.setter
+    def initial_poses(self, initial_poses: Optional[ArrayNx4x4[float]]) -> None:
+        if initial_poses is not None and len(initial_poses) != self._poses_number:
+            raise ValueError("Number of initial poses must be equal to poses number")
+
+        self._initial_poses: Optional[ArrayNx4x4[float]] = initial_poses
+
+    @property
+    def feature_filters(self) -> List[FeatureFilter]:
+        """
+        Represents filters which are applied to voxels of grid before graph is built.
+        List may be extended between `process` calls, for example, by filter of rejected features
+
+        Returns
+        -------
+        feature_filters: List[FeatureFilter]
+            Feature filters in the order of application
+        """
+        return self._feature_filters
 
     def _init_poses(self):
         """
-        Initializes pose nodes in mrob graph
+        Initializes pose nodes in mrob graph by initial poses
         """
-        self._graph.add_node_pose_3d(mrob.geometry.SE3(), mrob.NODE_ANCHOR)
-        for _ in range(self._poses_number - 1):
-            self._graph.add_node_pose_3d(mrob.geometry.SE3(), mrob.NODE_STANDARD)
+        initial_poses = self._initial_poses
+        if initial_poses is None:
+            initial_poses = [np.eye(4)] * self._poses_number
+
+        for pose_number, initial_pose in enumerate(initial_poses):
+            self._graph.add_node_pose_3d(
+                mrob.geometry.SE3(np.asarray(initial_pose, dtype=float)),
+                mrob.NODE_ANCHOR if pose_number == 0 else mrob.NODE_STANDARD,
+            )
+
+    def _limit_points(self, points: ArrayNx3[float]) -> ArrayNx3[float]:
+        """
+        Subsamples points of voxel and pose to the maximum number of points
+
+        Parameters
+        ----------
+        points: ArrayNx3[float]
+            Points of voxel and pose
+
+        Returns
+        -------
+        points: ArrayNx3[float]
+            Points which are added to graph
+        """
+        if self._max_points is None:
+            return points
+
+        return self._subsample(points, self._max_points, self._random_generator)
 
     @abstractmethod
-    def _init_point_clouds(self, grid: GridBase) -> None:
+    def _init_point_clouds(self, voxel_index: VoxelIndex) -> None:
         """
         Represents abstract method for initiating plane features
 
         Parameters
         ----------
-        grid: GridBase
-            Represents grid with all inserted point clouds
+        voxel_index: VoxelIndex
+            Represents index of voxels of grid with all inserted point clouds
         """
         pass
 
@@ -56,6 +225,9 @@ class MROBBackend(Backend):
         """
         Represents implementation of Backend abstract class, which
         takes remaining points from poses (Octree, essentially) and optimises using them.
+        Solver is run until it converges, but at most `solve_attempts` times and while time budget isn't spent.
+        If it hasn't converged, the state with the least error among the initial one and ones reached
+        after every run is returned together with features rejected in this state.
 
         Parameters
         ----------
@@ -67,37 +239,66 @@ class MROBBackend(Backend):
         output: BackendOutput
             Result of backend optimisations
         """
+        self._graph = mrob.FGraph(self._robust_type)
+        self._planes = {}
         self._init_poses()
-        self._init_point_clouds(grid)
-        metrics = [Metric(name="FGraph initial error", value=self._graph.chi2(True))]
-        converge_iterations = self._graph.solve(mrob.LM_ELLIPS, self._iterations_number)
-        while converge_iterations == 0:
-            print("Optimization didn't converge")
+        voxel_index = VoxelIndex(grid, self._poses_number)
+        for feature_filter in self._feature_filters:
+            voxel_index = feature_filter(voxel_index)
+        self._init_point_clouds(voxel_index)
+        best_chi2 = self._graph.chi2(True)
+        best_state = self._graph.get_estimated_state()
+        best_unused_features = self.__get_unused_features()
+        metrics = [Metric(name="FGraph initial error", value=best_chi2)]
+
+        start_time = time.perf_counter()
+        converge_iterations = 0
+        attempts = 0
+        while converge_iterations == 0 and attempts < self._solve_attempts:
+            if (
+                attempts > 0
+                and self._time_budget is not None
+                and time.perf_counter() - start_time >= self._time_budget
+            ):
+                break
+
             converge_iterations = self._graph.solve(
                 mrob.LM_ELLIPS, self._iterations_number
             )
+            attempts += 1
+
+            chi2 = self._graph.chi2(True)
+            if converge_iterations != 0 or chi2 < best_chi2:
+                best_chi2 = chi2
+                best_state = self._graph.get_estimated_state()
+                # Robust mask is recorded with the state, later runs change it
+                best_unused_features = self.__get_unused_features()
 
+        converged = converge_iterations != 0
         metrics.append(Metric(name="Iterations to converge", value=converge_iterations))
-        metrics.append(Metric(name="chi2", value=self._graph.chi2()))
+        metrics.append(Metric(name="chi2", value=best_chi2))
+        metrics.append(Metric(name="Solve attempts", value=attempts))
+        metrics.append(Metric(name="Converged", value=float(converged)))
 
-        return BackendOutput(
-            self._graph.get_estimated_state(), metrics, self.__get_unused_features()
-        )
+        if best_unused_features is None:
+            print("[WARNING] Most likely you are not using robust optimisations")
+            best_unused_features = []
+
+        return BackendOutput(best_state, metrics, best_unused_features, converged)
 
-    def __get_unused_features(self) -> List[int]:
+    def __get_unused_features(self) -> Optional[List[int]]:
         """
-        Returns list of features which were unused on optimisation stage
+        Returns list of features which are unused in the current state of graph
 
         Returns
         -------
-        unused_features: List[int]
-            IDs list of unused features
+        unused_features: Optional[List[int]]
+            IDs list of unused features or None if graph doesn't provide robust mask
         """
         try:
             robust_mask = self._graph.get_eigen_factors_robust_mask()
         except AttributeError:
-            print("[WARNING] Most likely you are not using robust optimisations")
-            return []
+            return None
 
         unused_features = []
 
@@ -0,0 +1,10 @@
+import sova.executor.executor as executor_module
+import sova.executor.process as process_module
+import sova.executor.serial as serial_module
+import sova.executor.thread as thread_module
+from sova.executor.executor import *
+from sova.executor.process import *
+from sova.executor.serial import *
+from sova.executor.thread import *
+
+__all__ = executor_module.__all__ + process_module.__all__ + serial_module.__all__ + thread_module.__all__
@@ -0,0 +1,276 @@
+import numpy as np
+from octreelib.grid import GridBase
+from octreelib.internal import PointCloud
+
+from abc import ABC, abstractmethod
+from typing import Any, Callable, List, Optional
+
+from sova.segmenter.chain import SegmenterChain
+from sova.segmenter.segmenter import Segmenter
+from sova.subdivider.subdivider import Subdivider
+from sova.utils.voxel_statistics import VoxelStatistics
+
+__all__ = ["Executor"]
+
+
+class Executor(ABC):
+    """
+    Represents abstract executor, which applies segmenters, subdividers and filters to leaves of grid.
+    Leaves are independent, so executor gathers their points by one traversal of grid,
+    computes results of all leaves by `map` (for example, in parallel) and writes them back
+    by the second traversal, which visits leaves in the same order.
+    Segmenters receive points of all gathered leaves by `Segmenter.segment_batch` together with `map`,
+    so segmenters which decide by statistics (CAPE) or apply other segmenters (SegmenterChain)
+    process all leaves at once. Subdividers which decide by statistics (`Subdivider.checks_statistics`)
+    are checked by statistics of all nodes computed once in the calling process.
+    Nodes are checked together only by grids which subdivide level by level (`subdivides_by_levels`,
+    for example, VoxelHashGrid). octreelib Grid subdivides voxels recursively, so there criteria
+    are checked serially in the calling process by any executor.
+    """
+
+    def __enter__(self) -> "Executor":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Releases workers of executor
+        """
+        pass
+
+    @abstractmethod
+    def map(
+        self, function: Callable[[PointCloud], Any], points: List[PointCloud]
+    ) -> List[Any]:
+        """
+        Applies function to every point cloud
+
+        Parameters
+        ----------
+        function: Callable[[PointCloud], Any]
+            Function to apply (segmenter, subdivider or filter)
+        points: List[PointCloud]
+            Point clouds (points of leaves) to apply function to
+
+        Returns
+        -------
+        results: List[Any]
+            Results of function in the order of given point clouds
+        """
+        pass
+
+    def map_leaf_points(
+        self,
+        grid: GridBase,
+        function: Callable[[PointCloud], PointCloud],
+        pose_numbers: Optional[List[int]] = None,
+    ) -> None:
+        """
+        Transforms points of every leaf of grid using the function (for example, segmenter)
+
+        Parameters
+        ----------
+        grid: GridBase
+            Grid which leaves are transformed
+        function: Callable[[PointCloud], PointCloud]
+            Transformation function which is applied to each leaf
+        pose_numbers: Optional[List[int]]
+            Pose numbers to transform. All poses are transformed by default
+        """
+        leaves_points = self.__gather(grid, pose_numbers)
+        if isinstance(function, Segmenter):
+            results = iter(function.segment_batch(leaves_points, self.map))
+        else:
+            results = iter(self.map(function, leaves_points))
+        self.__traverse(grid, lambda _: next(results), pose_numbers)
+
+    def map_chain_leaf_points(
+        self,
+        grid: GridBase,
+        chain: SegmenterChain,
+        pose_numbers: Optional[List[int]] = None,
+    ) -> List[float]:
+        """
+        Segments points of every leaf of grid by segmenters of chain in one traversal of grid.
+        Every segmenter is applied only to leaves which all previous segmenters have left points in
+
+        Parameters
+        ----------
+        grid: GridBase
+            Grid which leaves are segmented
+        chain: SegmenterChain
+            Chain of segmenters
+        pose_numbers: Optional[List[int]]
+            Pose numbers to segment. All poses are segmented by default
+
+        Returns
+        -------
+        durations: List[float]
+            Duration of every segmenter of chain in seconds
+        """
+        leaves_points, durations = chain.segment_batch_durations(
+            self.__gather(grid, pose_numbers), self.map
+        )
+        results = iter(leaves_points)
+        self.__traverse(grid, lambda _: next(results), pose_numbers)
+
+        return durations
+
+    def filter(
+        self,
+        grid: GridBase,
+        filtering_criteria: List[Callable[[PointCloud], bool]],
+        pose_numbers: Optional[List[int]] = None,
+    ) -> None:
+        """
+        Removes points of leaves which don't satisfy all filtering criteria
+
+        Parameters
+        ----------
+        grid: GridBase
+            Grid to filter
+        filtering_criteria: List[Callable[[PointCloud], bool]]
+            If any of the criteria returns False, points of the leaf are removed
+        pose_numbers: Optional[List[int]]
+            Pose numbers to filter. All poses are filtered by default
+        """
+        self.map_leaf_points(grid, _AllCriteria(filtering_criteria), pose_numbers)
+
+    def subdivide(
+        self,
+        grid: GridBase,
+        subdivision_criteria: List[Callable[[PointCloud], bool]],
+        pose_numbers: Optional[List[int]] = None,
+    ) -> None:
+        """
+        Subdivides voxels of grid. Grids which subdivide level by level (for example, VoxelHashGrid)
+        check criteria of all nodes of one level together: subdividers by statistics of nodes,
+        other criteria by `map`. Other grids (octreelib Grid) subdivide their voxels recursively,
+        so their criteria are checked serially in the calling process
+
+        Parameters
+        ----------
+        grid: GridBase
+            Grid to subdivide
+        subdivision_criteria: List[Callable[[PointCloud], bool]]
+            If any of the criteria returns True, the node is subdivided
+        pose_numbers: Optional[List[int]]
+            Pose numbers which points are used for subdivision. All poses are used by default
+        """
+        if getattr(grid, "subdivides_by_levels", False):
+            grid.subdivide(
+                subdivision_criteria,
+                pose_numbers,
+                lambda nodes_points: self.__check_nodes(
+                    subdivision_criteria, nodes_points
+                ),
+            )
+        elif pose_numbers is None:
+            grid.subdivide(subdivision_criteria)
+        else:
+            grid.subdivide(subdivision_criteria, pose_numbers)
+
+    def __check_nodes(
+        self,
+        subdivision_criteria: List[Callable[[PointCloud], bool]],
+        nodes_points: List[PointCloud],
+    ) -> List[bool]:
+        """
+        Checks whether any of the criteria is satisfied by points of every node.
+        Subdividers which decide by statistics are checked by statistics of nodes computed at once,
+        other criteria are checked by their points using `map`
+        """
+        statistics_criteria = [
+            criterion
+            for criterion in subdivision_criteria
+            if isinstance(criterion, Subdivider) and criterion.checks_statistics
+        ]
+        points_criteria = [
+            criterion
+            for criterion in subdivision_criteria
+            if criterion not in statistics_criteria
+        ]
+
+        should_be_split = [False] * len(nodes_points)
+        if len(statistics_criteria) > 0:
+            # Statistics of all nodes are computed at once and shared by all subdividers
+            should_be_split = [
+                any(
+                    criterion.check_statistics(statistics)
+                    for criterion in statistics_criteria
+                )
+                for statistics in VoxelStatistics.batch(nodes_points)
+            ]
+        if len(points_criteria) > 0:
+            nodes = [
+                node for node, is_split in enumerate(should_be_split) if not is_split
+            ]
+            results = self.map(
+                _AnyCriterion(points_criteria), [nodes_points[node] for node in nodes]
+            )
+            for node, is_split in zip(nodes, results):
+                should_be_split[node] = is_split
+
+        return should_be_split
+
+    def __gather(
+        self, grid: GridBase, pose_numbers: Optional[List[int]]
+    ) -> List[PointCloud]:
+        """
+        Collects points of every leaf of grid in the order of traversal
+        """
+        leaves_points = []
+
+        def gather(points: PointCloud) -> PointCloud:
+            leaves_points.append(points)
+            return points
+
+        self.__traverse(grid, gather, pose_numbers)
+
+        return leaves_points
+
+    @staticmethod
+    def __traverse(
+        grid: GridBase,
+        function: Callable[[PointCloud], PointCloud],
+        pose_numbers: Optional[List[int]],
+    ) -> None:
+        """
+        Maps leaves of grid. Pose numbers are passed only if they are given,
+        because octreelib Grid always maps all poses
+        """
+        if pose_numbers is None:
+            grid.map_leaf_points(function)
+        else:
+            grid.map_leaf_points(function, pose_numbers)
+
+
+class _AnyCriterion:
+    """
+    Represents check whether any of the criteria is satisfied.
+    Unlike lambda, it can be sent to process workers
+    """
+
+    def __init__(self, criteria: List[Callable[[PointCloud], bool]]) -> None:
+        self.criteria: List[Callable[[PointCloud], bool]] = criteria
+
+    def __call__(self, points: PointCloud) -> bool:
+        return any(criterion(points) for criterion in self.criteria)
+
+
+class _AllCriteria:
+    """
+    Represents filter which leaves points only if all criteria are satisfied.
+    Unlike lambda, it can be sent to process workers
+    """
+
+    def __init__(self, criteria: List[Callable[[PointCloud], bool]]) -> None:
+        self.criteria: List[Callable[[PointCloud], bool]] = criteria
+
+    def __call__(self, points: PointCloud) -> PointCloud:
+        if all(criterion(points) for criterion in self.criteria):
+            return points
+
+        return np.empty((0, 3), dtype=float)
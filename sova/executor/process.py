@@ -0,0 +1,195 @@
+import numpy as np
+from octreelib.internal import PointCloud
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, List, Optional, Tuple
+
+from sova.executor.executor import Executor
+
+__all__ = ["ProcessExecutor"]
+
+
+class ProcessExecutor(Executor):
+    """
+    Represents executor which applies functions in the pool of processes.
+    Points of all leaves are copied once into shared memory block and workers read them from there,
+    so large voxels aren't pickled. Point clouds returned by function (segmented points are usually
+    a part of the leaf) are written by workers into the second shared block, other results are pickled.
+    Functions are pickled for every task, so they must be picklable and their state
+    (for example, random generator of segmenter) isn't changed in the main process.
+
+    Parameters
+    ----------
+    workers_number: Optional[int]
+        Number of processes. Number of processors is used if it is not specified
+    tasks_per_worker: int
+        Number of tasks which points are split into for every worker. Leaves of one task are processed
+        by one worker, so more tasks balance load better at the cost of more scheduling
+    """
+
+    def __init__(
+        self, workers_number: Optional[int] = None, tasks_per_worker: int = 4
+    ) -> None:
+        if workers_number is not None and workers_number < 1:
+            raise ValueError("Number of workers must be positive")
+        if tasks_per_worker < 1:
+            raise ValueError("Number of tasks per worker must be positive")
+
+        if workers_number is None:
+            workers_number = os.cpu_count() or 1
+
+        self.__workers_number: int = workers_number
+        self.__pool: ProcessPoolExecutor = ProcessPoolExecutor(workers_number)
+        self.__tasks_number: int = workers_number * tasks_per_worker
+
+    @property
+    def workers_number(self) -> int:
+        """
+        Represents number of workers of the pool
+        """
+        return self.__workers_number
+
+    def close(self) -> None:
+        """
+        Shuts down the pool of processes
+        """
+        self.__pool.shutdown()
+
+    def map(
+        self, function: Callable[[PointCloud], Any], points: List[PointCloud]
+    ) -> List[Any]:
+        if len(points) == 0:
+            return []
+
+        counts = np.array([len(leaf_points) for leaf_points in points], dtype=int)
+        offsets = np.concatenate([[0], np.cumsum(counts)])
+        points_number = int(offsets[-1])
+        # Shared memory block can't be empty
+        size = max(points_number * 3 * np.dtype(float).itemsize, 1)
+
+        input_memory = SharedMemory(create=True, size=size)
+        output_memory = SharedMemory(create=True, size=size)
+        try:
+            input_points = np.ndarray(
+                (points_number, 3), dtype=float, buffer=input_memory.buf
+            )
+            for leaf_points, start, end in zip(points, offsets[:-1], offsets[1:]):
+                input_points[start:end] = leaf_points
+            del input_points
+
+            tasks = np.array_split(
+                np.arange(len(points)), min(self.__tasks_number, len(points))
+            )
+            futures = [
+                self.__pool.submit(
+                    _map_shared_points,
+                    function,
+                    input_memory.name,
+                    output_memory.name,
+                    points_number,
+                    [(offsets[leaf], offsets[leaf + 1]) for leaf in task],
+                )
+                for task in tasks
+            ]
+
+            output_points = np.ndarray(
+                (points_number, 3), dtype=float, buffer=output_memory.buf
+            )
+            results = []
+            for task, future in zip(tasks, futures):
+                for leaf, result in zip(task, future.result()):
+                    if isinstance(result, _SharedPoints):
+                        start = offsets[leaf]
+                        end = start + result.length
+                        result = output_points[start:end].copy()
+                    results.append(result)
+            del output_points
+        finally:
+            _close(input_memory)
+            _close(output_memory)
+            input_memory.unlink()
+            output_memory.unlink()
+
+        return results
+
+
+class _SharedPoints:
+    """
+    Represents result of function, which is written into output shared memory block in place of leaf points
+    """
+
+    def __init__(self, length: int) -> None:
+        self.length: int = length
+
+
+def _map_shared_points(
+    function: Callable[[PointCloud], Any],
+    input_name: str,
+    output_name: str,
+    points_number: int,
+    ranges: List[Tuple[int, int]],
+) -> List[Any]:
+    """
+    Applies function to points of leaves, which are read from shared memory block
+
+    Parameters
+    ----------
+    function: Callable[[PointCloud], Any]
+        Function to apply
+    input_name: str
+        Name of shared memory block with points of all leaves
+    output_name: str
+        Name of shared memory block for resulting points
+    points_number: int
+        Number of points of all leaves
+    ranges: List[Tuple[int, int]]
+        Start and end of points of every leaf of the task
+
+    Returns
+    -------
+    results: List[Any]
+        Results of function. Point clouds which fit into the leaf are replaced by their length
+    """
+    input_memory = SharedMemory(name=input_name)
+    output_memory = SharedMemory(name=output_name)
+    try:
+        input_points = np.ndarray(
+            (points_number, 3), dtype=float, buffer=input_memory.buf
+        )
+        output_points = np.ndarray(
+            (points_number, 3), dtype=float, buffer=output_memory.buf
+        )
+
+        results = []
+        for start, end in ranges:
+            # Functions may change given points like they do in grid, so shared points are copied
+            result = function(input_points[start:end].copy())
+            if (
+                isinstance(result, np.ndarray)
+                and result.ndim == 2
+                and result.shape[1] == 3
+                and len(result) <= end - start
+            ):
+                result_end = start + len(result)
+                output_points[start:result_end] = result
+                result = _SharedPoints(len(result))
+            results.append(result)
+        del input_points, output_points
+    finally:
+        _close(input_memory)
+        _close(output_memory)
+
+    return results
+
+
+def _close(memory: SharedMemory) -> None:
+    """
+    Closes shared memory block. If function has failed, arrays of the block may be still referenced
+    by traceback, then block is unmapped when they are collected, so the original error is not hidden
+    """
+    try:
+        memory.close()
+    except BufferError:
+        pass
@@ -0,0 +1,46 @@
+from octreelib.grid import GridBase
+from octreelib.internal import PointCloud
+
+from typing import Any, Callable, List, Optional
+
+from sova.executor.executor import Executor
+from sova.segmenter.segmenter import Segmenter
+
+__all__ = ["SerialExecutor"]
+
+
+class SerialExecutor(Executor):
+    """
+    Represents executor which applies functions in the calling thread.
+    Leaves are mapped by grid directly, so there is no extra traversal of grid
+    (except segmenters which process all leaves together, see `Segmenter.segments_batch`)
+    """
+
+    def map(
+        self, function: Callable[[PointCloud], Any], points: List[PointCloud]
+    ) -> List[Any]:
+        return [function(leaf_points) for leaf_points in points]
+
+    def map_leaf_points(
+        self,
+        grid: GridBase,
+        function: Callable[[PointCloud], PointCloud],
+        pose_numbers: Optional[List[int]] = None,
+    ) -> None:
+        if isinstance(function, Segmenter) and function.segments_batch:
+            super().map_leaf_points(grid, function, pose_numbers)
+        elif pose_numbers is None:
+            grid.map_leaf_points(function)
+        else:
+            grid.map_leaf_points(function, pose_numbers)
+
+    def filter(
+        self,
+        grid: GridBase,
+        filtering_criteria: List[Callable[[PointCloud], bool]],
+        pose_numbers: Optional[List[int]] = None,
+    ) -> None:
+        if pose_numbers is None:
+            grid.filter(filtering_criteria)
+        else:
+            grid.filter(filtering_criteria, pose_numbers)
@@ -0,0 +1,51 @@
+from octreelib.internal import PointCloud
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional
+
+from sova.executor.executor import Executor
+
+__all__ = ["ThreadExecutor"]
+
+
+class ThreadExecutor(Executor):
+    """
+    Represents executor which applies functions in the pool of threads.
+    NumPy and Open3D release GIL in heavy computations, so threads speed up segmenters
+    without copying points of leaves. Functions must be thread-safe.
+
+    Parameters
+    ----------
+    workers_number: Optional[int]
+        Number of threads. Default number of ThreadPoolExecutor is used if it is not specified
+    """
+
+    def __init__(self, workers_number: Optional[int] = None) -> None:
+        if workers_number is not None and workers_number < 1:
+            raise ValueError("Number of workers must be positive")
+
+        if workers_number is None:
+            # Default number of ThreadPoolExecutor
+            workers_number = min(32, (os.cpu_count() or 1) + 4)
+
+        self.__workers_number: int = workers_number
+        self.__pool: ThreadPoolExecutor = ThreadPoolExecutor(workers_number)
+
+    @property
+    def workers_number(self) -> int:
+        """
+        Represents number of workers of the pool
+        """
+        return self.__workers_number
+
+    def close(self) -> None:
+        """
+        Shuts down the pool of threads
+        """
+        self.__pool.shutdown()
+
+    def map(
+        self, function: Callable[[PointCloud], Any], points: List[PointCloud]
+    ) -> List[Any]:
+        return list(self.__pool.map(function, points))
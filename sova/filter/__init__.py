@@ -1,6 +1,19 @@
 import sova.filter.empty_voxel as empty_voxel_module
+import sova.filter.feature_filter as feature_filter_module
 import sova.filter.filter as filter_module
+import sova.filter.planarity as planarity_module
+import sova.filter.poses_number as poses_number_module
+import sova.filter.rejected_features as rejected_features_module
 from sova.filter.empty_voxel import *
+from sova.filter.feature_filter import *
 from sova.filter.filter import *
+from sova.filter.planarity import *
+from sova.filter.poses_number import *
+from sova.filter.rejected_features import *
 
-__all__ = empty_voxel_module.__all__ + filter_module.__all__
+__all__ = (empty_voxel_module.__all__ +
+           feature_filter_module.__all__ +
+           filter_module.__all__ +
+           planarity_module.__all__ +
+           poses_number_module.__all__ +
+           rejected_features_module.__all__)
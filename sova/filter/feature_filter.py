@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+
+from sova.grid.voxel_index import VoxelIndex
+
+__all__ = ["FeatureFilter"]
+
+
+class FeatureFilter(ABC):
+    """
+    Represents abstract filter of features (voxels with points of several poses), which backend applies
+    to the index of grid voxels before building factor graph. Unlike Filter, which sees points of
+    one leaf of one pose, feature filter sees all poses of every voxel, so it can prune features
+    by the poses which observe them or rank features of the whole grid
+    """
+
+    @abstractmethod
+    def __call__(self, voxel_index: VoxelIndex) -> VoxelIndex:
+        """
+        Represents filter function signature to call it from backend
+
+        Parameters
+        ----------
+        voxel_index: VoxelIndex
+            Index of voxels of grid
+
+        Returns
+        -------
+        voxel_index: VoxelIndex
+            Index of voxels which are left as features
+        """
+        pass
@@ -0,0 +1,58 @@
+import numpy as np
+
+from sova.filter.feature_filter import FeatureFilter
+from sova.grid.voxel_index import VoxelIndex
+from sova.utils.planarity import voxel_moments
+
+__all__ = ["PlanarityFilter"]
+
+
+class PlanarityFilter(FeatureFilter):
+    """
+    Represents filter which caps total number of features by their planarity score:
+    the least eigenvalue of covariance of points of all poses divided by the sum of eigenvalues.
+    Score is zero for perfect plane and one third for isotropic cloud, so the most planar features
+    are left. Ties are broken by voxel ID, so the result is deterministic.
+    Only voxels seen by several poses are ranked and left: backends skip voxels of single pose,
+    which are perfectly planar and would otherwise win the cap.
+    Scatters of all voxels are computed and decomposed at once
+
+    Parameters
+    ----------
+    max_features_number: int
+        Maximum number of features to leave
+    """
+
+    def __init__(self, max_features_number: int) -> None:
+        if max_features_number < 1:
+            raise ValueError("Maximum number of features must be positive")
+
+        self.__max_features_number: int = max_features_number
+
+    def __call__(self, voxel_index: VoxelIndex) -> VoxelIndex:
+        """
+        Represents implementation of abstract call method
+
+        Parameters
+        ----------
+        voxel_index: VoxelIndex
+            Index of voxels of grid
+
+        Returns
+        -------
+        voxel_index: VoxelIndex
+            Index of at most maximum number of the most planar voxels seen by several poses
+        """
+        voxel_ids = [voxel_id for voxel_id, _ in voxel_index.items(min_poses_number=2)]
+        _, _, scatters = voxel_moments(
+            [voxel_index.get_voxel_points(voxel_id) for voxel_id in voxel_ids]
+        )
+        eigenvalues = np.maximum(np.linalg.eigvalsh(scatters), 0)
+        totals = np.sum(eigenvalues, axis=1)
+        # Degenerate voxels (single point) can't be rated and are left last
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = np.where(totals > 0, eigenvalues[:, 0] / totals, np.inf)
+
+        best_features = np.lexsort((voxel_ids, scores))[: self.__max_features_number]
+
+        return voxel_index.select([voxel_ids[feature] for feature in best_features])
@@ -0,0 +1,40 @@
+from sova.filter.feature_filter import FeatureFilter
+from sova.grid.voxel_index import VoxelIndex
+
+__all__ = ["PosesNumberFilter"]
+
+
+class PosesNumberFilter(FeatureFilter):
+    """
+    Represents filter which removes features observed by too few poses.
+    Plane seen by a single pose doesn't constrain poses but still costs backend a plane node
+
+    Parameters
+    ----------
+    min_poses_number: int
+        Minimum number of poses which must have points in voxel
+    """
+
+    def __init__(self, min_poses_number: int = 2) -> None:
+        if min_poses_number < 1:
+            raise ValueError("Minimum number of poses must be positive")
+
+        self.__min_poses_number: int = min_poses_number
+
+    def __call__(self, voxel_index: VoxelIndex) -> VoxelIndex:
+        """
+        Represents implementation of abstract call method
+
+        Parameters
+        ----------
+        voxel_index: VoxelIndex
+            Index of voxels of grid
+
+        Returns
+        -------
+        voxel_index: VoxelIndex
+            Index of voxels observed by at least minimum number of poses
+        """
+        return voxel_index.select(
+            [voxel_id for voxel_id, _ in voxel_index.items(self.__min_poses_number)]
+        )
@@ -0,0 +1,61 @@
+from typing import Iterable, Set
+
+from sova.filter.feature_filter import FeatureFilter
+from sova.grid.voxel_index import VoxelIndex
+
+__all__ = ["RejectedFeaturesFilter"]
+
+
+class RejectedFeaturesFilter(FeatureFilter):
+    """
+    Represents filter which removes features rejected by robust kernel of previous optimisations.
+    Voxel IDs are determined by voxel geometry, so a voxel of the grid rebuilt on the next iteration
+    of patch has the same ID and its outliers are excluded from the new factor graph.
+    Rejected features are accumulated by `add` between iterations
+    """
+
+    def __init__(self) -> None:
+        self.__voxel_ids: Set[int] = set()
+
+    @property
+    def voxel_ids(self) -> Set[int]:
+        """
+        Returns IDs of rejected voxels
+        """
+        return set(self.__voxel_ids)
+
+    def add(self, voxel_ids: Iterable[int]) -> None:
+        """
+        Marks voxels as rejected
+
+        Parameters
+        ----------
+        voxel_ids: Iterable[int]
+            IDs of voxels rejected by robust kernel (unused features of backend output)
+        """
+        self.__voxel_ids.update(voxel_ids)
+
+    def __call__(self, voxel_index: VoxelIndex) -> VoxelIndex:
+        """
+        Represents implementation of abstract call method
+
+        Parameters
+        ----------
+        voxel_index: VoxelIndex
+            Index of voxels of grid
+
+        Returns
+        -------
+        voxel_index: VoxelIndex
+            Index of voxels which haven't been rejected
+        """
+        if len(self.__voxel_ids) == 0:
+            return voxel_index
+
+        return voxel_index.select(
+            [
+                voxel_id
+                for voxel_id in voxel_index.voxel_ids
+                if voxel_id not in self.__voxel_ids
+            ]
+        )
@@ -0,0 +1,13 @@
+import sova.grid.sliding_window as sliding_window_module
+import sova.grid.visualization as visualization_module
+import sova.grid.voxel_hash as voxel_hash_module
+import sova.grid.voxel_index as voxel_index_module
+from sova.grid.sliding_window import *
+from sova.grid.visualization import *
+from sova.grid.voxel_hash import *
+from sova.grid.voxel_index import *
+
+__all__ = (sliding_window_module.__all__ +
+           visualization_module.__all__ +
+           voxel_hash_module.__all__ +
+           voxel_index_module.__all__)
@@ -0,0 +1,310 @@
+import numpy as np
+from octreelib.grid import GridBase, GridConfig, VisualizationConfig
+from octreelib.internal import PointCloud, Voxel, VoxelBase
+from octreelib.octree_manager import OctreeManager
+
+from typing import Callable, Dict, List, Optional, Set
+
+from sova.grid.visualization import visualize_leaves
+
+__all__ = ["SlidingWindowGrid"]
+
+
+class _WindowOctreeManager(OctreeManager):
+    """
+    Represents octree manager which allows to remove poses from it
+    """
+
+    @property
+    def pose_numbers(self) -> List[int]:
+        """
+        Returns
+        -------
+        pose_numbers: List[int]
+            Pose numbers which have points in this voxel
+        """
+        return list(self._octrees.keys())
+
+    def remove_pose(self, pose_number: int) -> None:
+        """
+        Removes octree of given pose and decreases greater pose numbers by one
+
+        Parameters
+        ----------
+        pose_number: int
+            Pose number to remove
+        """
+        self._octrees = {
+            number - int(number > pose_number): octree
+            for number, octree in self._octrees.items()
+            if number != pose_number
+        }
+
+
+class SlidingWindowGrid(GridBase):
+    """
+    Represents grid for sliding window of poses. Unlike octreelib Grid, it allows to remove poses and
+    to process leaves of chosen poses only. Every voxel keeps the subdivision scheme it has received first,
+    so leaves of poses which are already in the window never change and never have to be processed again.
+    Poses are always numbered from 0 to N-1: when pose is removed, greater pose numbers are decreased by one.
+
+    Parameters
+    ----------
+    grid_config: GridConfig
+        Represents octreelib Grid configuration
+    """
+
+    def __init__(self, grid_config: GridConfig) -> None:
+        super().__init__(grid_config)
+        self.__pose_voxels: Dict[int, List[VoxelBase]] = {}
+        self.__octrees: Dict[VoxelBase, _WindowOctreeManager] = {}
+        self.__subdivided_voxels: Set[VoxelBase] = set()
+
+    @property
+    def poses_number(self) -> int:
+        """
+        Returns
+        -------
+        poses_number: int
+            Number of poses in the window
+        """
+        return len(self.__pose_voxels)
+
+    def insert_points(self, pose_number: int, points: PointCloud) -> None:
+        """
+        Distributes points of the new pose into voxels. Voxels which are already subdivided
+        split given points using their subdivision scheme.
+
+        Parameters
+        ----------
+        pose_number: int
+            Pose number to which points are inserted
+        points: PointCloud
+            Points in global coordinates
+        """
+        if pose_number in self.__pose_voxels:
+            raise ValueError(f"Cannot insert points to existing pose {pose_number}")
+
+        self.__pose_voxels[pose_number] = []
+        if len(points) == 0:
+            return
+
+        edge_length = self._grid_config.voxel_edge_length
+        voxel_indices = (
+            (points - self._grid_config.corner) // edge_length * edge_length
+        ).astype(int)
+        unique_voxel_indices, point_inverse_indices = np.unique(
+            voxel_indices, axis=0, return_inverse=True
+        )
+        point_inverse_indices = point_inverse_indices.reshape(-1)
+        grouped_points = np.split(
+            points[point_inverse_indices.argsort(kind="stable")],
+            np.cumsum(np.bincount(point_inverse_indices))[:-1],
+        )
+
+        for voxel_coordinates, voxel_points in zip(
+            unique_voxel_indices, grouped_points
+        ):
+            voxel = VoxelBase(np.array(voxel_coordinates), edge_length)
+            if voxel not in self.__octrees:
+                self.__octrees[voxel] = _WindowOctreeManager(
+                    self._grid_config.octree_type,
+                    self._grid_config.octree_config,
+                    np.array(voxel_coordinates),
+                    edge_length,
+                )
+
+            self.__pose_voxels[pose_number].append(voxel)
+            self.__octrees[voxel].insert_points(pose_number, voxel_points)
+
+    def remove_pose(self, pose_number: int) -> None:
+        """
+        Removes all points of given pose. Greater pose numbers are decreased by one,
+        voxels without points are removed together with their subdivision scheme.
+
+        Parameters
+        ----------
+        pose_number: int
+            Pose number to remove
+        """
+        for voxel in list(self.__octrees.keys()):
+            self.__octrees[voxel].remove_pose(pose_number)
+            if not self.__octrees[voxel].pose_numbers:
+                del self.__octrees[voxel]
+                self.__subdivided_voxels.discard(voxel)
+
+        self.__pose_voxels = {
+            number - int(number > pose_number): voxels
+            for number, voxels in self.__pose_voxels.items()
+            if number != pose_number
+        }
+
+    def get_points(self, pose_number: int) -> PointCloud:
+        """
+        Parameters
+        ----------
+        pose_number: int
+            The desired pose number
+
+        Returns
+        -------
+        points: PointCloud
+            Points belonging to the pose
+        """
+        return np.vstack(
+            [np.empty((0, 3), dtype=float)]
+            + [
+                self.__octrees[voxel].get_points(pose_number)
+                for voxel in self.__pose_voxels[pose_number]
+            ]
+        )
+
+    def subdivide(
+        self,
+        subdivision_criteria: List[Callable[[PointCloud], bool]],
+        pose_numbers: Optional[List[int]] = None,
+    ) -> None:
+        """
+        Subdivides voxels which have not been subdivided yet using points of given poses.
+        Subdivision scheme of already subdivided voxels is kept unchanged.
+
+        Parameters
+        ----------
+        subdivision_criteria: List[Callable[[PointCloud], bool]]
+            If any of the criteria returns True, the octree node is subdivided
+        pose_numbers: Optional[List[int]]
+            Pose numbers which points are used for subdivision. All poses are used by default
+        """
+        if pose_numbers is None:
+            pose_numbers = list(self.__pose_voxels.keys())
+
+        for pose_number in pose_numbers:
+            for voxel in self.__pose_voxels[pose_number]:
+                if voxel in self.__subdivided_voxels:
+                    continue
+
+                self.__octrees[voxel].subdivide(
+                    subdivision_criteria,
+                    [
+                        number
+                        for number in self.__octrees[voxel].pose_numbers
+                        if number in pose_numbers
+                    ],
+                )
+                self.__subdivided_voxels.add(voxel)
+
+    def filter(
+        self,
+        filtering_criteria: List[Callable[[PointCloud], bool]],
+        pose_numbers: Optional[List[int]] = None,
+    ) -> None:
+        """
+        Filters leaves of given poses
+
+        Parameters
+        ----------
+        filtering_criteria: List[Callable[[PointCloud], bool]]
+            If any of the criteria returns False, points of the leaf are removed
+        pose_numbers: Optional[List[int]]
+            Pose numbers to filter. All poses are filtered by default
+        """
+        for voxel, pose_numbers in self.__voxels_poses(pose_numbers).items():
+            self.__octrees[voxel].filter(filtering_criteria, pose_numbers)
+
+    def map_leaf_points(
+        self,
+        function: Callable[[PointCloud], PointCloud],
+        pose_numbers: Optional[List[int]] = None,
+    ) -> None:
+        """
+        Transforms points of leaves of given poses using the function
+
+        Parameters
+        ----------
+        function: Callable[[PointCloud], PointCloud]
+            Transformation function which is applied to each leaf
+        pose_numbers: Optional[List[int]]
+            Pose numbers to transform. All poses are transformed by default
+        """
+        for voxel, pose_numbers in self.__voxels_poses(pose_numbers).items():
+            self.__octrees[voxel].map_leaf_points(function, pose_numbers)
+
+    def get_leaf_points(self, pose_number: int) -> List[Voxel]:
+        """
+        Parameters
+        ----------
+        pose_number: int
+            The desired pose number
+
+        Returns
+        -------
+        leaves: List[Voxel]
+            Leaf voxels with points of given pose
+        """
+        return sum(
+            [
+                self.__octrees[voxel].get_leaf_points(pose_number)
+                for voxel in self.__pose_voxels[pose_number]
+            ],
+            [],
+        )
+
+    def visualize(self, config: VisualizationConfig) -> None:
+        """
+        Produces `.html` file with Grid
+
+        Parameters
+        ----------
+        config: VisualizationConfig
+            Represents configuration for visualization
+        """
+        visualize_leaves(
+            {
+                pose_number: self.get_leaf_points(pose_number)
+                for pose_number in self.__pose_voxels
+            },
+            config,
+        )
+
+    def n_nodes(self, pose_number: int) -> int:
+        """
+        Returns number of nodes of octrees for given pose number
+        """
+        return sum(
+            self.__octrees[voxel].n_nodes(pose_number)
+            for voxel in self.__pose_voxels[pose_number]
+        )
+
+    def n_points(self, pose_number: int) -> int:
+        """
+        Returns number of points for given pose number
+        """
+        return sum(
+            self.__octrees[voxel].n_points(pose_number)
+            for voxel in self.__pose_voxels[pose_number]
+        )
+
+    def n_leaves(self, pose_number: int) -> int:
+        """
+        Returns number of leaves with points for given pose number
+        """
+        return sum(
+            self.__octrees[voxel].n_leaves(pose_number)
+            for voxel in self.__pose_voxels[pose_number]
+        )
+
+    def __voxels_poses(
+        self, pose_numbers: Optional[List[int]] = None
+    ) -> Dict[VoxelBase, List[int]]:
+        """
+        Groups given pose numbers by voxels which contain their points
+        """
+        if pose_numbers is None:
+            pose_numbers = list(self.__pose_voxels.keys())
+
+        voxels_poses = {}
+        for pose_number in pose_numbers:
+            for voxel in self.__pose_voxels[pose_number]:
+                voxels_poses.setdefault(voxel, []).append(pose_number)
+
+        return voxels_poses
@@ -0,0 +1,64 @@
+import k3d
+from octreelib.grid import GridVisualizationType, VisualizationConfig
+from octreelib.internal import Voxel
+
+import random
+from typing import Dict, List
+
+__all__ = ["visualize_leaves"]
+
+
+def visualize_leaves(
+    leaves: Dict[int, List[Voxel]], config: VisualizationConfig
+) -> None:
+    """
+    Produces `.html` file with leaf voxels of grid the same way as octreelib Grid does
+
+    Parameters
+    ----------
+    leaves: Dict[int, List[Voxel]]
+        Leaf voxels with points for each pose number
+    config: VisualizationConfig
+        Represents configuration for visualization
+    """
+    plot = k3d.Plot()
+    random.seed(config.seed)
+    unused_voxel_color = 0x000000  # Black
+
+    voxels_colors = {}
+    for pose_leaves in leaves.values():
+        pose_color = random.randrange(0, 0xFFFFFF)
+        for leaf in pose_leaves:
+            if config.type is GridVisualizationType.POSE:
+                color = pose_color
+            else:
+                if leaf.id not in voxels_colors.keys():
+                    voxels_colors[leaf.id] = random.randrange(0, 0xFFFFFF)
+                color = voxels_colors[leaf.id]
+
+            if leaf.id in config.unused_voxels:
+                color = unused_voxel_color
+
+            plot += k3d.points(
+                positions=leaf.get_points(),
+                point_size=config.point_size,
+                color=color,
+            )
+            plot += k3d.lines(
+                vertices=leaf.all_corners,
+                # Each line represents separate face of the voxel
+                indices=[
+                    [0, 2, 2, 6, 6, 4, 4, 0],
+                    [0, 1, 1, 5, 5, 4, 4, 0],
+                    [0, 1, 1, 3, 3, 2, 2, 0],
+                    [1, 3, 3, 7, 7, 5, 5, 1],
+                    [2, 3, 3, 7, 7, 6, 6, 2],
+                    [4, 5, 5, 7, 7, 6, 6, 4],
+                ],
+                width=config.line_width_size,
+                color=config.line_color,
+                indices_type="segment",
+            )
+
+    with open(config.filepath, "w") as file:
+        file.write(plot.get_snapshot())
@@ -0,0 +1,375 @@
+import numpy as np
+from octreelib.grid import GridBase, GridConfig, VisualizationConfig
+from octreelib.internal import PointCloud, Voxel
+
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from sova.grid.visualization import visualize_leaves
+
+__all__ = ["VoxelHashGrid"]
+
+# Node of subdivision scheme: level of subdivision and integer coordinates of node on this level
+NodeKey = Tuple[int, int, int, int]
+
+
+class VoxelHashGrid(GridBase):
+    """
+    Represents grid which stores points of every pose in single contiguous array sorted by leaves,
+    so inserting points, subdividing voxels and locating leaves of points are done by vectorized
+    floor and `np.unique` passes instead of per-voxel octrees. Leaves are the same as octreelib Grid produces:
+    voxel is recursively split into 8 children while any of the subdivision criteria is satisfied
+    by points of the node, and all poses are split using the same scheme.
+    Nodes without points are never subdivided.
+    Grid subdivides nodes level by level (`subdivides_by_levels`), so executors check criteria
+    of all nodes of one level together.
+
+    Parameters
+    ----------
+    grid_config: GridConfig
+        Represents octreelib Grid configuration. Only voxel edge length and corner are used
+    """
+
+    # Subdivide accepts `check_nodes`, which checks criteria of all nodes of one level
+    subdivides_by_levels: bool = True
+
+    def __init__(self, grid_config: GridConfig) -> None:
+        super().__init__(grid_config)
+        # Points of pose sorted by leaves, leaves of pose and offsets of their points
+        self.__points: Dict[int, PointCloud] = {}
+        self.__leaves: Dict[int, np.ndarray] = {}
+        self.__offsets: Dict[int, np.ndarray] = {}
+        # Voxels of the grid which have received points of pose
+        self.__voxels: Dict[int, np.ndarray] = {}
+        # Subdivided nodes grouped by voxels of the grid
+        self.__subdivided_nodes: Dict[Tuple[int, int, int], Set[NodeKey]] = {}
+
+    def insert_points(self, pose_number: int, points: PointCloud) -> None:
+        """
+        Distributes points of the pose into leaves using current subdivision scheme
+
+        Parameters
+        ----------
+        pose_number: int
+            Pose number to which points are inserted
+        points: PointCloud
+            Points in global coordinates
+        """
+        if pose_number in self.__points:
+            raise ValueError(f"Cannot insert points to existing pose {pose_number}")
+
+        self.__store(pose_number, np.array(points, dtype=float).reshape(-1, 3))
+        leaves = self.__leaves[pose_number]
+        self.__voxels[pose_number] = np.unique(
+            np.right_shift(leaves[:, 1:], leaves[:, :1]), axis=0
+        )
+
+    def get_points(self, pose_number: int) -> PointCloud:
+        """
+        Parameters
+        ----------
+        pose_number: int
+            The desired pose number
+
+        Returns
+        -------
+        points: PointCloud
+            Points belonging to the pose
+        """
+        return self.__points[pose_number].copy()
+
+    def subdivide(
+        self,
+        subdivision_criteria: List[Callable[[PointCloud], bool]],
+        pose_numbers: Optional[List[int]] = None,
+        check_nodes: Optional[Callable[[List[PointCloud]], List[bool]]] = None,
+    ) -> None:
+        """
+        Builds subdivision scheme of voxels which contain points of given poses
+        and redistributes points of all poses according to it.
+        Nodes are subdivided level by level, so criteria of all nodes of one level are checked together.
+
+        Parameters
+        ----------
+        subdivision_criteria: List[Callable[[PointCloud], bool]]
+            If any of the criteria returns True, the node is subdivided
+        pose_numbers: Optional[List[int]]
+            Pose numbers which points are used for subdivision. All poses are used by default
+        check_nodes: Optional[Callable[[List[PointCloud]], List[bool]]]
+            Function which checks criteria of all nodes of one level (for example, by sova.executor.Executor).
+            Nodes are checked one by one by default
+        """
+        if pose_numbers is None:
+            pose_numbers = list(self.__points.keys())
+        if check_nodes is None:
+
+            def check_nodes(nodes_points: List[PointCloud]) -> List[bool]:
+                return [
+                    any(criterion(node_points) for criterion in subdivision_criteria)
+                    for node_points in nodes_points
+                ]
+
+        points = np.vstack(
+            [np.empty((0, 3), dtype=float)]
+            + [self.__points[pose_number] for pose_number in pose_numbers]
+        )
+        nodes = [
+            ((0, *voxel), voxel_points)
+            for voxel, voxel_points in zip(*self.__group(points, 0))
+        ]
+        for key, _ in nodes:
+            self.__subdivided_nodes[key[1:]] = set()
+
+        while nodes:
+            is_subdivided = check_nodes([node_points for _, node_points in nodes])
+            children = []
+            for (key, node_points), is_node_subdivided in zip(nodes, is_subdivided):
+                if not is_node_subdivided:
+                    continue
+
+                level = key[0]
+                self.__subdivided_nodes[
+                    tuple(coordinate >> level for coordinate in key[1:])
+                ].add(key)
+                children.extend(
+                    ((level + 1, *child), child_points)
+                    for child, child_points in zip(
+                        *self.__group(node_points, level + 1)
+                    )
+                )
+            nodes = children
+
+        for pose_number in self.__points:
+            self.__store(pose_number, self.__points[pose_number])
+
+    def filter(
+        self,
+        filtering_criteria: List[Callable[[PointCloud], bool]],
+        pose_numbers: Optional[List[int]] = None,
+    ) -> None:
+        """
+        Removes points of leaves which don't satisfy all filtering criteria
+
+        Parameters
+        ----------
+        filtering_criteria: List[Callable[[PointCloud], bool]]
+            If any of the criteria returns False, points of the leaf are removed
+        pose_numbers: Optional[List[int]]
+            Pose numbers to filter. All poses are filtered by default
+        """
+        self.map_leaf_points(
+            lambda points: (
+                points
+                if all(criterion(points) for criterion in filtering_criteria)
+                else np.empty((0, 3), dtype=float)
+            ),
+            pose_numbers,
+        )
+
+    def map_leaf_points(
+        self,
+        function: Callable[[PointCloud], PointCloud],
+        pose_numbers: Optional[List[int]] = None,
+    ) -> None:
+        """
+        Transforms points of every leaf using the function. Transformed points stay in the same leaf
+
+        Parameters
+        ----------
+        function: Callable[[PointCloud], PointCloud]
+            Transformation function which is applied to each leaf
+        pose_numbers: Optional[List[int]]
+            Pose numbers to transform. All poses are transformed by default
+        """
+        if pose_numbers is None:
+            pose_numbers = list(self.__points.keys())
+
+        for pose_number in pose_numbers:
+            points = self.__points[pose_number]
+            offsets = self.__offsets[pose_number]
+            leaves_points = [
+                np.asarray(function(points[start:end].copy()), dtype=float).reshape(
+                    -1, 3
+                )
+                for start, end in zip(offsets[:-1], offsets[1:])
+            ]
+            counts = np.array([len(leaf_points) for leaf_points in leaves_points])
+
+            self.__points[pose_number] = np.vstack(
+                [np.empty((0, 3), dtype=float)] + leaves_points
+            )
+            self.__leaves[pose_number] = self.__leaves[pose_number][counts > 0]
+            self.__offsets[pose_number] = np.concatenate(
+                [[0], np.cumsum(counts[counts > 0])]
+            ).astype(int)
+
+    def get_leaf_points(self, pose_number: int) -> List[Voxel]:
+        """
+        Parameters
+        ----------
+        pose_number: int
+            The desired pose number
+
+        Returns
+        -------
+        leaves: List[Voxel]
+            Leaf voxels with points of given pose
+        """
+        points = self.__points[pose_number]
+        offsets = self.__offsets[pose_number]
+        leaves = []
+        for leaf, start, end in zip(
+            self.__leaves[pose_number], offsets[:-1], offsets[1:]
+        ):
+            edge_length = self._grid_config.voxel_edge_length / 2 ** int(leaf[0])
+            leaves.append(
+                Voxel(
+                    self._grid_config.corner + leaf[1:] * edge_length,
+                    edge_length,
+                    points[start:end],
+                )
+            )
+
+        return leaves
+
+    def visualize(self, config: VisualizationConfig) -> None:
+        """
+        Produces `.html` file with Grid
+
+        Parameters
+        ----------
+        config: VisualizationConfig
+            Represents configuration for visualization
+        """
+        visualize_leaves(
+            {
+                pose_number: self.get_leaf_points(pose_number)
+                for pose_number in self.__points
+            },
+            config,
+        )
+
+    def n_nodes(self, pose_number: int) -> int:
+        """
+        Returns number of nodes of subdivision schemes of voxels which have received points of given pose
+        """
+        return sum(
+            1 + 8 * len(self.__subdivided_nodes.get(tuple(voxel), ()))
+            for voxel in self.__voxels[pose_number].tolist()
+        )
+
+    def n_points(self, pose_number: int) -> int:
+        """
+        Returns number of points for given pose number
+        """
+        return len(self.__points[pose_number])
+
+    def n_leaves(self, pose_number: int) -> int:
+        """
+        Returns number of leaves with points for given pose number
+        """
+        return len(self.__leaves[pose_number])
+
+    def __store(self, pose_number: int, points: PointCloud) -> None:
+        """
+        Locates leaves of points and stores points of pose sorted by leaves
+        """
+        order, unique_leaves, _, counts = _unique_rows(self.__locate(points))
+        self.__points[pose_number] = points[order]
+        self.__leaves[pose_number] = unique_leaves
+        self.__offsets[pose_number] = np.concatenate([[0], np.cumsum(counts)]).astype(
+            int
+        )
+
+    def __locate(self, points: PointCloud) -> np.ndarray:
+        """
+        Finds leaf of every point: points descend level by level while their node is subdivided
+
+        Returns
+        -------
+        leaves: np.ndarray
+            Level and integer coordinates of leaf for every point
+        """
+        leaves = np.zeros((len(points), 4), dtype=np.int64)
+        leaves[:, 1:] = self.__coordinates(points, 0)
+
+        active_indices = np.arange(len(points))
+        subdivided_nodes = set().union(*self.__subdivided_nodes.values())
+        level = 0
+        while len(active_indices) and subdivided_nodes:
+            _, nodes, inverse_indices, _ = _unique_rows(leaves[active_indices])
+            is_subdivided = np.array(
+                [tuple(node) in subdivided_nodes for node in nodes.tolist()],
+                dtype=bool,
+            )
+            active_indices = active_indices[is_subdivided[inverse_indices]]
+
+            level += 1
+            leaves[active_indices, 0] = level
+            leaves[active_indices, 1:] = self.__coordinates(
+                points[active_indices], level
+            )
+
+        return leaves
+
+    def __group(
+        self, points: PointCloud, level: int
+    ) -> Tuple[List[Tuple[int, int, int]], List[PointCloud]]:
+        """
+        Groups points by nodes of given level
+
+        Returns
+        -------
+        groups: Tuple[List[Tuple[int, int, int]], List[PointCloud]]
+            Integer coordinates of nodes and their points
+        """
+        if len(points) == 0:
+            return [], []
+
+        order, nodes, _, counts = _unique_rows(self.__coordinates(points, level))
+        grouped_points = np.split(points[order], np.cumsum(counts)[:-1])
+
+        return [tuple(node) for node in nodes.tolist()], grouped_points
+
+    def __coordinates(self, points: PointCloud, level: int) -> np.ndarray:
+        """
+        Computes integer coordinates of nodes of given level which contain points
+        """
+        edge_length = self._grid_config.voxel_edge_length / 2**level
+        return np.floor((points - self._grid_config.corner) / edge_length).astype(
+            np.int64
+        )
+
+
+def _unique_rows(
+    rows: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Finds unique rows of integer array using single lexicographic sort,
+    which is much faster than `np.unique(..., axis=0)`
+
+    Parameters
+    ----------
+    rows: np.ndarray
+        Integer array of shape (N, M)
+
+    Returns
+    -------
+    unique: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+        Stable order which sorts rows, sorted unique rows, index of unique row for every row
+        and number of occurrences of every unique row
+    """
+    order = np.lexsort(rows.T[::-1])
+    sorted_rows = rows[order]
+    is_new_row = np.ones(len(rows), dtype=bool)
+    is_new_row[1:] = np.any(sorted_rows[1:] != sorted_rows[:-1], axis=1)
+
+    inverse_indices = np.empty(len(rows), dtype=int)
+    inverse_indices[order] = np.cumsum(is_new_row) - 1
+    starts = np.flatnonzero(is_new_row)
+
+    return (
+        order,
+        sorted_rows[starts],
+        inverse_indices,
+        np.diff(np.append(starts, len(rows))),
+    )
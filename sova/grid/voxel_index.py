@@ -0,0 +1,196 @@
+import numpy as np
+from octreelib.grid import GridBase
+from octreelib.internal import PointCloud
+
+import copy
+from typing import Dict, Iterator, List, Tuple
+
+__all__ = ["VoxelIndex"]
+
+
+class VoxelIndex:
+    """
+    Represents inverted index of grid leaves: every leaf voxel is mapped to the poses which have points
+    in it and to slices of their points. Grid is traversed once per pose when index is built,
+    after that consumers (for example, backends building factor graph) visit every voxel once
+    with points of all its poses and don't traverse grid again.
+    Points of all leaves are stored in single array sorted by voxels and poses,
+    so subsets of voxels (see `select`) share points of the original index.
+
+    Parameters
+    ----------
+    grid: GridBase
+        Grid with inserted (and usually filtered) points
+    poses_number: int
+        Number of poses of the grid. Poses from 0 to `poses_number - 1` are indexed
+    """
+
+    def __init__(self, grid: GridBase, poses_number: int) -> None:
+        voxel_ids = []
+        pose_numbers = []
+        leaves_points = []
+        for pose_number in range(poses_number):
+            for voxel in grid.get_leaf_points(pose_number):
+                points = voxel.get_points()
+                if len(points) == 0:
+                    continue
+
+                voxel_ids.append(voxel.id)
+                pose_numbers.append(pose_number)
+                leaves_points.append(points)
+
+        voxel_ids = np.array(voxel_ids, dtype=int)
+        pose_numbers = np.array(pose_numbers, dtype=int)
+        order = np.lexsort((pose_numbers, voxel_ids))
+        counts = np.array([len(leaves_points[leaf]) for leaf in order], dtype=int)
+
+        self.__voxel_ids: np.ndarray = voxel_ids[order]
+        self.__pose_numbers: np.ndarray = pose_numbers[order]
+        self.__offsets: np.ndarray = np.concatenate([[0], np.cumsum(counts)]).astype(
+            int
+        )
+        self.__points: PointCloud = np.vstack(
+            [np.empty((0, 3), dtype=float)] + [leaves_points[leaf] for leaf in order]
+        )
+
+        # Range of entries of every voxel in arrays sorted by voxels
+        unique_voxel_ids, starts = np.unique(self.__voxel_ids, return_index=True)
+        ends = np.append(starts[1:], len(self.__voxel_ids))
+        self.__voxels: Dict[int, Tuple[int, int]] = {
+            voxel_id: (start, end)
+            for voxel_id, start, end in zip(
+                unique_voxel_ids.tolist(), starts.tolist(), ends.tolist()
+            )
+        }
+
+    def __len__(self) -> int:
+        """
+        Returns number of indexed voxels
+        """
+        return len(self.__voxels)
+
+    @property
+    def voxel_ids(self) -> List[int]:
+        """
+        Returns IDs of indexed voxels in ascending order
+        """
+        return list(self.__voxels.keys())
+
+    @property
+    def points(self) -> PointCloud:
+        """
+        Returns points of all voxels and poses sorted by voxels and poses.
+        Indices built by `select` share points of the original index
+        """
+        return self.__points
+
+    def get_pose_numbers(self, voxel_id: int) -> List[int]:
+        """
+        Parameters
+        ----------
+        voxel_id: int
+            ID of voxel
+
+        Returns
+        -------
+        pose_numbers: List[int]
+            Pose numbers which have points in the voxel in ascending order
+        """
+        start, end = self.__voxels[voxel_id]
+
+        return self.__pose_numbers[start:end].tolist()
+
+    def get_points(self, voxel_id: int, pose_number: int) -> PointCloud:
+        """
+        Parameters
+        ----------
+        voxel_id: int
+            ID of voxel
+        pose_number: int
+            The desired pose number
+
+        Returns
+        -------
+        points: PointCloud
+            Points of pose in the voxel (empty if pose has no points there)
+        """
+        start, end = self.__voxels.get(voxel_id, (0, 0))
+        entry = start + np.searchsorted(self.__pose_numbers[start:end], pose_number)
+        if entry == end or self.__pose_numbers[entry] != pose_number:
+            return np.empty((0, 3), dtype=float)
+
+        return self.__entry_points(entry)
+
+    def get_voxel_points(self, voxel_id: int) -> PointCloud:
+        """
+        Parameters
+        ----------
+        voxel_id: int
+            ID of voxel
+
+        Returns
+        -------
+        points: PointCloud
+            Points of all poses in the voxel sorted by poses (shared with the index without copying)
+        """
+        start, end = self.__voxels.get(voxel_id, (0, 0))
+        points_start, points_end = self.__offsets[start], self.__offsets[end]
+
+        return self.__points[points_start:points_end]
+
+    def select(self, voxel_ids: List[int]) -> "VoxelIndex":
+        """
+        Builds index of given voxels. Points are shared with this index without copying
+
+        Parameters
+        ----------
+        voxel_ids: List[int]
+            IDs of voxels to leave. Unknown IDs are ignored
+
+        Returns
+        -------
+        voxel_index: VoxelIndex
+            Index of given voxels
+        """
+        voxel_index = copy.copy(self)
+        voxel_index.__voxels = {
+            voxel_id: self.__voxels[voxel_id]
+            for voxel_id in sorted(set(voxel_ids))
+            if voxel_id in self.__voxels
+        }
+
+        return voxel_index
+
+    def items(
+        self, min_poses_number: int = 1
+    ) -> Iterator[Tuple[int, List[Tuple[int, PointCloud]]]]:
+        """
+        Iterates voxels with points of their poses
+
+        Parameters
+        ----------
+        min_poses_number: int
+            Voxels with points of less poses are skipped. For example, voxel seen by only one pose
+            doesn't constrain relative poses
+
+        Returns
+        -------
+        items: Iterator[Tuple[int, List[Tuple[int, PointCloud]]]]
+            ID of every voxel and pairs of pose number and points of this pose in the voxel
+        """
+        for voxel_id, (start, end) in self.__voxels.items():
+            if end - start < min_poses_number:
+                continue
+
+            yield voxel_id, [
+                (int(self.__pose_numbers[entry]), self.__entry_points(entry))
+                for entry in range(start, end)
+            ]
+
+    def __entry_points(self, entry: int) -> PointCloud:
+        """
+        Returns points of given entry (pair of voxel and pose) without copying
+        """
+        start, end = self.__offsets[entry], self.__offsets[entry + 1]
+
+        return self.__points[start:end]
@@ -1,9 +1,24 @@
+import sova.pipeline.incremental_pipeline as incremental_pipeline_module
+import sova.pipeline.multi_resolution_pipeline as multi_resolution_pipeline_module
+import sova.pipeline.patch_runner as patch_runner_module
 import sova.pipeline.pipeline as pipeline_module
 import sova.pipeline.sequential_pipeline as sequential_pipeline_module
+import sova.pipeline.statistics as statistics_module
+import sova.pipeline.streaming_pipeline as streaming_pipeline_module
 from sova.pipeline.configuration import ConfigurationReader, YAMLConfigurationReader
+from sova.pipeline.incremental_pipeline import *
+from sova.pipeline.multi_resolution_pipeline import *
+from sova.pipeline.patch_runner import *
 from sova.pipeline.pipeline import *
 from sova.pipeline.sequential_pipeline import *
+from sova.pipeline.statistics import *
+from sova.pipeline.streaming_pipeline import *
 
 __all__ = (pipeline_module.__all__ +
            sequential_pipeline_module.__all__ +
+           patch_runner_module.__all__ +
+           incremental_pipeline_module.__all__ +
+           statistics_module.__all__ +
+           multi_resolution_pipeline_module.__all__ +
+           streaming_pipeline_module.__all__ +
            ["ConfigurationReader", "YAMLConfigurationReader"])
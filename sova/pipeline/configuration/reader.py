@@ -1,18 +1,29 @@
 import mrob
-from octreelib.grid import GridConfig
+from octreelib.grid import Grid, GridBase, GridConfig
 
 import copy
+import os
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, Dict, List, Optional, Type
 
 from sova.backend import Backend, BaregBackend, EigenFactorBackend
-from sova.filter import Filter
+from sova.executor import Executor, ProcessExecutor, SerialExecutor, ThreadExecutor
+from sova.filter import (
+    EmptyVoxel,
+    FeatureFilter,
+    Filter,
+    PlanarityFilter,
+    PosesNumberFilter,
+)
+from sova.grid import VoxelHashGrid
 from sova.segmenter import (
     CAPESegmenter,
     CountSegmenter,
     IdenticalSegmenter,
+    NumpyRansacSegmenter,
     RansacSegmenter,
     Segmenter,
+    SegmenterChain,
 )
 from sova.subdivider import (
     CountSubdivider,
@@ -98,6 +109,48 @@ class ConfigurationReader(ABC):
 
         return value
 
+    @property
+    def dataset_cache_path(self) -> Optional[str]:
+        """
+        Represents path to memory-mapped store of dataset (see sova.utils.CachedReader).
+        `cache: true` places the store into `cache` directory of dataset
+
+        Returns
+        -------
+        dataset_cache_path: Optional[str]
+            Path to the store or None if dataset isn't cached
+        """
+        try:
+            dataset_configuration = copy.deepcopy(self._configuration["dataset"])
+            value = dataset_configuration["cache"]
+        except KeyError:
+            return None
+
+        if value is True:
+            return os.path.join(self.dataset_path, "cache")
+        if not value:
+            return None
+
+        return str(value)
+
+    @property
+    def dataset_memory_cache_bytes(self) -> int:
+        """
+        Represents size of in-memory cache of recently read scans (see sova.utils.LRUCachedReader)
+
+        Returns
+        -------
+        dataset_memory_cache_bytes: int
+            Size of cache in bytes. Scans aren't cached in memory if it is zero
+        """
+        try:
+            dataset_configuration = copy.deepcopy(self._configuration["dataset"])
+            value = dataset_configuration["memory_cache_bytes"]
+        except KeyError:
+            return 0
+
+        return int(value)
+
     @property
     def patches_start(self) -> int:
         """
@@ -174,6 +227,26 @@ class ConfigurationReader(ABC):
 
         return int(value)
 
+    @property
+    def patches_prune_rejected_features(self) -> bool:
+        """
+        Represents parameter which excludes features rejected by robust kernel on iteration of patch
+        from factor graphs of the next iterations
+
+        Returns
+        -------
+        patches_prune_rejected_features: bool
+            Prune rejected features parameter
+        """
+        try:
+            dataset_configuration = copy.deepcopy(self._configuration["dataset"])
+            patches_configuration = dataset_configuration["patches"]
+            value = patches_configuration["prune_rejected_features"]
+        except KeyError:
+            return False
+
+        return bool(value)
+
     @property
     def output_directory(self) -> str:
         """
@@ -192,6 +265,24 @@ class ConfigurationReader(ABC):
 
         return value
 
+    @property
+    def workers_number(self) -> int:
+        """
+        Represents number of worker processes which optimise patches in parallel
+
+        Returns
+        -------
+        workers_number: int
+            Number of workers
+        """
+        try:
+            pipeline_configuration = copy.deepcopy(self._configuration["pipeline"])
+            value = pipeline_configuration["workers"]
+        except KeyError:
+            return 1
+
+        return int(value)
+
     @property
     def subdividers(self) -> List[Subdivider]:
         """
@@ -229,9 +320,36 @@ class ConfigurationReader(ABC):
         Returns
         -------
         filters: List[Filter]
-            Filters list
+            Filters list. Feature filters of the same configuration are given to backend instead
         """
-        return []
+        filters_names = {"empty_voxel": EmptyVoxel}
+
+        return [
+            filters_names[name](**parameters)
+            for name, parameters in self.__filters_configuration().items()
+            if name in filters_names
+        ]
+
+    @property
+    def feature_filters(self) -> List[FeatureFilter]:
+        """
+        Represents feature filters parameter of pipeline, which backend applies to voxels of grid
+
+        Returns
+        -------
+        feature_filters: List[FeatureFilter]
+            Feature filters list in the order of configuration
+        """
+        feature_filters_names = {
+            "planarity": PlanarityFilter,
+            "poses_number": PosesNumberFilter,
+        }
+
+        return [
+            feature_filters_names[name](**parameters)
+            for name, parameters in self.__filters_configuration().items()
+            if name in feature_filters_names
+        ]
 
     @property
     def segmenters(self) -> List[Segmenter]:
@@ -241,7 +359,8 @@ class ConfigurationReader(ABC):
         Returns
         -------
         segmenters: List[Segmenter]
-            Segmenters list
+            Segmenters list. Several segmenters are combined into single SegmenterChain
+            in the order of configuration, so pipeline applies them by one traversal of grid
         """
         try:
             pipeline_configuration = copy.deepcopy(self._configuration["pipeline"])
@@ -253,6 +372,7 @@ class ConfigurationReader(ABC):
             "cape": CAPESegmenter,
             "count": CountSegmenter,
             "identical": IdenticalSegmenter,
+            "numpy_ransac": NumpyRansacSegmenter,
             "ransac": RansacSegmenter,
         }
         segmenters = []
@@ -262,6 +382,9 @@ class ConfigurationReader(ABC):
             values = segmenters_configuration[name]
             segmenters.append(segmenters_names[name](**values))
 
+        if len(segmenters) > 1:
+            return [SegmenterChain(segmenters)]
+
         return segmenters
 
     @property
@@ -282,6 +405,61 @@ class ConfigurationReader(ABC):
 
         return GridConfig(voxel_edge_length=grid_configuration["voxel_edge_length"])
 
+    @property
+    def grid_type(self) -> Type[GridBase]:
+        """
+        Represents type of grid which stores point clouds in pipeline
+
+        Returns
+        -------
+        grid_type: Type[GridBase]
+            Grid type: octreelib Grid (default) or VoxelHashGrid
+        """
+        try:
+            pipeline_configuration = copy.deepcopy(self._configuration["pipeline"])
+            value = pipeline_configuration["grid"]["type"]
+        except KeyError:
+            return Grid
+
+        grid_types = {"octree": Grid, "voxel_hash": VoxelHashGrid}
+        value = value.lower()
+        if value not in grid_types:
+            raise ValueError(f"Unknown grid type {value}")
+
+        return grid_types[value]
+
+    @property
+    def executor(self) -> Executor:
+        """
+        Represents executor which applies subdividers, segmenters and filters to leaves of grid.
+        New executor (with its own pool of workers) is created on every access.
+        If number of its workers isn't specified, processors are divided between workers of PatchRunner
+
+        Returns
+        -------
+        executor: Executor
+            Executor of pipeline: serial (default), thread or process one
+        """
+        try:
+            pipeline_configuration = copy.deepcopy(self._configuration["pipeline"])
+            executor_configuration = pipeline_configuration["executor"]
+            executor_type = executor_configuration["type"].lower()
+        except KeyError:
+            return SerialExecutor()
+
+        if executor_type == "serial":
+            return SerialExecutor()
+
+        executor_types = {"thread": ThreadExecutor, "process": ProcessExecutor}
+        if executor_type not in executor_types:
+            raise ValueError(f"Unknown executor type {executor_type}")
+        workers_number = executor_configuration.get("workers")
+        if workers_number is None:
+            # Every worker of PatchRunner creates its own executor, so they share processors
+            workers_number = max(1, (os.cpu_count() or 1) // self.workers_number)
+
+        return executor_types[executor_type](workers_number)
+
     def backend(self, start: int, end: int) -> Backend:
         """
         Represents backend parameter of pipeline
@@ -327,4 +505,33 @@ class ConfigurationReader(ABC):
         except KeyError:
             raise ValueError("backend type/parameters must be not empty")
 
+        feature_filters = self.feature_filters
+        if len(feature_filters) != 0:
+            backend_parameters["feature_filters"] = feature_filters
+
         return backend_names[backend_type](**backend_parameters)
+
+    def __filters_configuration(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Represents filters configuration of pipeline. Filters are optional
+
+        Returns
+        -------
+        filters_configuration: Dict[str, Dict[str, Any]]
+            Parameters of every filter by its lowercase name
+        """
+        try:
+            pipeline_configuration = copy.deepcopy(self._configuration["pipeline"])
+            filters_configuration = pipeline_configuration["filters"]
+        except KeyError:
+            return {}
+
+        filters_names = {"empty_voxel", "planarity", "poses_number"}
+        configuration = {}
+        for name, parameters in (filters_configuration or {}).items():
+            name = name.lower()
+            if name not in filters_names:
+                raise ValueError(f"Unknown filter {name}")
+            configuration[name] = parameters or {}
+
+        return configuration
@@ -0,0 +1,159 @@
+import numpy as np
+import open3d as o3d
+from octreelib.grid import GridConfig
+
+from typing import List, Union
+
+from sova.backend.backend import Backend, BackendOutput
+from sova.filter.filter import Filter
+from sova.grid import SlidingWindowGrid
+from sova.pipeline.pipeline import PipelineRuntimeParameters
+from sova.segmenter import Segmenter
+from sova.subdivider.subdivider import Subdivider
+from sova.typing.hints import Array4x4, ArrayNx3, ArrayNx4x4
+
+__all__ = ["IncrementalPipeline"]
+
+
+class IncrementalPipeline:
+    """
+    Represents sliding-window pipeline which keeps grid between overlapping windows of poses.
+    When new point cloud is inserted into the full window, points of the oldest pose are removed
+    and only leaves of the new point cloud are subdivided, segmented and filtered,
+    so the cost of every new scan doesn't depend on the window size.
+    Points stay in the grid between runs, so corrections found by the previous run are kept
+    and may be used to warm start backend of the next one (see `warm_start_poses`).
+
+    Parameters
+    ----------
+    window_size: int
+        Maximum number of poses in the window
+    subdividers: List[Subdivider]
+        Subdivider conditions to subdivide voxels which appear in the window for the first time
+    segmenters: List[Segmenter]
+        List of segmenter-algorithms which leave only planar features in voxels
+    filters: List[Filter]
+        Filter conditions to filter voxels in grid
+    grid_configuration: GridConfig
+        Represents octreelib Grid configuration
+    debug: bool
+        Represents debug parameter. If it is specified, the pipeline will save the visualization files.
+    """
+
+    def __init__(
+        self,
+        window_size: int,
+        subdividers: List[Subdivider],
+        segmenters: List[Segmenter],
+        filters: List[Filter],
+        grid_configuration: GridConfig,
+        debug: bool = False,
+    ) -> None:
+        if window_size < 1:
+            raise ValueError("Window size must be positive")
+
+        self._window_size: int = window_size
+        self._subdividers: List[Subdivider] = subdividers
+        self._segmenters: List[Segmenter] = segmenters
+        self._filters: List[Filter] = filters
+        self._debug: bool = debug
+        self._grid: SlidingWindowGrid = SlidingWindowGrid(grid_configuration)
+        self._poses: List[Array4x4[float]] = []
+        self._corrections: List[Array4x4[float]] = []
+
+    @property
+    def poses(self) -> ArrayNx4x4[float]:
+        """
+        Represents method to get poses of the window
+
+        Returns
+        -------
+        poses: ArrayNx4x4[float]
+            Poses which were used to insert point clouds of the window
+        """
+        return np.array(self._poses).reshape(-1, 4, 4)
+
+    @property
+    def warm_start_poses(self) -> ArrayNx4x4[float]:
+        """
+        Represents initial estimates of poses of the window for backend (for example, `initial_poses`
+        of MROBBackend): corrections found by the previous run relative to correction of the first pose,
+        which is anchored. Pose inserted after the run starts from correction of the previous pose
+
+        Returns
+        -------
+        warm_start_poses: ArrayNx4x4[float]
+            Initial estimates of poses of the window
+        """
+        corrections = np.array(self._corrections).reshape(-1, 4, 4)
+        if len(corrections) == 0:
+            return corrections
+
+        return np.linalg.inv(corrections[0]) @ corrections
+
+    def insert(
+        self,
+        point_cloud: Union[o3d.geometry.PointCloud, ArrayNx3[float]],
+        pose: Array4x4[float],
+    ) -> None:
+        """
+        Slides the window: removes the oldest pose if the window is full, then inserts
+        given point cloud and processes its leaves
+
+        Parameters
+        ----------
+        point_cloud: Union[o3d.geometry.PointCloud, ArrayNx3[float]]
+            Point cloud (or array of its points) in local coordinates
+        pose: Array4x4[float]
+            Pose of point cloud, that transforms it from local to global coordinates
+        """
+        if len(self._poses) == self._window_size:
+            self._grid.remove_pose(0)
+            self._poses.pop(0)
+            self._corrections.pop(0)
+
+        if isinstance(point_cloud, o3d.geometry.PointCloud):
+            point_cloud = point_cloud.points
+        points = np.asarray(point_cloud) @ pose[:3, :3].T + pose[:3, 3]
+
+        pose_number = len(self._poses)
+        self._grid.insert_points(pose_number, points)
+        self._grid.subdivide(self._subdividers, [pose_number])
+        for segmenter in self._segmenters:
+            self._grid.map_leaf_points(segmenter, [pose_number])
+        self._grid.filter(self._filters, [pose_number])
+
+        self._poses.append(pose)
+        self._corrections.append(
+            self._corrections[-1] if self._corrections else np.eye(4)
+        )
+
+    def run(
+        self, backend: Backend, parameters: PipelineRuntimeParameters
+    ) -> BackendOutput:
+        """
+        Optimises poses of the current window
+
+        Parameters
+        ----------
+        backend: Backend
+            Backend of SLAM algorithm for the current window
+        parameters: PipelineRuntimeParameters
+            Represents utility parameters to run pipeline (grid configuration is given on construction)
+
+        Returns
+        -------
+        output: BackendOutput
+            Structural SLAM result, which contains optimized poses of the window and related metrics.
+            Poses are kept as corrections of the window for the next run
+        """
+        backend_output = backend.process(self._grid)
+        self._corrections = list(backend_output.poses)
+
+        if self._debug:
+            parameters.visualization_config.unused_voxels = (
+                backend_output.unused_features
+            )
+            self._grid.visualize(parameters.visualization_config)
+
+        return backend_output
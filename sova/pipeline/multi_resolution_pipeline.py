@@ -0,0 +1,154 @@
+import numpy as np
+import open3d as o3d
+from octreelib.grid import GridConfig
+
+import dataclasses
+from dataclasses import dataclass
+from typing import List, Optional, Union
+
+from sova.backend.backend import Backend, BackendOutput, Metric
+from sova.filter.filter import Filter
+from sova.pipeline.pipeline import Pipeline
+from sova.pipeline.sequential_pipeline import (
+    SequentialPipeline,
+    SequentialPipelineRuntimeParameters,
+)
+from sova.pipeline.statistics import PipelineStatistics
+from sova.segmenter import Segmenter
+from sova.subdivider.subdivider import Subdivider
+from sova.typing.hints import ArrayNx3, ArrayNx4x4
+
+__all__ = ["ResolutionLevel", "MultiResolutionPipeline"]
+
+
+@dataclass
+class ResolutionLevel:
+    """
+    Represents coarse level of MultiResolutionPipeline
+
+    Parameters
+    ----------
+    grid_configuration: GridConfig
+        Represents octreelib Grid configuration of level (usually with larger voxels than finer levels)
+    backend: Backend
+        Backend which optimises poses on this level. Backends keep state, so every level needs its own one
+    subdividers: Optional[List[Subdivider]]
+        Subdivider conditions of level. Subdividers of pipeline are used if it is not specified
+    segmenters: Optional[List[Segmenter]]
+        Segmenters of level (for example, ones which leave few points per voxel).
+        Segmenters of pipeline are used if it is not specified
+    """
+
+    grid_configuration: GridConfig
+    backend: Backend
+    subdividers: Optional[List[Subdivider]] = None
+    segmenters: Optional[List[Segmenter]] = None
+
+
+class MultiResolutionPipeline(Pipeline):
+    """
+    Represents coarse-to-fine pipeline: poses are optimised by SequentialPipeline on every coarse level
+    and each finer level is warm-started from poses of the previous one. The last (finest) level uses
+    grid configuration from runtime parameters together with subdividers, segmenters and backend of the pipeline,
+    so it has to make only a few LM iterations.
+
+    Parameters
+    ----------
+    point_clouds: List[Union[o3d.geometry.PointCloud, ArrayNx3[float]]]
+        Point clouds (or arrays of their points) in local coordinates
+    poses: ArrayNx4x4[float]
+        Poses of given point clouds, that transforms them from local to global coordinates
+    subdividers: List[Subdivider]
+        Subdivider conditions to subdivide voxels in grid
+    segmenters: List[Segmenter]
+        List of segmenter-algorithms which leave only planar features in voxels
+    filters: List[Filter]
+        Filter conditions to filter voxels in grid
+    backend: Backend
+        Backend of SLAM algorithm that optimises poses on the finest level
+    debug: bool
+        Represents debug parameter. If it is specified, the pipeline will save the visualization files
+        of the finest level.
+    levels: List[ResolutionLevel]
+        Coarse levels from the coarsest to the finest one
+    """
+
+    def __init__(
+        self,
+        point_clouds: List[Union[o3d.geometry.PointCloud, ArrayNx3[float]]],
+        poses: ArrayNx4x4[float],
+        subdividers: List[Subdivider],
+        segmenters: List[Segmenter],
+        filters: List[Filter],
+        backend: Backend,
+        debug: bool,
+        levels: List[ResolutionLevel],
+    ) -> None:
+        super().__init__(
+            point_clouds, poses, subdividers, segmenters, filters, backend, debug
+        )
+        self._levels: List[ResolutionLevel] = levels
+
+    def run(self, parameters: SequentialPipelineRuntimeParameters) -> BackendOutput:
+        """
+        Runs SequentialPipeline on every level from the coarsest to the finest one.
+        Stages of level are available through `statistics` property with `level_{number}_` prefix.
+
+        Returns
+        -------
+        output: BackendOutput
+            Structural SLAM result, which contains corrections of initial poses accumulated over all levels,
+            metrics of every level and unused features of the finest level. It is converged only
+            if all levels have converged
+        """
+        statistics = PipelineStatistics()
+        self._statistics = statistics
+
+        finest_level = ResolutionLevel(
+            grid_configuration=parameters.grid_configuration,
+            backend=self._backend,
+            subdividers=self._subdividers,
+            segmenters=self._segmenters,
+        )
+        levels = self._levels + [finest_level]
+
+        poses = list(self._poses)
+        corrections = np.array([np.eye(4)] * len(poses))
+        metrics = []
+        converged = True
+        for level_number, level in enumerate(levels):
+            is_finest_level = level_number == len(levels) - 1
+            pipeline = SequentialPipeline(
+                point_clouds=self._point_clouds,
+                poses=poses,
+                subdividers=(
+                    self._subdividers
+                    if level.subdividers is None
+                    else level.subdividers
+                ),
+                segmenters=(
+                    self._segmenters if level.segmenters is None else level.segmenters
+                ),
+                filters=self._filters,
+                backend=level.backend,
+                debug=self._debug and is_finest_level,
+            )
+            output = pipeline.run(
+                dataclasses.replace(
+                    parameters, grid_configuration=level.grid_configuration
+                )
+            )
+            statistics.extend(pipeline.statistics, f"level_{level_number}_")
+
+            poses = [
+                optimised_pose @ pose
+                for optimised_pose, pose in zip(output.poses, poses)
+            ]
+            corrections = np.matmul(output.poses, corrections)
+            converged = converged and output.converged
+            metrics.extend(
+                Metric(name=f"Level {level_number} {metric.name}", value=metric.value)
+                for metric in output.metrics
+            )
+
+        return BackendOutput(corrections, metrics, output.unused_features, converged)
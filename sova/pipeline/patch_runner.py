@@ -0,0 +1,250 @@
+from octreelib.grid import VisualizationConfig
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Tuple
+
+from sova.backend import MROBBackend
+from sova.filter import RejectedFeaturesFilter
+from sova.pipeline.configuration import ConfigurationReader
+from sova.pipeline.sequential_pipeline import (
+    SequentialPipeline,
+    SequentialPipelineRuntimeParameters,
+)
+from sova.typing import ArrayNx3, ArrayNx4x4
+from sova.utils import DatasetReader, OptimisedPoseReadWriter, Prefetcher
+
+__all__ = ["PatchRunner"]
+
+logger = logging.getLogger(__name__)
+
+
+class PatchRunner:
+    """
+    Represents runner which splits dataset into independent patches and optimises each of them
+    using SequentialPipeline. Patches are distributed between worker processes, results are
+    collected in the order of patches. With single worker, the next patch is read in background thread
+    while the current one is optimised. Scans of patch are read concurrently by `DatasetReader.read_patch`.
+    Progress, backend output and stage statistics of every iteration are logged by `sova.pipeline.patch_runner`
+    logger at INFO level, so they are shown only if application configures logging.
+
+    Parameters
+    ----------
+    configuration: ConfigurationReader
+        Represents configuration of pipeline
+    dataset_reader: DatasetReader
+        Represents reader of dataset poses and point clouds
+    visualization_directory: str
+        Represents directory to save visualizations to (used only in debug mode)
+    workers_number: Optional[int] = None
+        Number of worker processes. If it is not specified, value from configuration is used
+    """
+
+    def __init__(
+        self,
+        configuration: ConfigurationReader,
+        dataset_reader: DatasetReader,
+        visualization_directory: str = "",
+        workers_number: Optional[int] = None,
+    ) -> None:
+        if workers_number is None:
+            workers_number = configuration.workers_number
+        if workers_number < 1:
+            raise ValueError("Number of workers must be positive")
+
+        self._configuration: ConfigurationReader = configuration
+        self._dataset_reader: DatasetReader = dataset_reader
+        self._visualization_directory: str = visualization_directory
+        self._workers_number: int = workers_number
+
+    @property
+    def patches(self) -> List[Tuple[int, int]]:
+        """
+        Represents method to get boundaries of patches
+
+        Returns
+        -------
+        patches: List[Tuple[int, int]]
+            Start (inclusive) and end (exclusive) of each patch
+        """
+        return [
+            (
+                start,
+                min(
+                    self._configuration.patches_end,
+                    start + self._configuration.patches_step,
+                ),
+            )
+            for start in range(
+                self._configuration.patches_start,
+                self._configuration.patches_end,
+                self._configuration.patches_step,
+            )
+        ]
+
+    def run(self) -> Iterator[Tuple[int, int, ArrayNx4x4[float]]]:
+        """
+        Optimises all patches of dataset
+
+        Returns
+        -------
+        patches: Iterator[Tuple[int, int, ArrayNx4x4[float]]]
+            Start, end and optimised poses of each patch in the order of patches
+        """
+        patches = self.patches
+        if self._workers_number == 1 or len(patches) <= 1:
+            with Prefetcher(
+                self._read_patch(start, end) for start, end in patches
+            ) as patches_scans:
+                for (start, end), (point_clouds, poses) in zip(patches, patches_scans):
+                    yield start, end, self._optimise_patch(
+                        start, end, point_clouds, poses
+                    )
+            return
+
+        starts, ends = zip(*patches)
+        with ProcessPoolExecutor(max_workers=self._workers_number) as executor:
+            yield from zip(
+                starts, ends, executor.map(self._process_patch, starts, ends)
+            )
+
+    def write(self, poses_directory: str) -> None:
+        """
+        Optimises all patches of dataset and writes optimised poses to given directory
+
+        Parameters
+        ----------
+        poses_directory: str
+            Directory to write optimised poses to
+        """
+        poses_writer = OptimisedPoseReadWriter()
+        for start, end, poses in self.run():
+            for pose_number, pose in zip(range(start, end), poses):
+                poses_writer.write(
+                    os.path.join(poses_directory, f"{pose_number}.txt"), pose
+                )
+
+    def _process_patch(self, start: int, end: int) -> ArrayNx4x4[float]:
+        """
+        Reads and optimises single patch of dataset
+
+        Parameters
+        ----------
+        start: int
+            Represents start of patch
+        end: int
+            Represents end of patch
+
+        Returns
+        -------
+        poses: ArrayNx4x4[float]
+            Optimised poses of patch
+        """
+        return self._optimise_patch(start, end, *self._read_patch(start, end))
+
+    def _read_patch(
+        self, start: int, end: int
+    ) -> Tuple[List[ArrayNx3[float]], ArrayNx4x4[float]]:
+        """
+        Reads point clouds and poses of single patch of dataset. Scans are read in the pool of threads,
+        processors are shared by worker processes
+
+        Parameters
+        ----------
+        start: int
+            Represents start of patch
+        end: int
+            Represents end of patch
+
+        Returns
+        -------
+        patch: Tuple[List[ArrayNx3[float]], ArrayNx4x4[float]]
+            Points of point clouds in local coordinates and their poses
+        """
+        return self._dataset_reader.read_patch(
+            self._configuration.dataset_path,
+            start,
+            end,
+            max(1, (os.cpu_count() or 1) // self._workers_number),
+        )
+
+    def _optimise_patch(
+        self,
+        start: int,
+        end: int,
+        point_clouds: List[ArrayNx3[float]],
+        poses: ArrayNx4x4[float],
+    ) -> ArrayNx4x4[float]:
+        """
+        Optimises single patch of dataset
+
+        Parameters
+        ----------
+        start: int
+            Represents start of patch
+        end: int
+            Represents end of patch
+        point_clouds: List[ArrayNx3[float]]
+            Point clouds of patch in local coordinates
+        poses: ArrayNx4x4[float]
+            Initial poses of patch
+
+        Returns
+        -------
+        poses: ArrayNx4x4[float]
+            Optimised poses of patch
+        """
+        logger.info("Processing %d to %d...", start, end - 1)
+
+        # Backend builds new graph on every run, so it is shared by all iterations
+        backend = self._configuration.backend(start, end)
+        rejected_features = None
+        if self._configuration.patches_prune_rejected_features and isinstance(
+            backend, MROBBackend
+        ):
+            rejected_features = RejectedFeaturesFilter()
+            backend.feature_filters.append(rejected_features)
+
+        with self._configuration.executor as executor:
+            for iteration_ind in range(self._configuration.patches_iterations):
+                pipeline = SequentialPipeline(
+                    point_clouds=point_clouds,
+                    poses=poses,
+                    subdividers=self._configuration.subdividers,
+                    segmenters=self._configuration.segmenters,
+                    filters=self._configuration.filters,
+                    backend=backend,
+                    debug=self._configuration.debug,
+                )
+                output = pipeline.run(
+                    SequentialPipelineRuntimeParameters(
+                        grid_configuration=self._configuration.grid_configuration,
+                        grid_type=self._configuration.grid_type,
+                        executor=executor,
+                        visualization_config=VisualizationConfig(
+                            filepath=os.path.join(
+                                self._visualization_directory,
+                                f"{start}-{end - 1}_{iteration_ind}.html",
+                            )
+                        ),
+                        initial_point_cloud_number=(end - start) // 2,
+                    )
+                )
+                logger.info(
+                    "Patch %d-%d, iteration %d:\n%s\nStages:\n%s",
+                    start,
+                    end - 1,
+                    iteration_ind,
+                    output,
+                    pipeline.statistics,
+                )
+
+                poses = [
+                    optimised_pose @ pose
+                    for optimised_pose, pose in zip(output.poses, poses)
+                ]
+                if rejected_features is not None:
+                    rejected_features.add(output.unused_features)
+
+        return poses
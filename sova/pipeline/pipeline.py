@@ -1,16 +1,18 @@
+import numpy as np
 import open3d as o3d
-from octreelib.grid import GridConfig, VisualizationConfig
+from octreelib.grid import Grid, GridBase, GridConfig, VisualizationConfig
 
-import copy
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import List, Optional, Type, Union
 
 from sova.backend.backend import Backend, BackendOutput
+from sova.executor import Executor, SerialExecutor
 from sova.filter.filter import Filter
+from sova.pipeline.statistics import PipelineStatistics
 from sova.segmenter import Segmenter
 from sova.subdivider.subdivider import Subdivider
-from sova.typing.hints import ArrayNx4x4
+from sova.typing.hints import ArrayNx3, ArrayNx4x4
 
 __all__ = ["PipelineRuntimeParameters", "Pipeline"]
 
@@ -24,12 +26,26 @@ class PipelineRuntimeParameters(ABC):
     ----------
     grid_configuration: GridConfig
         Represents octreelib Grid configuration
+    grid_type: Type[GridBase]
+        Represents type of grid to insert point clouds into (octreelib Grid or sova.grid.VoxelHashGrid)
+    executor: Executor
+        Represents executor which applies subdividers, segmenters and filters to leaves of grid
     visualization_config: VisualizationConfig
         Represents configuration for result visualization
+    transform_dtype: type
+        Represents type of transformed points (np.float32 halves memory of transformed point clouds)
+    collect_counters: bool
+        Represents parameter for counting voxels, leaves and points after each stage of pipeline.
+        Counting traverses the grid after every stage, which isn't included in durations of stages,
+        so it is disabled by default and only durations are recorded
     """
 
     grid_configuration: GridConfig = GridConfig
+    grid_type: Type[GridBase] = Grid
+    executor: Executor = field(default_factory=SerialExecutor)
     visualization_config: VisualizationConfig = VisualizationConfig()
+    transform_dtype: type = np.float64
+    collect_counters: bool = False
 
 
 class Pipeline(ABC):
@@ -39,8 +55,8 @@ class Pipeline(ABC):
 
     Parameters
     ----------
-    point_clouds: List[o3d.geometry.PointCloud]
-        Point clouds in local coordinates
+    point_clouds: List[Union[o3d.geometry.PointCloud, ArrayNx3[float]]]
+        Point clouds (or arrays of their points) in local coordinates
     poses: ArrayNx4x4[float]
         Poses of given point clouds, that transforms them from local to global coordinates
     subdividers: List[Subdivider]
@@ -57,7 +73,7 @@ class Pipeline(ABC):
 
     def __init__(
         self,
-        point_clouds: List[o3d.geometry.PointCloud],
+        point_clouds: List[Union[o3d.geometry.PointCloud, ArrayNx3[float]]],
         poses: ArrayNx4x4[float],
         subdividers: List[Subdivider],
         segmenters: List[Segmenter],
@@ -68,13 +84,32 @@ class Pipeline(ABC):
         if len(point_clouds) != len(poses):
             raise ValueError("Sizes of point_cloud and poses arrays must be equal")
 
-        self._point_clouds: List[o3d.geometry.PointCloud] = point_clouds
+        # Points of Open3D point clouds are taken as views without copying
+        self._point_clouds: List[ArrayNx3[float]] = [
+            np.asarray(point_cloud.points)
+            if isinstance(point_cloud, o3d.geometry.PointCloud)
+            else np.asarray(point_cloud)
+            for point_cloud in point_clouds
+        ]
         self._poses: ArrayNx4x4[float] = poses
         self._subdividers: List[Subdivider] = subdividers
         self._segmenters: List[Segmenter] = segmenters
         self._filters: List[Filter] = filters
         self._backend: Backend = backend
         self._debug: bool = debug
+        self._statistics: Optional[PipelineStatistics] = None
+
+    @property
+    def statistics(self) -> Optional[PipelineStatistics]:
+        """
+        Represents method to get durations and counters of stages of the last run
+
+        Returns
+        -------
+        statistics: Optional[PipelineStatistics]
+            Statistics of the last run or None if pipeline hasn't been run yet
+        """
+        return self._statistics
 
     @abstractmethod
     def run(self, parameters: PipelineRuntimeParameters) -> BackendOutput:
@@ -93,17 +128,50 @@ class Pipeline(ABC):
         """
         pass
 
-    def _transform_point_clouds(self) -> List[o3d.geometry.PointCloud]:
+    def _allocate_points_buffer(self, dtype: type = np.float64) -> ArrayNx3[float]:
+        """
+        Represents protected method to allocate buffer which fits transformed points of any point cloud
+
+        Parameters
+        ----------
+        dtype: type
+            Type of transformed points
+
+        Returns
+        -------
+        buffer: ArrayNx3[float]
+            Buffer for transformed points
+        """
+        size = max((len(points) for points in self._point_clouds), default=0)
+        return np.empty((size, 3), dtype=dtype)
+
+    def _transform_point_cloud(
+        self, pose_number: int, buffer: Optional[ArrayNx3[float]] = None
+    ) -> ArrayNx3[float]:
         """
         Represents protected method to transform points from local to global coordinates
-        using given poses
+        using given pose. Points are transformed by single matrix multiplication into given buffer,
+        so the result stays valid until the buffer is reused.
+
+        Parameters
+        ----------
+        pose_number: int
+            Number of point cloud to transform
+        buffer: Optional[ArrayNx3[float]]
+            Buffer for transformed points. If it is not specified, new array is allocated
 
         Returns
         -------
-        transformed_point_clouds: List[o3d.geometry.PointCloud]
-            List of point clouds in global coordinates
+        transformed_points: ArrayNx3[float]
+            Points of point cloud in global coordinates
         """
-        return [
-            copy.deepcopy(point_cloud).transform(pose)
-            for point_cloud, pose in zip(self._point_clouds, self._poses)
-        ]
+        points = self._point_clouds[pose_number]
+        pose = self._poses[pose_number]
+        if buffer is None:
+            buffer = np.empty((len(points), 3), dtype=float)
+
+        transformed_points = buffer[: len(points)]
+        np.matmul(points, pose[:3, :3].T, out=transformed_points)
+        transformed_points += pose[:3, 3]
+
+        return transformed_points
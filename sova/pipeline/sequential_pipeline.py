@@ -1,10 +1,10 @@
-import numpy as np
-from octreelib.grid import Grid
-
+import time
 from dataclasses import dataclass
 
 from sova.backend import BackendOutput
 from sova.pipeline.pipeline import Pipeline, PipelineRuntimeParameters
+from sova.pipeline.statistics import PipelineStatistics
+from sova.segmenter.chain import SegmenterChain
 
 __all__ = ["SequentialPipelineRuntimeParameters", "SequentialPipeline"]
 
@@ -37,34 +37,102 @@ class SequentialPipeline(Pipeline):
         4. Runs filter functions to delete unnecessary voxels/point clouds
         5. Runs chosen backend and produce BackendOutput result with all necessary information
 
+        Durations and counters of every stage are available through `statistics` property after the run.
+
         Returns
         -------
         output: BackendOutput
             Structural SLAM result, which contains optimized poses and related metrics
         """
-        transformed_point_clouds = self._transform_point_clouds()
-
-        grid = Grid(parameters.grid_configuration)
+        statistics = PipelineStatistics()
+        self._statistics = statistics
+
+        # Transformed points are copied by the grid on insertion, so one buffer is reused for all clouds
+        points_buffer = self._allocate_points_buffer(parameters.transform_dtype)
+        transform_duration = 0.0
+
+        grid = parameters.grid_type(parameters.grid_configuration)
+        # Grid is not given to statistics if counters are disabled, so only durations are recorded
+        counted_grid = grid if parameters.collect_counters else None
+        initial_pose_numbers = [parameters.initial_point_cloud_number]
+        pose_numbers = list(range(len(self._point_clouds)))
+
+        start_time = time.perf_counter()
+        initial_points = self._transform_point_cloud(
+            parameters.initial_point_cloud_number, points_buffer
+        )
+        transform_duration += time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        grid.insert_points(parameters.initial_point_cloud_number, initial_points)
+        statistics.add_stage(
+            "initial_insert",
+            time.perf_counter() - start_time,
+            counted_grid,
+            initial_pose_numbers,
+        )
 
-        grid.insert_points(
-            parameters.initial_point_cloud_number,
-            np.asarray(
-                transformed_point_clouds[parameters.initial_point_cloud_number].points
-            ),
+        start_time = time.perf_counter()
+        parameters.executor.subdivide(grid, self._subdividers)
+        statistics.add_stage(
+            "subdivide",
+            time.perf_counter() - start_time,
+            counted_grid,
+            initial_pose_numbers,
         )
-        grid.subdivide(self._subdividers)
 
-        for pose_number, point_cloud in enumerate(transformed_point_clouds):
+        distribution_duration = 0.0
+        for pose_number in pose_numbers:
             if pose_number == parameters.initial_point_cloud_number:
                 continue
-            grid.insert_points(pose_number, np.asarray(point_cloud.points))
 
-        for segmenter in self._segmenters:
-            grid.map_leaf_points(segmenter)
+            start_time = time.perf_counter()
+            points = self._transform_point_cloud(pose_number, points_buffer)
+            transform_duration += time.perf_counter() - start_time
 
-        grid.filter(self._filters)
+            start_time = time.perf_counter()
+            grid.insert_points(pose_number, points)
+            distribution_duration += time.perf_counter() - start_time
+
+        statistics.add_stage(
+            "distribution", distribution_duration, counted_grid, pose_numbers
+        )
+        # Point clouds are transformed right before their insertion into the grid
+        statistics.add_stage(
+            "transform",
+            transform_duration,
+            points=sum(len(points) for points in self._point_clouds),
+        )
+
+        for segmenter_number, segmenter in enumerate(self._segmenters):
+            stage_name = f"segmenter_{segmenter_number}_{type(segmenter).__name__}"
+            start_time = time.perf_counter()
+            if isinstance(segmenter, SegmenterChain):
+                durations = parameters.executor.map_chain_leaf_points(grid, segmenter)
+                duration = time.perf_counter() - start_time
+                # Every segmenter of chain is a stage, the chain stage is left with traversal of grid
+                for chained_number, (chained_segmenter, chained_duration) in enumerate(
+                    zip(segmenter.segmenters, durations)
+                ):
+                    statistics.add_stage(
+                        f"{stage_name}_{chained_number}_{type(chained_segmenter).__name__}",
+                        chained_duration,
+                    )
+                    duration -= chained_duration
+            else:
+                parameters.executor.map_leaf_points(grid, segmenter)
+                duration = time.perf_counter() - start_time
+            statistics.add_stage(stage_name, duration, counted_grid, pose_numbers)
+
+        start_time = time.perf_counter()
+        parameters.executor.filter(grid, self._filters)
+        statistics.add_stage(
+            "filter", time.perf_counter() - start_time, counted_grid, pose_numbers
+        )
 
+        start_time = time.perf_counter()
         backend_output = self._backend.process(grid)
+        statistics.add_stage("backend", time.perf_counter() - start_time)
 
         if self._debug:
             parameters.visualization_config.unused_voxels = (
@@ -0,0 +1,167 @@
+from octreelib.grid import GridBase
+
+import dataclasses
+from dataclasses import dataclass
+from typing import List, Optional
+
+__all__ = ["StageStatistics", "PipelineStatistics"]
+
+
+@dataclass
+class StageStatistics:
+    """
+    Represents duration and counters of single pipeline stage
+
+    Parameters
+    ----------
+    name: str
+        Name of stage
+    duration: float
+        Duration of stage in seconds
+    voxels: Optional[int]
+        Number of grid nodes (all octree nodes of all poses) after the stage
+    leaves: Optional[int]
+        Number of leaves with points (summed over poses) after the stage
+    points: Optional[int]
+        Number of points (summed over poses) after the stage
+    """
+
+    name: str
+    duration: float
+    voxels: Optional[int] = None
+    leaves: Optional[int] = None
+    points: Optional[int] = None
+
+
+class PipelineStatistics:
+    """
+    Represents per-stage statistics of single pipeline run
+    """
+
+    def __init__(self) -> None:
+        self._stages: List[StageStatistics] = []
+
+    @property
+    def stages(self) -> List[StageStatistics]:
+        """
+        Represents method to get statistics of stages in the order of their execution
+
+        Returns
+        -------
+        stages: List[StageStatistics]
+            Statistics of stages
+        """
+        return self._stages
+
+    @property
+    def duration(self) -> float:
+        """
+        Represents method to get total duration of all stages
+
+        Returns
+        -------
+        duration: float
+            Total duration in seconds
+        """
+        return sum(stage.duration for stage in self._stages)
+
+    def __getitem__(self, name: str) -> StageStatistics:
+        """
+        Returns statistics of stage by its name
+
+        Parameters
+        ----------
+        name: str
+            Name of stage
+
+        Returns
+        -------
+        stage: StageStatistics
+            Statistics of stage
+        """
+        for stage in self._stages:
+            if stage.name == name:
+                return stage
+
+        raise KeyError(name)
+
+    def add_stage(
+        self,
+        name: str,
+        duration: float,
+        grid: Optional[GridBase] = None,
+        pose_numbers: Optional[List[int]] = None,
+        points: Optional[int] = None,
+    ) -> StageStatistics:
+        """
+        Records statistics of stage. If grid is given, its voxels, leaves and points of given poses are counted
+
+        Parameters
+        ----------
+        name: str
+            Name of stage
+        duration: float
+            Duration of stage in seconds
+        grid: Optional[GridBase]
+            Grid after the stage
+        pose_numbers: Optional[List[int]]
+            Pose numbers to count in grid
+        points: Optional[int]
+            Number of processed points for stages which don't work with grid
+
+        Returns
+        -------
+        stage: StageStatistics
+            Recorded statistics of stage
+        """
+        stage = StageStatistics(name=name, duration=duration, points=points)
+        if grid is not None:
+            stage.voxels = sum(grid.n_nodes(number) for number in pose_numbers)
+            stage.leaves = sum(grid.n_leaves(number) for number in pose_numbers)
+            stage.points = sum(grid.n_points(number) for number in pose_numbers)
+
+        self._stages.append(stage)
+
+        return stage
+
+    def extend(self, statistics: "PipelineStatistics", prefix: str = "") -> None:
+        """
+        Appends stages of another run (for example, of nested pipeline)
+
+        Parameters
+        ----------
+        statistics: PipelineStatistics
+            Statistics to append
+        prefix: str
+            Prefix which is added to names of appended stages
+        """
+        self._stages.extend(
+            dataclasses.replace(stage, name=prefix + stage.name)
+            for stage in statistics.stages
+        )
+
+    def __str__(self) -> str:
+        """
+        Represents implementation of str dunder method to produce statistics pretty print
+
+        Returns
+        -------
+        string: str
+            String representation of statistics
+        """
+        lines = []
+        for stage in self._stages:
+            counters = [
+                f"{counter}={value}"
+                for counter, value in [
+                    ("voxels", stage.voxels),
+                    ("leaves", stage.leaves),
+                    ("points", stage.points),
+                ]
+                if value is not None
+            ]
+            lines.append(
+                f"\t{stage.name}: {round(stage.duration, 6)}s {' '.join(counters)}".rstrip()
+            )
+
+        return "\n".join(lines)
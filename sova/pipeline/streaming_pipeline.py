@@ -0,0 +1,179 @@
+import open3d as o3d
+
+import dataclasses
+import itertools
+import os
+from typing import Callable, Iterable, Iterator, List, Tuple, Union
+
+from sova.backend.backend import Backend
+from sova.filter.filter import Filter
+from sova.pipeline.sequential_pipeline import (
+    SequentialPipeline,
+    SequentialPipelineRuntimeParameters,
+)
+from sova.segmenter import Segmenter
+from sova.subdivider.subdivider import Subdivider
+from sova.typing.hints import Array4x4, ArrayNx3, ArrayNx4x4
+
+__all__ = ["StreamingPipeline"]
+
+
+class StreamingPipeline:
+    """
+    Represents pipeline which consumes scans one by one from iterator (for example, DatasetReader.read_scans)
+    and optimises them by windows of consecutive poses using SequentialPipeline.
+    Optimised poses of every window are yielded as soon as the window is solved, so only one window
+    of point clouds is kept in memory regardless of the sequence length.
+
+    Parameters
+    ----------
+    scans: Iterable[Tuple[Union[o3d.geometry.PointCloud, ArrayNx3[float]], Array4x4[float]]]
+        Point clouds (or arrays of their points) in local coordinates with their poses
+    window_size: int
+        Number of poses optimised together. The last window may be smaller
+    subdividers: List[Subdivider]
+        Subdivider conditions to subdivide voxels in grid
+    segmenters: List[Segmenter]
+        List of segmenter-algorithms which leave only planar features in voxels
+    filters: List[Filter]
+        Filter conditions to filter voxels in grid
+    backend_factory: Callable[[int, int], Backend]
+        Creates backend for the window by its start and end, e.g. ConfigurationReader.backend.
+        Backend is shared by all iterations of the window
+    iterations_number: int
+        Number of re-optimisations of every window
+    start: int
+        Number of the first scan of iterator
+    visualization_directory: str
+        Represents directory to save visualizations to (used only in debug mode)
+    debug: bool
+        Represents debug parameter. If it is specified, the pipeline will save the visualization files.
+    """
+
+    def __init__(
+        self,
+        scans: Iterable[
+            Tuple[Union[o3d.geometry.PointCloud, ArrayNx3[float]], Array4x4[float]]
+        ],
+        window_size: int,
+        subdividers: List[Subdivider],
+        segmenters: List[Segmenter],
+        filters: List[Filter],
+        backend_factory: Callable[[int, int], Backend],
+        iterations_number: int = 1,
+        start: int = 0,
+        visualization_directory: str = "",
+        debug: bool = False,
+    ) -> None:
+        if window_size < 1:
+            raise ValueError("Window size must be positive")
+        if iterations_number < 1:
+            raise ValueError("Number of iterations must be positive")
+
+        self._scans: Iterator[
+            Tuple[Union[o3d.geometry.PointCloud, ArrayNx3[float]], Array4x4[float]]
+        ] = iter(scans)
+        self._window_size: int = window_size
+        self._subdividers: List[Subdivider] = subdividers
+        self._segmenters: List[Segmenter] = segmenters
+        self._filters: List[Filter] = filters
+        self._backend_factory: Callable[[int, int], Backend] = backend_factory
+        self._iterations_number: int = iterations_number
+        self._start: int = start
+        self._visualization_directory: str = visualization_directory
+        self._debug: bool = debug
+
+    def run(
+        self, parameters: SequentialPipelineRuntimeParameters
+    ) -> Iterator[Tuple[int, int, ArrayNx4x4[float]]]:
+        """
+        Reads scans window by window and optimises them
+
+        Parameters
+        ----------
+        parameters: SequentialPipelineRuntimeParameters
+            Represents utility parameters to run pipeline. Initial point cloud number
+            and visualization file are chosen for every window separately
+
+        Returns
+        -------
+        windows: Iterator[Tuple[int, int, ArrayNx4x4[float]]]
+            Start, end and optimised poses of each window in the order of scans
+        """
+        start = self._start
+        while True:
+            window = list(itertools.islice(self._scans, self._window_size))
+            if not window:
+                return
+
+            point_clouds, poses = map(list, zip(*window))
+            # Scans of the window are released before the next window is read
+            del window
+
+            end = start + len(point_clouds)
+            yield start, end, self._process_window(
+                start, end, point_clouds, poses, parameters
+            )
+            start = end
+
+    def _process_window(
+        self,
+        start: int,
+        end: int,
+        point_clouds: List[Union[o3d.geometry.PointCloud, ArrayNx3[float]]],
+        poses: List[Array4x4[float]],
+        parameters: SequentialPipelineRuntimeParameters,
+    ) -> ArrayNx4x4[float]:
+        """
+        Optimises single window of scans
+
+        Parameters
+        ----------
+        start: int
+            Represents start of window
+        end: int
+            Represents end of window
+        point_clouds: List[Union[o3d.geometry.PointCloud, ArrayNx3[float]]]
+            Point clouds of window in local coordinates
+        poses: List[Array4x4[float]]
+            Initial poses of window
+        parameters: SequentialPipelineRuntimeParameters
+            Represents utility parameters to run pipeline
+
+        Returns
+        -------
+        poses: ArrayNx4x4[float]
+            Optimised poses of window
+        """
+        # Backend builds new graph on every run, so it is shared by all iterations
+        backend = self._backend_factory(start, end)
+        for iteration_ind in range(self._iterations_number):
+            pipeline = SequentialPipeline(
+                point_clouds=point_clouds,
+                poses=poses,
+                subdividers=self._subdividers,
+                segmenters=self._segmenters,
+                filters=self._filters,
+                backend=backend,
+                debug=self._debug,
+            )
+            output = pipeline.run(
+                dataclasses.replace(
+                    parameters,
+                    visualization_config=dataclasses.replace(
+                        parameters.visualization_config,
+                        filepath=os.path.join(
+                            self._visualization_directory,
+                            f"{start}-{end - 1}_{iteration_ind}.html",
+                        ),
+                    ),
+                    initial_point_cloud_number=(end - start) // 2,
+                )
+            )
+
+            poses = [
+                optimised_pose @ pose
+                for optimised_pose, pose in zip(output.poses, poses)
+            ]
+
+        return poses
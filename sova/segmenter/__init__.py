@@ -1,13 +1,18 @@
 import sova.segmenter.cape as cape_module
+import sova.segmenter.chain as chain_module
 import sova.segmenter.count as count_module
 import sova.segmenter.identical as identical_module
+import sova.segmenter.numpy_ransac as numpy_ransac_module
 import sova.segmenter.ransac as ransac_module
 import sova.segmenter.segmenter as segmenter_module
 from sova.segmenter.cape import *
+from sova.segmenter.chain import *
 from sova.segmenter.count import *
 from sova.segmenter.identical import *
+from sova.segmenter.numpy_ransac import *
 from sova.segmenter.ransac import *
 from sova.segmenter.segmenter import *
 
 __all__ = (cape_module.__all__ + count_module.__all__ + segmenter_module.__all__ +
-           ransac_module.__all__ + identical_module.__all__)
+           ransac_module.__all__ + identical_module.__all__ + numpy_ransac_module.__all__ +
+           chain_module.__all__)
@@ -1,8 +1,10 @@
 import numpy as np
-from sklearn.decomposition import PCA
+
+from typing import Any, Callable, List
 
 from sova.segmenter.segmenter import Segmenter
 from sova.typing import ArrayNx3
+from sova.utils.voxel_statistics import VoxelStatistics
 
 __all__ = ["CAPESegmenter"]
 
@@ -39,23 +41,51 @@ class CAPESegmenter(Segmenter):
         segmented_points: ArrayNx3[float]
             List of 3D segmented points after processing the CAPE condition
         """
-        if len(points) <= 10:
+        if not self.is_planar(VoxelStatistics(points)):
             return np.empty((0, 3), dtype=float)
 
-        points = np.asarray(points)
+        return np.asarray(points)
 
-        pca = PCA(n_components=3)
-        try:
-            standardized_points = (points - points.mean(axis=0)) / points.std(axis=0)
-            pca.fit_transform(standardized_points)
-            min_eigenvalue, _, max_eigenvalue = sorted(pca.explained_variance_)
+    def segment_batch(
+        self,
+        voxels_points: List[ArrayNx3[float]],
+        map_function: Callable[[Callable[[ArrayNx3[float]], Any], List], List],
+    ) -> List[ArrayNx3[float]]:
+        """
+        Checks CAPE planar condition of all voxels by their statistics computed at once
+        in the calling process, so `map_function` isn't used
+        """
+        return [
+            np.asarray(points) if self.is_planar(statistics) else np.empty((0, 3))
+            for points, statistics in zip(
+                voxels_points, VoxelStatistics.batch(voxels_points)
+            )
+        ]
 
-            if max_eigenvalue / min_eigenvalue > self.__correlation:
-                return np.empty((0, 3), dtype=float)
-        except Exception as ex:
+    def is_planar(self, statistics: VoxelStatistics) -> bool:
+        """
+        Represent CAPE planar condition, which uses only statistics of voxel points
+
+        Parameters
+        ----------
+        statistics: VoxelStatistics
+            Statistics of points of voxel
+
+        Returns
+        -------
+        is_planar: bool
+            True if points of voxel are planar and should be kept, otherwise False
+        """
+        if statistics.count <= 10:
+            return False
+
+        min_eigenvalue, _, max_eigenvalue = statistics.eigenvalues
+        if np.isnan(min_eigenvalue):
             if self.__debug:
-                print(ex)
+                print("Points have zero deviation along some axis")
 
-            return np.empty((0, 3), dtype=float)
+            return False
 
-        return points
+        # Eigenvalues of standardized points sum up to 3, so only the minimum one may be zero
+        with np.errstate(divide="ignore"):
+            return bool(max_eigenvalue / min_eigenvalue <= self.__correlation)
@@ -0,0 +1,115 @@
+import numpy as np
+
+import time
+from typing import Any, Callable, List, Tuple
+
+from sova.segmenter.segmenter import Segmenter
+from sova.typing.hints import ArrayNx3
+
+__all__ = ["SegmenterChain"]
+
+
+class SegmenterChain(Segmenter):
+    """
+    Represents composite segmenter, which applies segmenters one after another to points of voxel,
+    so pipeline traverses grid once for the whole chain instead of once for every segmenter.
+    Chain stops as soon as any segmenter returns no points, so cheap segmenters
+    (for example, CountSegmenter) placed first save the cost of expensive ones.
+    Executors apply segmenters of chain one by one to all leaves gathered by single traversal
+    (see `segment_batch_durations`), so pipeline records duration of every segmenter.
+
+    Parameters
+    ----------
+    segmenters: List[Segmenter]
+        Segmenters in the order of application
+    """
+
+    def __init__(self, segmenters: List[Segmenter]) -> None:
+        if len(segmenters) == 0:
+            raise ValueError("Segmenters list must be not empty")
+
+        self.__segmenters: List[Segmenter] = segmenters
+
+    @property
+    def segmenters(self) -> List[Segmenter]:
+        """
+        Represents segmenters of chain
+
+        Returns
+        -------
+        segmenters: List[Segmenter]
+            Segmenters in the order of application
+        """
+        return self.__segmenters
+
+    def __call__(self, points: ArrayNx3[float]) -> ArrayNx3[float]:
+        """
+        Segments given points by every segmenter of chain
+
+        Parameters
+        ----------
+        points: ArrayNx3[float]
+            3D points are used to segment plane
+
+        Returns
+        -------
+        segmented_points: ArrayNx3[float]
+            Points left by the last segmenter or empty array if any segmenter has left no points
+        """
+        for segmenter in self.__segmenters:
+            points = segmenter(points)
+            if len(points) == 0:
+                return np.empty((0, 3), dtype=float)
+
+        return points
+
+    def segment_batch(
+        self,
+        voxels_points: List[ArrayNx3[float]],
+        map_function: Callable[[Callable[[ArrayNx3[float]], Any], List], List],
+    ) -> List[ArrayNx3[float]]:
+        """
+        Segments points of many voxels by segmenters of chain, see `segment_batch_durations`
+        """
+        voxels_points, _ = self.segment_batch_durations(voxels_points, map_function)
+
+        return voxels_points
+
+    def segment_batch_durations(
+        self,
+        voxels_points: List[ArrayNx3[float]],
+        map_function: Callable[[Callable[[ArrayNx3[float]], Any], List], List],
+    ) -> Tuple[List[ArrayNx3[float]], List[float]]:
+        """
+        Segments points of many voxels by segmenters of chain one after another. Every segmenter
+        segments all voxels which previous segmenters have left points in (using its `segment_batch`)
+
+        Parameters
+        ----------
+        voxels_points: List[ArrayNx3[float]]
+            Points of every voxel
+        map_function: Callable[[Callable[[ArrayNx3[float]], Any], List], List]
+            Function which applies given function to every element of the list
+
+        Returns
+        -------
+        segmentation: Tuple[List[ArrayNx3[float]], List[float]]
+            Segmented points of every voxel and duration of every segmenter in seconds
+        """
+        voxels_points = list(voxels_points)
+        durations = []
+        for segmenter in self.__segmenters:
+            start_time = time.perf_counter()
+            voxels = [
+                voxel for voxel, points in enumerate(voxels_points) if len(points) > 0
+            ]
+            results = segmenter.segment_batch(
+                [voxels_points[voxel] for voxel in voxels], map_function
+            )
+            for voxel, points in zip(voxels, results):
+                voxels_points[voxel] = (
+                    points if len(points) > 0 else np.empty((0, 3), dtype=float)
+                )
+            durations.append(time.perf_counter() - start_time)
+
+        return voxels_points, durations
@@ -0,0 +1,299 @@
+import numpy as np
+
+import math
+import threading
+from typing import Optional, Tuple
+
+from sova.segmenter.segmenter import Segmenter
+from sova.typing.hints import ArrayNx3
+
+__all__ = ["NumpyRansacSegmenter"]
+
+
+class NumpyRansacSegmenter(Segmenter):
+    """
+    Represent RANSAC-based mechanism which segments plane from given voxel using only NumPy.
+    Plane hypotheses are drawn in batches and all of them are scored against the points
+    by single matrix product, so there is no round-trip through Open3D point clouds.
+    If confidence is given, number of iterations is adapted to the inlier ratio of the best plane found so far:
+    segmentation stops as soon as a plane with more inliers would have been found with given confidence.
+    Segmenter counts iterations and calls made in the calling process (or thread): process executors
+    segment copies of the segmenter, so their counters aren't changed.
+
+    Parameters
+    ----------
+    threshold: float
+        Max distance a point can be from the plane model, and still be considered an inlier
+    initial_points: int
+        Number of initial points to be considered inliers in each iteration
+    iterations: int
+        Number of RANSAC iterations (upper bound of iterations in adaptive mode)
+    batch_size: int
+        Number of hypotheses which are scored together. In adaptive mode the stop condition
+        is checked after every batch, so smaller batches stop closer to the required number of iterations
+    confidence: Optional[float]
+        Probability to find the best plane which enables adaptive mode. If it is not specified,
+        all iterations are made
+    seed: Optional[int]
+        Seed of random generator which draws hypotheses
+    debug: bool = False
+        Represents parameter for printing debug information to stdout
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.1,
+        initial_points: int = 3,
+        iterations: int = 5000,
+        batch_size: int = 256,
+        confidence: Optional[float] = None,
+        seed: Optional[int] = None,
+        debug: bool = False,
+    ) -> None:
+        if threshold <= 0:
+            raise ValueError("Threshold must be positive")
+        if initial_points < 3:
+            raise ValueError("Initial points count must be more or equal than three")
+        if iterations < 1:
+            raise ValueError("Number of RANSAC iterations must be positive")
+        if batch_size < 1:
+            raise ValueError("Batch size must be positive")
+        if confidence is not None and not 0 < confidence < 1:
+            raise ValueError("Confidence must be in (0, 1) interval")
+
+        self.__threshold: float = threshold
+        self.__initial_points: int = initial_points
+        self.__iterations: int = iterations
+        self.__batch_size: int = batch_size
+        self.__confidence: Optional[float] = confidence
+        self.__iterations_used: int = 0
+        self.__calls_number: int = 0
+        self.__lock: threading.Lock = threading.Lock()
+        self.__random_generator: np.random.Generator = np.random.default_rng(seed)
+        self.__debug: bool = debug
+
+    def __getstate__(self) -> dict:
+        """
+        Lock isn't pickled, so segmenter can be sent to process workers
+        """
+        state = self.__dict__.copy()
+        del state["_NumpyRansacSegmenter__lock"]
+
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.__lock = threading.Lock()
+
+    @property
+    def iterations_used(self) -> int:
+        """
+        Represents method to get number of iterations, which were actually made
+
+        Returns
+        -------
+        iterations_used: int
+            Total number of iterations of all segmented voxels
+        """
+        return self.__iterations_used
+
+    @property
+    def calls_number(self) -> int:
+        """
+        Represents method to get number of segmented voxels
+
+        Returns
+        -------
+        calls_number: int
+            Number of calls of segmenter, including ones with too few points
+        """
+        return self.__calls_number
+
+    def __call__(self, points: ArrayNx3[float]) -> ArrayNx3[float]:
+        """
+        Segments given points using RANSAC method
+
+        Parameters
+        ----------
+        points: ArrayNx3[float]
+            3D points are used to segment plane using RANSAC
+
+        Returns
+        -------
+        segmented_points: ArrayNx3[float]
+            Inliers of the best plane. Given array is returned as is if all points are inliers
+        """
+        if len(points) == 0:
+            raise ValueError("Length of points list must be positive")
+
+        points = np.asarray(points, dtype=float)
+        if len(points) < self.__initial_points:
+            if self.__debug:
+                print("There must be at least initial points count of points")
+
+            self.__count_iterations(0)
+            return np.empty((0, 3), dtype=float)
+
+        best_inliers = None
+        best_inliers_count = 0
+        best_squared_error = np.inf
+        iterations_used = 0
+        iterations_required = self.__iterations
+        while iterations_used < iterations_required:
+            batch_size = min(self.__batch_size, iterations_required - iterations_used)
+            iterations_used += batch_size
+
+            normals, offsets = self.__fit_planes(
+                points[self.__sample(batch_size, len(points))]
+            )
+            distances = np.abs(points @ normals.T + offsets)
+            inliers = distances < self.__threshold
+            inliers_counts = np.count_nonzero(inliers, axis=0)
+
+            inliers_count = inliers_counts.max()
+            if inliers_count == 0 or inliers_count < best_inliers_count:
+                continue
+
+            # Hypotheses with the same number of inliers are compared by their RMSE
+            candidates = np.flatnonzero(inliers_counts == inliers_count)
+            squared_errors = np.where(
+                inliers[:, candidates], distances[:, candidates] ** 2, 0
+            ).sum(axis=0)
+            candidate = np.argmin(squared_errors)
+            if (
+                inliers_count > best_inliers_count
+                or squared_errors[candidate] < best_squared_error
+            ):
+                best_inliers = inliers[:, candidates[candidate]]
+                best_inliers_count = inliers_count
+                best_squared_error = squared_errors[candidate]
+
+                if self.__confidence is not None:
+                    iterations_required = min(
+                        self.__iterations,
+                        self.__required_iterations(best_inliers_count / len(points)),
+                    )
+
+        self.__count_iterations(iterations_used)
+        if best_inliers is None:
+            return np.empty((0, 3), dtype=float)
+        if np.all(best_inliers):
+            return points
+
+        return points[best_inliers]
+
+    def __sample(self, batch_size: int, points_number: int) -> np.ndarray:
+        """
+        Draws indices of initial points of every hypothesis without replacement.
+        Indices are drawn independently and only hypotheses with repeated indices are drawn again,
+        so sampling costs O(batch * initial_points) instead of O(batch * points). Voxels with few points
+        would be redrawn too often, so there initial points are the ones with the least random keys
+
+        Parameters
+        ----------
+        batch_size: int
+            Number of hypotheses
+        points_number: int
+            Number of points to draw from
+
+        Returns
+        -------
+        samples: np.ndarray
+            Distinct indices of points of shape (batch, initial_points)
+        """
+        if points_number < 4 * self.__initial_points:
+            keys = self.__random_generator.random((batch_size, points_number))
+
+            return np.argpartition(keys, self.__initial_points - 1, axis=1)[
+                :, : self.__initial_points
+            ]
+
+        samples = self.__random_generator.integers(
+            points_number, size=(batch_size, self.__initial_points)
+        )
+        while True:
+            sorted_samples = np.sort(samples, axis=1)
+            is_repeated = np.any(
+                sorted_samples[:, 1:] == sorted_samples[:, :-1], axis=1
+            )
+            repeated_number = np.count_nonzero(is_repeated)
+            if repeated_number == 0:
+                return samples
+
+            samples[is_repeated] = self.__random_generator.integers(
+                points_number, size=(repeated_number, self.__initial_points)
+            )
+
+    def __count_iterations(self, iterations_used: int) -> None:
+        """
+        Adds iterations of segmented voxel to counters. Threads of executor segment voxels concurrently
+        """
+        with self.__lock:
+            self.__iterations_used += iterations_used
+            self.__calls_number += 1
+
+    def __required_iterations(self, inliers_ratio: float) -> int:
+        """
+        Computes number of iterations, which draw at least one sample of inliers with given confidence
+
+        Parameters
+        ----------
+        inliers_ratio: float
+            Ratio of inliers of the best plane
+
+        Returns
+        -------
+        iterations: int
+            Required number of iterations
+        """
+        sample_probability = inliers_ratio**self.__initial_points
+        if sample_probability >= 1:
+            return 0
+
+        return math.ceil(
+            math.log(1 - self.__confidence) / math.log1p(-sample_probability)
+        )
+
+    @staticmethod
+    def __fit_planes(samples: np.ndarray) -> Tuple[ArrayNx3[float], np.ndarray]:
+        """
+        Fits plane to every sample of points by least squares
+
+        Parameters
+        ----------
+        samples: np.ndarray
+            Samples of points of shape (batch, initial_points, 3)
+
+        Returns
+        -------
+        planes: Tuple[ArrayNx3[float], np.ndarray]
+            Unit normals of shape (batch, 3) and offsets of planes. Planes of degenerate samples
+            (coinciding or collinear points) have zero normals, so they have no inliers
+        """
+        centroids = samples.mean(axis=1)
+        if samples.shape[1] == 3:
+            # Plane through three points is given by cross product
+            normals = np.cross(
+                samples[:, 1] - samples[:, 0], samples[:, 2] - samples[:, 0]
+            )
+            lengths = np.linalg.norm(normals, axis=1)
+            is_degenerate = (
+                lengths
+                <= 1e-12
+                * np.max(np.abs(samples - centroids[:, np.newaxis, :]), axis=(1, 2))
+                ** 2
+            )
+            normals[~is_degenerate] /= lengths[~is_degenerate, np.newaxis]
+        else:
+            centered_samples = samples - centroids[:, np.newaxis, :]
+            eigenvalues, eigenvectors = np.linalg.eigh(
+                np.einsum("bni,bnj->bij", centered_samples, centered_samples)
+            )
+            normals = eigenvectors[:, :, 0]
+            # Plane is undefined if the second eigenvalue is zero too
+            is_degenerate = eigenvalues[:, 1] <= 1e-12 * eigenvalues[:, 2]
+        normals[is_degenerate] = 0
+
+        return normals, np.where(
+            is_degenerate, np.inf, -np.einsum("bi,bi->b", normals, centroids)
+        )
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Any, Callable, List
 
 from sova.typing.hints import ArrayNx3
 
@@ -26,3 +27,39 @@ class Segmenter(ABC):
             List of 3D segmented points after processing the algorithm
         """
         pass
+
+    @property
+    def segments_batch(self) -> bool:
+        """
+        Represents whether segmenter processes points of many voxels together (overrides `segment_batch`),
+        so executors gather points of all leaves for it instead of mapping leaves one by one
+
+        Returns
+        -------
+        segments_batch: bool
+            True if `segment_batch` is overridden
+        """
+        return type(self).segment_batch is not Segmenter.segment_batch
+
+    def segment_batch(
+        self,
+        voxels_points: List[ArrayNx3[float]],
+        map_function: Callable[[Callable[[ArrayNx3[float]], Any], List], List],
+    ) -> List[ArrayNx3[float]]:
+        """
+        Represents method to segment points of many voxels. Executors call it with their `map`,
+        so by default every voxel is segmented separately (for example, in parallel)
+
+        Parameters
+        ----------
+        voxels_points: List[ArrayNx3[float]]
+            Points of every voxel
+        map_function: Callable[[Callable[[ArrayNx3[float]], Any], List], List]
+            Function which applies given function to every element of the list
+
+        Returns
+        -------
+        segmented_points: List[ArrayNx3[float]]
+            Segmented points of every voxel
+        """
+        return map_function(self, voxels_points)
@@ -1,5 +1,6 @@
 from sova.subdivider.subdivider import Subdivider
 from sova.typing import ArrayNx3
+from sova.utils.voxel_statistics import VoxelStatistics
 
 __all__ = ["CountSubdivider"]
 
@@ -33,3 +34,19 @@ class CountSubdivider(Subdivider):
             Returns False if number of points in given point cloud more than predefined value, otherwise returns False
         """
         return len(points) >= self.count
+
+    def check_statistics(self, statistics: VoxelStatistics) -> bool:
+        """
+        Represent count-based subdivider mechanism which uses number of voxel points
+
+        Parameters
+        ----------
+        statistics: VoxelStatistics
+            Statistics of points of voxel
+
+        Returns
+        -------
+        should_be_split: bool
+            Returns True if number of points is not less than predefined value, otherwise returns False
+        """
+        return statistics.count >= self.count
@@ -1,8 +1,8 @@
 import numpy as np
-from sklearn.decomposition import PCA
 
 from sova.subdivider.subdivider import Subdivider
 from sova.typing import ArrayNx3
+from sova.utils.voxel_statistics import VoxelStatistics
 
 __all__ = ["EigenValueSubdivider"]
 
@@ -40,20 +40,31 @@ class EigenValueSubdivider(Subdivider):
             Returns False if minimum value of points covariance matrix less than predefined value, otherwise
             returns True
         """
-        if len(points) < 3:
-            return False
+        return self.check_statistics(VoxelStatistics(points))
 
-        points = np.asarray(points)
+    def check_statistics(self, statistics: VoxelStatistics) -> bool:
+        """
+        Represent "eigen-value"-based subdivider mechanism which uses covariance of voxel points
 
-        pca = PCA(n_components=3)
-        try:
-            standardized_points = (points - points.mean(axis=0)) / points.std(axis=0)
-            pca.fit_transform(standardized_points)
-            min_eigenvalue, _, _ = sorted(pca.explained_variance_)
+        Parameters
+        ----------
+        statistics: VoxelStatistics
+            Statistics of points of voxel
+
+        Returns
+        -------
+        should_be_split: bool
+            Returns False if minimum value of points covariance matrix less than predefined value, otherwise
+            returns True
+        """
+        if statistics.count < 3:
+            return False
 
-            return min_eigenvalue > self.__value
-        except Exception as ex:
+        min_eigenvalue, _, _ = statistics.eigenvalues
+        if np.isnan(min_eigenvalue):
             if self.__debug:
-                print(ex)
+                print("Points have zero deviation along some axis")
+
+            return False
 
-        return False
+        return min_eigenvalue > self.__value
@@ -1,10 +1,10 @@
 import numpy as np
-import open3d as o3d
 
 import math
 
 from sova.subdivider.subdivider import Subdivider
-from sova.typing import ArrayNx3
+from sova.typing import Array3, ArrayNx3
+from sova.utils.voxel_statistics import VoxelStatistics
 
 __all__ = ["SizeSubdivider"]
 
@@ -37,9 +37,35 @@ class SizeSubdivider(Subdivider):
         should_be_split: bool
             Returns True if size of point cloud more than predefined value, otherwise returns False
         """
+        if len(points) == 0:
+            return False
 
-        point_cloud = o3d.geometry.PointCloud(o3d.utility.Vector3dVector(points))
-        min_bound, max_bound = point_cloud.get_min_bound(), point_cloud.get_max_bound()
+        points = np.asarray(points)
+        return self.__is_large(points.min(axis=0), points.max(axis=0))
+
+    def check_statistics(self, statistics: VoxelStatistics) -> bool:
+        """
+        Represent size-based subdivider mechanism which uses bounding box of voxel points
+
+        Parameters
+        ----------
+        statistics: VoxelStatistics
+            Statistics of points of voxel
+
+        Returns
+        -------
+        should_be_split: bool
+            Returns True if size of point cloud more than predefined value, otherwise returns False
+        """
+        if statistics.count == 0:
+            return False
+
+        return self.__is_large(statistics.min_bound, statistics.max_bound)
+
+    def __is_large(self, min_bound: Array3[float], max_bound: Array3[float]) -> bool:
+        """
+        Compares side of cube with the same diagonal as bounding box with predefined size
+        """
         side_length = np.linalg.norm(max_bound - min_bound) / math.sqrt(3)
 
         return side_length > self.__size
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 
 from sova.typing import ArrayNx3
+from sova.utils.voxel_statistics import VoxelStatistics
 
 __all__ = ["Subdivider"]
 
@@ -26,3 +27,37 @@ class Subdivider(ABC):
             Condition, which describes: if the point cloud (or voxel) should be divided
         """
         pass
+
+    @property
+    def checks_statistics(self) -> bool:
+        """
+        Represents whether subdivider can decide by statistics of points (overrides `check_statistics`).
+        Executors check other subdividers by their points
+
+        Returns
+        -------
+        checks_statistics: bool
+            True if `check_statistics` is implemented
+        """
+        return type(self).check_statistics is not Subdivider.check_statistics
+
+    def check_statistics(self, statistics: VoxelStatistics) -> bool:
+        """
+        Represents method which returns statement about voxel using only statistics of its points,
+        so voxel is checked in O(1) without its points. Subdividers which decide by statistics
+        override it, executors check them this way. Statistics don't keep points,
+        so subdividers which don't override it can't be checked by statistics
+
+        Parameters
+        ----------
+        statistics: VoxelStatistics
+            Statistics of points of voxel
+
+        Returns
+        -------
+        should_be_split: bool
+            Condition, which describes: if the point cloud (or voxel) should be divided
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} doesn't decide by statistics of points"
+        )
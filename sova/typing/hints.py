@@ -5,17 +5,21 @@ from typing import Annotated, Literal, TypeVar
 
 __all__ = [
     "Array3",
+    "Array3x3",
     "Array4x4",
     "ArrayNx3",
     "ArrayNx4",
     "ArrayNx8",
     "ArrayNx4x4",
+    "ArrayNx3x3",
 ]
 
 DType = TypeVar("DType", bound=np.generic)
 
 Array3 = Annotated[npt.NDArray[DType], Literal[3]]
 
+Array3x3 = Annotated[npt.NDArray[DType], Literal[3, 3]]
+
 Array4x4 = Annotated[npt.NDArray[DType], Literal[4, 4]]
 
 ArrayNx3 = Annotated[npt.NDArray[DType], Literal["N", 3]]
@@ -25,3 +29,5 @@ ArrayNx4 = Annotated[npt.NDArray[DType], Literal["N", 4]]
 ArrayNx8 = Annotated[npt.NDArray[DType], Literal["N", 8]]
 
 ArrayNx4x4 = Annotated[npt.NDArray[DType], Literal["N", 4, 4]]
+
+ArrayNx3x3 = Annotated[npt.NDArray[DType], Literal["N", 3, 3]]
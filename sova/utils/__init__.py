@@ -1,11 +1,28 @@
+import sova.utils.planarity as planarity_module
 import sova.utils.pose_readwriter as pose_readwriter_module
+import sova.utils.prefetcher as prefetcher_module
+import sova.utils.subsampling as subsampling_module
+import sova.utils.voxel_statistics as voxel_statistics_module
 from sova.utils.dataset_reader import (
+    CachedReader,
     DatasetReader,
     HiltiReader,
     KittiReader,
+    KittiVelodyneReader,
+    LRUCachedReader,
     NuscenesReader,
+    ScanCacheStatistics,
 )
+from sova.utils.planarity import *
 from sova.utils.pose_readwriter import *
+from sova.utils.prefetcher import *
+from sova.utils.subsampling import *
+from sova.utils.voxel_statistics import *
 
-__all__ = (pose_readwriter_module.__all__ +
-           ["DatasetReader", "HiltiReader", "KittiReader", "NuscenesReader"])
+__all__ = (planarity_module.__all__ +
+           pose_readwriter_module.__all__ +
+           prefetcher_module.__all__ +
+           subsampling_module.__all__ +
+           voxel_statistics_module.__all__ +
+           ["CachedReader", "DatasetReader", "HiltiReader", "KittiReader",
+            "KittiVelodyneReader", "LRUCachedReader", "NuscenesReader", "ScanCacheStatistics"])
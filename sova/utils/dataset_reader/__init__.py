@@ -1,10 +1,22 @@
+import sova.utils.dataset_reader.cached as cached_module
 import sova.utils.dataset_reader.hilti as hilti_module
 import sova.utils.dataset_reader.kitti as kitti_module
+import sova.utils.dataset_reader.kitti_velodyne as kitti_velodyne_module
+import sova.utils.dataset_reader.lru as lru_module
 import sova.utils.dataset_reader.nuscenes as nuscenes_module
 import sova.utils.dataset_reader.reader as reader_module
+from sova.utils.dataset_reader.cached import *
 from sova.utils.dataset_reader.hilti import *
 from sova.utils.dataset_reader.kitti import *
+from sova.utils.dataset_reader.kitti_velodyne import *
+from sova.utils.dataset_reader.lru import *
 from sova.utils.dataset_reader.nuscenes import *
 from sova.utils.dataset_reader.reader import *
 
-__all__ = hilti_module.__all__ + kitti_module.__all__ + nuscenes_module.__all__ + reader_module.__all__
+__all__ = (cached_module.__all__ +
+           hilti_module.__all__ +
+           kitti_module.__all__ +
+           kitti_velodyne_module.__all__ +
+           lru_module.__all__ +
+           nuscenes_module.__all__ +
+           reader_module.__all__)
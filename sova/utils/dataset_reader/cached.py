@@ -0,0 +1,247 @@
+import numpy as np
+import open3d as o3d
+
+import os
+import shutil
+import tempfile
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from sova.typing import Array4x4, ArrayNx3, ArrayNx4x4
+from sova.utils.dataset_reader.reader import DatasetReader
+
+__all__ = ["CachedReader"]
+
+
+class CachedReader(DatasetReader):
+    """
+    Represents reader which converts scans of dataset (read by original reader) once into packed store:
+    points of all scans in single contiguous float32 file, offsets of scans and stacked poses.
+    Store is built once on the first read (or by `build`) and shared by threads and processes.
+    Points file is memory-mapped, so scans are served as zero-copy `np.memmap` views and repeated runs
+    (patches, iterations, parameter sweeps) on the same sequence read pages of one file instead of
+    parsing point clouds again. Points are stored as float32, which is the precision of LiDAR scans.
+    Store is built into temporary directory and renamed, so interrupted conversion is never used.
+    Delete the store to rebuild it after dataset is changed.
+
+    Parameters
+    ----------
+    dataset_reader: DatasetReader
+        Reader of original dataset files, which is used to build the store
+    cache_path: Optional[str]
+        Directory of the store. `cache` directory inside dataset directory is used if it is not specified
+    """
+
+    def __init__(
+        self, dataset_reader: DatasetReader, cache_path: Optional[str] = None
+    ) -> None:
+        self.__dataset_reader: DatasetReader = dataset_reader
+        self.__cache_path: Optional[str] = cache_path
+        # Opened stores by dataset path: points, offsets of scans, poses and numbers of scans
+        self.__stores: Dict[
+            str, Tuple[np.memmap, np.ndarray, ArrayNx4x4[float], Dict[int, int]]
+        ] = {}
+        # Guards building and opening of stores by threads of `read_patch`
+        self.__lock: threading.Lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        """
+        Opened stores and lock aren't pickled (memory maps would be copied), workers open stores again
+        """
+        state = self.__dict__.copy()
+        state["_CachedReader__stores"] = {}
+        del state["_CachedReader__lock"]
+
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.__lock = threading.Lock()
+
+    def read_pose(self, filename: str) -> ArrayNx4x4[float]:
+        """
+        Reads pose file using reader of original dataset
+        """
+        return self.__dataset_reader.read_pose(filename)
+
+    def read_point_cloud(self, filename: str) -> o3d.geometry.PointCloud:
+        """
+        Reads point cloud file using reader of original dataset
+        """
+        return self.__dataset_reader.read_point_cloud(filename)
+
+    def read_scan(
+        self, dataset_path: str, scan_number: int
+    ) -> Tuple[ArrayNx3[float], Array4x4[float]]:
+        """
+        Reads points and pose of scan from the store. Store is built on the first read
+
+        Parameters
+        ----------
+        dataset_path: str
+            Path to dataset directory
+        scan_number: int
+            Number of scan to read
+
+        Returns
+        -------
+        scan: Tuple[ArrayNx3[float], Array4x4[float]]
+            Read-only memory-mapped view of points in local coordinates and pose of scan
+        """
+        points, offsets, poses, scan_indices = self.__open(dataset_path)
+        try:
+            scan_index = scan_indices[scan_number]
+        except KeyError:
+            raise ValueError(f"Scan {scan_number} is not found in {dataset_path}")
+
+        start, end = offsets[scan_index], offsets[scan_index + 1]
+
+        return points[start:end], poses[scan_index].copy()
+
+    def cache_path(self, dataset_path: str) -> str:
+        """
+        Parameters
+        ----------
+        dataset_path: str
+            Path to dataset directory
+
+        Returns
+        -------
+        cache_path: str
+            Directory of the store of dataset
+        """
+        if self.__cache_path is not None:
+            return self.__cache_path
+
+        return os.path.join(dataset_path, "cache")
+
+    def build(self, dataset_path: str) -> None:
+        """
+        Converts dataset into the store if it hasn't been converted yet. Scans are read one by one
+        by the original reader from scan 0 until it can't find the next scan, so any dataset layout
+        is supported and memory doesn't depend on the size of dataset.
+        Threads of one reader build the store once. If other process has built the store concurrently,
+        its store is used and the own copy is dropped
+
+        Parameters
+        ----------
+        dataset_path: str
+            Path to dataset directory
+        """
+        cache_path = self.cache_path(dataset_path)
+        with self.__lock:
+            if self.__is_built(cache_path):
+                return
+
+            parent_path = os.path.dirname(os.path.abspath(cache_path))
+            os.makedirs(parent_path, exist_ok=True)
+            temporary_path = tempfile.mkdtemp(dir=parent_path)
+            try:
+                self.__write(dataset_path, temporary_path)
+                try:
+                    os.rename(temporary_path, cache_path)
+                except OSError:
+                    if not self.__is_built(cache_path):
+                        raise
+                    shutil.rmtree(temporary_path, ignore_errors=True)
+            except BaseException:
+                shutil.rmtree(temporary_path, ignore_errors=True)
+                raise
+
+    def read_patch(
+        self,
+        dataset_path: str,
+        start: int,
+        end: int,
+        workers_number: Optional[int] = None,
+    ) -> Tuple[List[ArrayNx3[float]], ArrayNx4x4[float]]:
+        """
+        Builds the store before scans of patch are read concurrently, see DatasetReader.read_patch
+        """
+        self.__open(dataset_path)
+
+        return super().read_patch(dataset_path, start, end, workers_number)
+
+    def __write(self, dataset_path: str, store_path: str) -> None:
+        """
+        Writes all scans of dataset into the store in given directory
+        """
+        offsets = [0]
+        poses = []
+        with open(os.path.join(store_path, "points.bin"), "wb") as file:
+            while True:
+                try:
+                    point_cloud, pose = self.__dataset_reader.read_scan(
+                        dataset_path, len(poses)
+                    )
+                except (OSError, IndexError):
+                    break
+
+                if isinstance(point_cloud, o3d.geometry.PointCloud):
+                    point_cloud = point_cloud.points
+                points = np.asarray(point_cloud, dtype=np.float32).reshape(-1, 3)
+                file.write(np.ascontiguousarray(points).tobytes())
+                offsets.append(offsets[-1] + len(points))
+                poses.append(pose)
+
+        if len(poses) == 0:
+            raise ValueError(f"No scans are found in {dataset_path}")
+
+        np.save(os.path.join(store_path, "offsets.npy"), np.array(offsets))
+        np.save(
+            os.path.join(store_path, "poses.npy"),
+            np.array(poses, dtype=float).reshape(-1, 4, 4),
+        )
+        # Numbers of scans are written the last, so they mark complete store
+        np.save(
+            os.path.join(store_path, "scan_numbers.npy"),
+            np.arange(len(poses)),
+        )
+
+    @staticmethod
+    def __is_built(cache_path: str) -> bool:
+        """
+        Checks whether complete store exists in given directory
+        """
+        return os.path.exists(os.path.join(cache_path, "scan_numbers.npy"))
+
+    def __open(
+        self, dataset_path: str
+    ) -> Tuple[np.memmap, np.ndarray, ArrayNx4x4[float], Dict[int, int]]:
+        """
+        Opens the store of dataset (and builds it if it doesn't exist)
+        """
+        with self.__lock:
+            if dataset_path in self.__stores:
+                return self.__stores[dataset_path]
+
+        self.build(dataset_path)
+        with self.__lock:
+            if dataset_path in self.__stores:
+                return self.__stores[dataset_path]
+
+            cache_path = self.cache_path(dataset_path)
+            offsets = np.load(os.path.join(cache_path, "offsets.npy"))
+            scan_numbers = np.load(os.path.join(cache_path, "scan_numbers.npy"))
+            # Memory map can't be empty
+            points = (
+                np.memmap(
+                    os.path.join(cache_path, "points.bin"),
+                    dtype=np.float32,
+                    mode="r",
+                    shape=(int(offsets[-1]), 3),
+                )
+                if offsets[-1] > 0
+                else np.empty((0, 3), dtype=np.float32)
+            )
+            self.__stores[dataset_path] = (
+                points,
+                offsets,
+                np.load(os.path.join(cache_path, "poses.npy")),
+                {
+                    scan_number: scan_index
+                    for scan_index, scan_number in enumerate(scan_numbers.tolist())
+                },
+            )
+
+        return self.__stores[dataset_path]
@@ -2,8 +2,9 @@ import numpy as np
 import open3d as o3d
 
 import os.path
+from functools import lru_cache
 
-from sova.typing import ArrayNx4x4
+from sova.typing import Array4x4, ArrayNx4x4
 from sova.utils.dataset_reader.reader import DatasetReader
 
 __all__ = ["KittiReader"]
@@ -20,13 +21,9 @@ class KittiReader(DatasetReader):
         """
         Reads KITTI pose file
         """
-        calibration_matrix = np.eye(4)
-        calibration_file_path = os.path.join(os.path.dirname(filename), "calib.txt")
-        with open(calibration_file_path) as file:
-            line = file.readlines()[4][4:]
-        calibration_matrix[:3, :4] = np.array(
-            list(map(float, line.rstrip().split(" ")))
-        ).reshape(3, 4)
+        calibration_matrix = _read_calibration(
+            os.path.join(os.path.dirname(filename), "calib.txt")
+        )
 
         pose_matrix = np.eye(4)
         with open(filename) as file:
@@ -43,3 +40,19 @@ class KittiReader(DatasetReader):
         Reads point cloud from KITTI dataset
         """
         return o3d.io.read_point_cloud(filename)
+
+
+@lru_cache(maxsize=None)
+def _read_calibration(filename: str) -> Array4x4[float]:
+    """
+    Reads calibration matrix of KITTI sequence once, poses of all scans share it
+    """
+    calibration_matrix = np.eye(4)
+    with open(filename) as file:
+        line = file.readlines()[4][4:]
+    calibration_matrix[:3, :4] = np.array(
+        list(map(float, line.rstrip().split(" ")))
+    ).reshape(3, 4)
+    calibration_matrix.setflags(write=False)
+
+    return calibration_matrix
@@ -0,0 +1,128 @@
+import numpy as np
+import open3d as o3d
+
+import os.path
+from typing import Dict, Tuple
+
+from sova.typing import Array4x4, ArrayNx3, ArrayNx4x4
+from sova.utils.dataset_reader.kitti import _read_calibration
+from sova.utils.dataset_reader.reader import DatasetReader
+
+__all__ = ["KittiVelodyneReader"]
+
+
+class KittiVelodyneReader(DatasetReader):
+    """
+    Represents reader of raw KITTI odometry sequence without conversion to `.pcd`:
+    scans are `velodyne/{scan_number:06d}.bin` float32 XYZI buffers, poses of all scans are rows
+    of single trajectory file, calibration is `calib.txt`. Scans are memory-mapped, so their points
+    are zero-copy views. Trajectory and calibration are parsed once per sequence by `np.loadtxt`.
+    Source: https://www.cvlibs.net/datasets/kitti/eval_odometry.php
+
+    Parameters
+    ----------
+    poses_filename: str
+        Name of trajectory file inside sequence directory
+    """
+
+    def __init__(self, poses_filename: str = "poses.txt") -> None:
+        self.__poses_filename: str = poses_filename
+        # Calibrated poses of all scans by sequence path
+        self.__poses: Dict[str, ArrayNx4x4[float]] = {}
+
+    @staticmethod
+    def read_pose(filename: str) -> ArrayNx4x4[float]:
+        """
+        Poses of all scans are rows of single trajectory file, so pose of scan can't be read
+        from a file of its own. Use `read_scan` (or `read_patch`) with number of scan,
+        or `read_poses` for the whole trajectory
+        """
+        raise ValueError(
+            f"{filename} is trajectory of all scans, use read_scan or read_patch "
+            "to read pose of scan by its number"
+        )
+
+    @staticmethod
+    def read_poses(filename: str) -> ArrayNx4x4[float]:
+        """
+        Reads all poses of KITTI trajectory file (3x4 matrix by row per line)
+        and calibrates them by `calib.txt` of the same directory
+        """
+        calibration_matrix = _read_calibration(
+            os.path.join(os.path.dirname(filename), "calib.txt")
+        )
+
+        trajectory = np.loadtxt(filename, dtype=float, ndmin=2).reshape(-1, 3, 4)
+        poses = np.tile(np.eye(4), (len(trajectory), 1, 1))
+        poses[:, :3, :4] = trajectory
+
+        return poses @ calibration_matrix
+
+    @staticmethod
+    def read_points(filename: str, with_intensity: bool = False) -> np.ndarray:
+        """
+        Reads points of KITTI velodyne scan without copying
+
+        Parameters
+        ----------
+        filename: str
+            Path to `.bin` scan
+        with_intensity: bool
+            If it is specified, intensity of every point is read as the fourth column
+
+        Returns
+        -------
+        points: np.ndarray
+            Read-only memory-mapped view of points (and intensities)
+        """
+        if os.path.getsize(filename) == 0:
+            return np.empty((0, 4 if with_intensity else 3), dtype=np.float32)
+
+        scan = np.memmap(filename, dtype=np.float32, mode="r").reshape(-1, 4)
+
+        return scan if with_intensity else scan[:, :3]
+
+    @staticmethod
+    def read_point_cloud(filename: str) -> o3d.geometry.PointCloud:
+        """
+        Reads point cloud from KITTI velodyne scan
+        """
+        return o3d.geometry.PointCloud(
+            o3d.utility.Vector3dVector(
+                KittiVelodyneReader.read_points(filename).astype(float)
+            )
+        )
+
+    def read_scan(
+        self, dataset_path: str, scan_number: int
+    ) -> Tuple[ArrayNx3[float], Array4x4[float]]:
+        """
+        Reads points of `velodyne/{scan_number:06d}.bin` and pose of scan from trajectory of sequence
+
+        Parameters
+        ----------
+        dataset_path: str
+            Path to sequence directory
+        scan_number: int
+            Number of scan to read
+
+        Returns
+        -------
+        scan: Tuple[ArrayNx3[float], Array4x4[float]]
+            Memory-mapped view of points in local coordinates and pose of scan
+        """
+        if dataset_path not in self.__poses:
+            self.__poses[dataset_path] = self.read_poses(
+                os.path.join(dataset_path, self.__poses_filename)
+            )
+
+        points = self.read_points(self.scan_path(dataset_path, scan_number))
+
+        return points, self.__poses[dataset_path][scan_number].copy()
+
+    @staticmethod
+    def scan_path(dataset_path: str, scan_number: int) -> str:
+        """
+        Returns path to velodyne scan of sequence
+        """
+        return os.path.join(dataset_path, "velodyne", f"{scan_number:06d}.bin")
@@ -0,0 +1,208 @@
+import numpy as np
+import open3d as o3d
+
+import mmap
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Tuple
+
+from sova.typing import Array4x4, ArrayNx3, ArrayNx4x4
+from sova.utils.dataset_reader.reader import DatasetReader
+
+__all__ = ["ScanCacheStatistics", "LRUCachedReader"]
+
+
+@dataclass
+class ScanCacheStatistics:
+    """
+    Represents counters of scan cache
+
+    Parameters
+    ----------
+    hits: int
+        Number of scans served from cache
+    misses: int
+        Number of scans read by original reader
+    evictions: int
+        Number of scans evicted from cache to fit new ones
+    bytes: int
+        Size of cached points and poses in bytes
+    scans: int
+        Number of cached scans
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    bytes: int = 0
+    scans: int = 0
+
+
+class LRUCachedReader(DatasetReader):
+    """
+    Represents reader which keeps recently read scans in memory of current process, so scans read
+    again by the same process (debug views of patch, repeated runs and sweeps) aren't decoded
+    again. Cache is bounded by size of points and poses in bytes: least recently used scans are
+    evicted until new scan fits, scans larger than the whole cache aren't cached. Memory-mapped
+    points (for example, read by CachedReader or KittiVelodyneReader) aren't held in memory,
+    so only their poses are counted. Cache is thread-safe, so it is shared by threads of
+    `read_patch` and by background reading of patches.
+
+    Cache isn't shared by processes: cached scans aren't pickled, so every worker process of
+    PatchRunner starts with its own empty cache. Patches of PatchRunner don't overlap, so within
+    one run cache gets hits only if scans are read again in the same process, use CachedReader
+    to share decoded scans between processes.
+
+    Parameters
+    ----------
+    dataset_reader: DatasetReader
+        Reader of dataset, which reads scans missing in cache
+    max_bytes: int
+        Maximum size of cached points and poses in bytes
+    """
+
+    def __init__(self, dataset_reader: DatasetReader, max_bytes: int) -> None:
+        if max_bytes < 0:
+            raise ValueError("Size of cache must be non-negative")
+
+        self.__dataset_reader: DatasetReader = dataset_reader
+        self.__max_bytes: int = max_bytes
+        self.__init_cache()
+
+    def __getstate__(self) -> dict:
+        """
+        Cached scans and lock aren't pickled, unpickled reader starts with empty cache
+        """
+        return {
+            "dataset_reader": self.__dataset_reader,
+            "max_bytes": self.__max_bytes,
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dataset_reader = state["dataset_reader"]
+        self.__max_bytes = state["max_bytes"]
+        self.__init_cache()
+
+    @property
+    def statistics(self) -> ScanCacheStatistics:
+        """
+        Represents snapshot of cache counters
+
+        Returns
+        -------
+        statistics: ScanCacheStatistics
+            Counters of cache
+        """
+        with self.__lock:
+            return ScanCacheStatistics(
+                hits=self.__hits,
+                misses=self.__misses,
+                evictions=self.__evictions,
+                bytes=self.__bytes,
+                scans=len(self.__scans),
+            )
+
+    def clear(self) -> None:
+        """
+        Removes all cached scans. Counters are kept
+        """
+        with self.__lock:
+            self.__scans.clear()
+            self.__bytes = 0
+
+    def read_pose(self, filename: str) -> ArrayNx4x4[float]:
+        """
+        Reads pose file using original reader
+        """
+        return self.__dataset_reader.read_pose(filename)
+
+    def read_point_cloud(self, filename: str) -> o3d.geometry.PointCloud:
+        """
+        Reads point cloud file using original reader
+        """
+        return self.__dataset_reader.read_point_cloud(filename)
+
+    def read_scan(
+        self, dataset_path: str, scan_number: int
+    ) -> Tuple[ArrayNx3[float], Array4x4[float]]:
+        """
+        Reads points and pose of scan from cache or by original reader
+
+        Parameters
+        ----------
+        dataset_path: str
+            Path to dataset directory
+        scan_number: int
+            Number of scan to read
+
+        Returns
+        -------
+        scan: Tuple[ArrayNx3[float], Array4x4[float]]
+            Read-only points in local coordinates and pose of scan
+        """
+        key = (dataset_path, scan_number)
+        with self.__lock:
+            if key in self.__scans:
+                self.__hits += 1
+                self.__scans.move_to_end(key)
+                points, pose, _ = self.__scans[key]
+
+                return points, pose.copy()
+            self.__misses += 1
+
+        # Scan is read without lock, so other scans are read concurrently
+        point_cloud, pose = self.__dataset_reader.read_scan(dataset_path, scan_number)
+        points = (
+            np.array(point_cloud.points)
+            if isinstance(point_cloud, o3d.geometry.PointCloud)
+            else np.asarray(point_cloud).view()
+        )
+        points.setflags(write=False)
+        pose = np.array(pose, dtype=float)
+
+        size = pose.nbytes + (0 if _is_memory_mapped(points) else points.nbytes)
+        with self.__lock:
+            if size <= self.__max_bytes and key not in self.__scans:
+                while self.__bytes + size > self.__max_bytes:
+                    _, (_, _, evicted_size) = self.__scans.popitem(last=False)
+                    self.__bytes -= evicted_size
+                    self.__evictions += 1
+                self.__scans[key] = (points, pose, size)
+                self.__bytes += size
+
+        return points, pose.copy()
+
+    def __init_cache(self) -> None:
+        """
+        Creates empty cache, its counters and lock
+        """
+        self.__lock: threading.Lock = threading.Lock()
+        self.__scans: OrderedDict = OrderedDict()
+        self.__bytes: int = 0
+        self.__hits: int = 0
+        self.__misses: int = 0
+        self.__evictions: int = 0
+
+
+def _is_memory_mapped(points: np.ndarray) -> bool:
+    """
+    Checks whether array is a view of memory-mapped file, so its data isn't held in memory
+
+    Parameters
+    ----------
+    points: np.ndarray
+        Array to check
+
+    Returns
+    -------
+    memory_mapped: bool
+        True if array or one of its bases is memory-mapped
+    """
+    base = points
+    while isinstance(base, np.ndarray):
+        if isinstance(base, np.memmap):
+            return True
+        base = base.base
+
+    return isinstance(base, mmap.mmap)
@@ -1,8 +1,12 @@
+import numpy as np
 import open3d as o3d
 
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Tuple
 
-from sova.typing import ArrayNx4x4
+from sova.typing import Array4x4, ArrayNx3, ArrayNx4x4
 
 __all__ = ["DatasetReader"]
 
@@ -27,3 +31,105 @@ class DatasetReader(ABC):
         Represents abstract static method for reading point cloud file by given path
         """
         pass
+
+    def read_scan(
+        self, dataset_path: str, scan_number: int
+    ) -> Tuple[o3d.geometry.PointCloud, Array4x4[float]]:
+        """
+        Reads point cloud and its pose from `clouds/{scan_number}.pcd` and `poses/{scan_number}.txt`
+        of dataset directory
+
+        Parameters
+        ----------
+        dataset_path: str
+            Path to dataset directory
+        scan_number: int
+            Number of scan to read
+
+        Returns
+        -------
+        scan: Tuple[o3d.geometry.PointCloud, Array4x4[float]]
+            Point cloud in local coordinates and its pose
+        """
+        point_cloud = self.read_point_cloud(
+            os.path.join(dataset_path, "clouds", f"{scan_number}.pcd")
+        )
+        pose = self.read_pose(os.path.join(dataset_path, "poses", f"{scan_number}.txt"))
+
+        return point_cloud, pose
+
+    def read_scans(
+        self, dataset_path: str, start: int, end: int
+    ) -> Iterator[Tuple[o3d.geometry.PointCloud, Array4x4[float]]]:
+        """
+        Lazily reads scans of dataset one by one, so only requested scans are kept in memory
+
+        Parameters
+        ----------
+        dataset_path: str
+            Path to dataset directory
+        start: int
+            Number of the first scan (inclusive)
+        end: int
+            Number of the last scan (exclusive)
+
+        Returns
+        -------
+        scans: Iterator[Tuple[o3d.geometry.PointCloud, Array4x4[float]]]
+            Point clouds in local coordinates and their poses
+        """
+        for scan_number in range(start, end):
+            yield self.read_scan(dataset_path, scan_number)
+
+    def read_patch(
+        self,
+        dataset_path: str,
+        start: int,
+        end: int,
+        workers_number: Optional[int] = None,
+    ) -> Tuple[List[ArrayNx3[float]], ArrayNx4x4[float]]:
+        """
+        Reads scans of patch concurrently in the pool of threads. Decoding of point clouds
+        (Open3D, NumPy file reading) releases GIL, so scans are read in parallel
+
+        Parameters
+        ----------
+        dataset_path: str
+            Path to dataset directory
+        start: int
+            Number of the first scan (inclusive)
+        end: int
+            Number of the last scan (exclusive)
+        workers_number: Optional[int]
+            Number of threads. Number of processors is used if it is not specified
+
+        Returns
+        -------
+        patch: Tuple[List[ArrayNx3[float]], ArrayNx4x4[float]]
+            Points of scans in local coordinates and their poses in the order of scans
+        """
+        if workers_number is not None and workers_number < 1:
+            raise ValueError("Number of workers must be positive")
+
+        scan_numbers = range(start, end)
+        if len(scan_numbers) == 0:
+            return [], np.empty((0, 4, 4))
+
+        workers_number = min(workers_number or os.cpu_count() or 1, len(scan_numbers))
+        with ThreadPoolExecutor(workers_number) as executor:
+            scans = list(
+                executor.map(
+                    lambda scan_number: self.read_scan(dataset_path, scan_number),
+                    scan_numbers,
+                )
+            )
+
+        # Points of Open3D point clouds are taken as views without copying
+        points = [
+            np.asarray(point_cloud.points)
+            if isinstance(point_cloud, o3d.geometry.PointCloud)
+            else np.asarray(point_cloud)
+            for point_cloud, _ in scans
+        ]
+
+        return points, np.array([pose for _, pose in scans], dtype=float)
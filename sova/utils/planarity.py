@@ -0,0 +1,168 @@
+import numpy as np
+
+from typing import List, Tuple
+
+from sova.typing import ArrayNx3, ArrayNx3x3
+
+__all__ = [
+    "voxel_moments",
+    "standardize_scatters",
+    "scatter_eigenvalues",
+    "standardized_covariances",
+    "covariance_eigenvalues",
+]
+
+
+def voxel_moments(
+    voxels_points: List[ArrayNx3[float]],
+) -> Tuple[np.ndarray, ArrayNx3[float], ArrayNx3x3[float]]:
+    """
+    Computes number of points, mean and scatter (sum of outer products of centered points)
+    of many voxels at once by segmented sums over stacked points of all voxels
+
+    Parameters
+    ----------
+    voxels_points: List[ArrayNx3[float]]
+        Points of every voxel
+
+    Returns
+    -------
+    moments: Tuple[np.ndarray, ArrayNx3[float], ArrayNx3x3[float]]
+        Number of points, mean and scatter of every voxel. Means and scatters of voxels
+        without points are zeros
+    """
+    counts = np.array([len(points) for points in voxels_points], dtype=int)
+    means = np.zeros((len(voxels_points), 3))
+    scatters = np.zeros((len(voxels_points), 3, 3))
+    is_valid = counts > 0
+    if not np.any(is_valid):
+        return counts, means, scatters
+
+    valid_counts = counts[is_valid]
+    points = np.vstack(
+        [
+            np.asarray(voxel_points, dtype=float).reshape(-1, 3)
+            for voxel_points, is_voxel_valid in zip(voxels_points, is_valid)
+            if is_voxel_valid
+        ]
+    )
+    starts = np.concatenate([[0], np.cumsum(valid_counts)[:-1]])
+
+    # Points are centered before products are summed, so large coordinates don't lose precision
+    valid_means = np.add.reduceat(points, starts) / valid_counts[:, np.newaxis]
+    centered_points = points - np.repeat(valid_means, valid_counts, axis=0)
+    means[is_valid] = valid_means
+    scatters[is_valid] = np.add.reduceat(
+        centered_points[:, :, np.newaxis] * centered_points[:, np.newaxis, :], starts
+    )
+
+    return counts, means, scatters
+
+
+def standardize_scatters(
+    counts: np.ndarray, scatters: ArrayNx3x3[float]
+) -> ArrayNx3x3[float]:
+    """
+    Converts scatters of many voxels into covariance matrices of points standardized
+    by their mean and standard deviation, which PCA of standardized points decomposes
+
+    Parameters
+    ----------
+    counts: np.ndarray
+        Number of points of every voxel
+    scatters: ArrayNx3x3[float]
+        Sum of outer products of centered points of every voxel
+
+    Returns
+    -------
+    covariances: ArrayNx3x3[float]
+        Covariance matrix of every voxel. Matrices of voxels with less than two points
+        or with zero deviation along some axis can't be standardized and are filled with NaN
+    """
+    counts = np.asarray(counts, dtype=int)
+    scatters = np.asarray(scatters, dtype=float).reshape(-1, 3, 3)
+    deviations = np.sqrt(
+        np.diagonal(scatters, axis1=1, axis2=2) / np.maximum(counts, 1)[:, np.newaxis]
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        covariances = (
+            scatters
+            / (counts - 1)[:, np.newaxis, np.newaxis]
+            / deviations[:, :, np.newaxis]
+            / deviations[:, np.newaxis, :]
+        )
+    covariances[(counts < 2) | ~np.all(deviations > 0, axis=1)] = np.nan
+
+    return covariances
+
+
+def scatter_eigenvalues(
+    counts: np.ndarray, scatters: ArrayNx3x3[float]
+) -> ArrayNx3[float]:
+    """
+    Computes eigenvalues of standardized covariance matrices of many voxels by single stacked
+    `np.linalg.eigvalsh` call. They are equal to explained variance of PCA fitted on standardized points.
+
+    Parameters
+    ----------
+    counts: np.ndarray
+        Number of points of every voxel
+    scatters: ArrayNx3x3[float]
+        Sum of outer products of centered points of every voxel
+
+    Returns
+    -------
+    eigenvalues: ArrayNx3[float]
+        Non-negative eigenvalues of every voxel in ascending order. Eigenvalues of voxels
+        which can't be standardized are NaN
+    """
+    covariances = standardize_scatters(counts, scatters)
+    eigenvalues = np.full((len(covariances), 3), np.nan)
+    is_valid = np.all(np.isfinite(covariances), axis=(1, 2))
+    if np.any(is_valid):
+        # Rounding errors may produce tiny negative eigenvalues of degenerate matrices
+        eigenvalues[is_valid] = np.maximum(np.linalg.eigvalsh(covariances[is_valid]), 0)
+
+    return eigenvalues
+
+
+def standardized_covariances(
+    voxels_points: List[ArrayNx3[float]],
+) -> ArrayNx3x3[float]:
+    """
+    Computes covariance matrices of standardized points of many voxels at once, see `standardize_scatters`
+
+    Parameters
+    ----------
+    voxels_points: List[ArrayNx3[float]]
+        Points of every voxel
+
+    Returns
+    -------
+    covariances: ArrayNx3x3[float]
+        Covariance matrix of every voxel (filled with NaN if it can't be standardized)
+    """
+    counts, _, scatters = voxel_moments(voxels_points)
+
+    return standardize_scatters(counts, scatters)
+
+
+def covariance_eigenvalues(voxels_points: List[ArrayNx3[float]]) -> ArrayNx3[float]:
+    """
+    Computes eigenvalues of standardized covariance matrices of many voxels at once,
+    see `scatter_eigenvalues`
+
+    Parameters
+    ----------
+    voxels_points: List[ArrayNx3[float]]
+        Points of every voxel
+
+    Returns
+    -------
+    eigenvalues: ArrayNx3[float]
+        Non-negative eigenvalues of every voxel in ascending order (NaN if they can't be computed)
+    """
+    counts, _, scatters = voxel_moments(voxels_points)
+
+    return scatter_eigenvalues(counts, scatters)
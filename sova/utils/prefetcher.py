@@ -0,0 +1,101 @@
+import queue
+import threading
+from typing import Generic, Iterable, Iterator, Optional, Tuple, TypeVar
+
+__all__ = ["Prefetcher"]
+
+Item = TypeVar("Item")
+
+# Marks the end of prefetched iterable in the queue
+_END = object()
+
+
+class Prefetcher(Generic[Item]):
+    """
+    Represents iterator which reads items of given iterable in background thread, so reading of next items
+    (for example, point clouds and poses by DatasetReader.read_scans) overlaps with processing of the current one.
+    Background thread stops when `size` items are waiting in the queue, so at most `size + 1` items
+    are read ahead. Exceptions raised by iterable are re-raised on the consumer side.
+
+    Parameters
+    ----------
+    iterable: Iterable[Item]
+        Iterable to prefetch
+    size: int
+        Maximum number of items waiting in the queue
+    """
+
+    def __init__(self, iterable: Iterable[Item], size: int = 1) -> None:
+        if size < 1:
+            raise ValueError("Size of prefetch queue must be positive")
+
+        self._queue: queue.Queue = queue.Queue(maxsize=size)
+        self._stopped: threading.Event = threading.Event()
+        self._finished: bool = False
+        self._thread: threading.Thread = threading.Thread(
+            target=self.__fill, args=(iter(iterable),), daemon=True
+        )
+        self._thread.start()
+
+    def __iter__(self) -> Iterator[Item]:
+        return self
+
+    def __next__(self) -> Item:
+        if self._finished:
+            raise StopIteration
+
+        item, exception = self._queue.get()
+        if exception is not None:
+            self._finished = True
+            raise exception
+        if item is _END:
+            self._finished = True
+            raise StopIteration
+
+        return item
+
+    def __enter__(self) -> "Prefetcher[Item]":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Stops background thread. Items which haven't been read yet are dropped
+        """
+        self._finished = True
+        self._stopped.set()
+        self._thread.join()
+
+    def __fill(self, iterator: Iterator[Item]) -> None:
+        """
+        Reads items of iterator into the queue until it is exhausted or prefetcher is closed
+        """
+        try:
+            for item in iterator:
+                if not self.__put((item, None)):
+                    return
+        except Exception as exception:
+            self.__put((None, exception))
+            return
+
+        self.__put((_END, None))
+
+    def __put(self, item: Tuple[object, Optional[Exception]]) -> bool:
+        """
+        Puts item into the queue, waiting for free space while prefetcher is not closed
+
+        Returns
+        -------
+        put: bool
+            True if item was put, False if prefetcher was closed
+        """
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+
+        return False
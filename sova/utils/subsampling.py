@@ -0,0 +1,85 @@
+import numpy as np
+
+import math
+
+from sova.typing import ArrayNx3
+
+__all__ = ["uniform_subsample", "stratified_subsample"]
+
+
+def uniform_subsample(
+    points: ArrayNx3[float], count: int, random_generator: np.random.Generator
+) -> ArrayNx3[float]:
+    """
+    Chooses given number of points uniformly at random without replacement
+
+    Parameters
+    ----------
+    points: ArrayNx3[float]
+        Points to subsample
+    count: int
+        Maximum number of points to choose
+    random_generator: np.random.Generator
+        Random generator which chooses points
+
+    Returns
+    -------
+    points: ArrayNx3[float]
+        Chosen points in their original order. Given array is returned as is if it isn't larger than count
+    """
+    if len(points) <= count:
+        return points
+
+    return points[np.sort(random_generator.choice(len(points), count, replace=False))]
+
+
+def stratified_subsample(
+    points: ArrayNx3[float], count: int, random_generator: np.random.Generator
+) -> ArrayNx3[float]:
+    """
+    Chooses given number of points spread over the space they occupy: bounding box of points is split
+    into cubic cells (about `count` cells cover planar points) and points are taken from every occupied cell
+    in turn, so dense parts of scan don't outweigh sparse ones
+
+    Parameters
+    ----------
+    points: ArrayNx3[float]
+        Points to subsample
+    count: int
+        Maximum number of points to choose
+    random_generator: np.random.Generator
+        Random generator which chooses points inside cells and order of cells
+
+    Returns
+    -------
+    points: ArrayNx3[float]
+        Chosen points in their original order. Given array is returned as is if it isn't larger than count
+    """
+    if len(points) <= count:
+        return points
+
+    points = np.asarray(points)
+    order = random_generator.permutation(len(points))
+    min_bound = points.min(axis=0)
+    extent = np.max(points.max(axis=0) - min_bound)
+    edge_length = extent / math.sqrt(count) if extent > 0 else 1.0
+
+    cells = np.floor((points[order] - min_bound) / edge_length).astype(np.int64)
+    cells_numbers = cells.max(axis=0) + 1
+    keys = (cells[:, 0] * cells_numbers[1] + cells[:, 1]) * cells_numbers[2] + cells[
+        :, 2
+    ]
+
+    # Rank of point among points of its cell in random order
+    sorting = np.argsort(keys, kind="stable")
+    sorted_keys = keys[sorting]
+    is_first = np.ones(len(keys), dtype=bool)
+    is_first[1:] = sorted_keys[1:] != sorted_keys[:-1]
+    first_indices = np.maximum.accumulate(np.where(is_first, np.arange(len(keys)), 0))
+    ranks = np.empty(len(keys), dtype=np.int64)
+    ranks[sorting] = np.arange(len(keys)) - first_indices
+
+    # Points of lower ranks are taken first, points of the same rank are taken in random order
+    chosen = np.lexsort((np.arange(len(keys)), ranks))[:count]
+
+    return points[np.sort(order[chosen])]
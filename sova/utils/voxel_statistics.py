@@ -0,0 +1,267 @@
+import numpy as np
+
+from typing import List, Optional
+
+from sova.typing import Array3, Array3x3, ArrayNx3
+from sova.utils.planarity import (
+    scatter_eigenvalues,
+    standardize_scatters,
+    voxel_moments,
+)
+
+__all__ = ["VoxelStatistics"]
+
+
+class VoxelStatistics:
+    """
+    Represents sufficient statistics of points of voxel: number of points, their sum, sum of outer products
+    and bounding box. Statistics are updated incrementally by points of every pose and statistics of
+    different poses (or voxels) are merged without points, so covariance-based decisions of subdividers,
+    segmenters and backends are made in O(1) per voxel.
+    Scatter is stored around the mean and merged by Chan's formula, so large coordinates don't lose precision.
+    Statistics of many voxels are built by `batch`, which decomposes covariances of all voxels at once.
+
+    Parameters
+    ----------
+    points: Optional[ArrayNx3[float]]
+        Initial points of voxel. Statistics are empty if they are not specified
+    """
+
+    def __init__(self, points: Optional[ArrayNx3[float]] = None) -> None:
+        self.__count: int = 0
+        self.__mean: Array3[float] = np.zeros(3)
+        self.__scatter: Array3x3[float] = np.zeros((3, 3))
+        self.__min_bound: Array3[float] = np.full(3, np.inf)
+        self.__max_bound: Array3[float] = np.full(3, -np.inf)
+        # Eigenvalues are decomposed once after statistics are changed
+        self.__eigenvalues: Optional[Array3[float]] = None
+
+        if points is not None:
+            self.add_points(points)
+
+    @staticmethod
+    def batch(voxels_points: List[ArrayNx3[float]]) -> List["VoxelStatistics"]:
+        """
+        Builds statistics of many voxels at once: moments are computed by segmented sums
+        over points of all voxels and eigenvalues by single stacked decomposition
+
+        Parameters
+        ----------
+        voxels_points: List[ArrayNx3[float]]
+            Points of every voxel
+
+        Returns
+        -------
+        statistics: List[VoxelStatistics]
+            Statistics of every voxel
+        """
+        counts, means, scatters = voxel_moments(voxels_points)
+        eigenvalues = scatter_eigenvalues(counts, scatters)
+
+        voxels_statistics = []
+        for voxel_points, count, mean, scatter, voxel_eigenvalues in zip(
+            voxels_points, counts.tolist(), means, scatters, eigenvalues
+        ):
+            statistics = VoxelStatistics()
+            if count > 0:
+                voxel_points = np.asarray(voxel_points, dtype=float).reshape(-1, 3)
+                statistics.__update(
+                    count,
+                    mean,
+                    scatter,
+                    voxel_points.min(axis=0),
+                    voxel_points.max(axis=0),
+                )
+            statistics.__eigenvalues = voxel_eigenvalues
+            voxels_statistics.append(statistics)
+
+        return voxels_statistics
+
+    @property
+    def count(self) -> int:
+        """
+        Returns number of points
+        """
+        return self.__count
+
+    @property
+    def sum(self) -> Array3[float]:
+        """
+        Returns sum of points
+        """
+        return self.__mean * self.__count
+
+    @property
+    def mean(self) -> Array3[float]:
+        """
+        Returns mean of points (zeros if there are no points)
+        """
+        return self.__mean.copy()
+
+    @property
+    def scatter(self) -> Array3x3[float]:
+        """
+        Returns sum of outer products of points centered by their mean
+        """
+        return self.__scatter.copy()
+
+    @property
+    def outer_products_sum(self) -> Array3x3[float]:
+        """
+        Returns sum of outer products of points
+        """
+        return self.__scatter + self.__count * np.outer(self.__mean, self.__mean)
+
+    @property
+    def min_bound(self) -> Array3[float]:
+        """
+        Returns minimum corner of bounding box of points (infinite if there are no points)
+        """
+        return self.__min_bound.copy()
+
+    @property
+    def max_bound(self) -> Array3[float]:
+        """
+        Returns maximum corner of bounding box of points (infinite if there are no points)
+        """
+        return self.__max_bound.copy()
+
+    @property
+    def covariance(self) -> Array3x3[float]:
+        """
+        Returns sample covariance matrix of points. It is filled with NaN if there are less than two points
+        """
+        if self.__count < 2:
+            return np.full((3, 3), np.nan)
+
+        return self.__scatter / (self.__count - 1)
+
+    @property
+    def standardized_covariance(self) -> Array3x3[float]:
+        """
+        Returns covariance matrix of points standardized by their mean and standard deviation
+        (the same as sova.utils.standardized_covariances computes). It is filled with NaN
+        if there are less than two points or deviation along some axis is zero
+        """
+        return standardize_scatters(
+            np.array([self.__count]), self.__scatter[np.newaxis]
+        )[0]
+
+    @property
+    def eigenvalues(self) -> Array3[float]:
+        """
+        Returns non-negative eigenvalues of standardized covariance matrix in ascending order.
+        They are NaN if covariance can't be standardized
+        """
+        if self.__eigenvalues is None:
+            self.__eigenvalues = scatter_eigenvalues(
+                np.array([self.__count]), self.__scatter[np.newaxis]
+            )[0]
+
+        return self.__eigenvalues.copy()
+
+    def equivalent_points(self, points_number: int) -> ArrayNx3[float]:
+        """
+        Builds small set of points with the same mean and covariance (scatter divided by number of points).
+        Points are pairs placed symmetrically around the mean along every principal axis (and the rest
+        of points is placed at the mean), so their sum of homogeneous outer products is exactly
+        `points_number / count` times the one of original points
+
+        Parameters
+        ----------
+        points_number: int
+            Number of equivalent points. It must be at least six
+
+        Returns
+        -------
+        points: ArrayNx3[float]
+            Equivalent points
+        """
+        if points_number < 6:
+            raise ValueError("Number of equivalent points must be at least six")
+        if self.__count == 0:
+            raise ValueError("Statistics of empty voxel have no equivalent points")
+
+        sets_number = points_number // 6
+        eigenvalues, eigenvectors = np.linalg.eigh(self.__scatter)
+        # Pair of points at distance a from the mean adds 2 a^2 to the scatter along its axis
+        offsets = eigenvectors * np.sqrt(
+            points_number
+            * np.maximum(eigenvalues, 0)
+            / (2 * sets_number * self.__count)
+        )
+        points = self.__mean + np.vstack([offsets.T, -offsets.T])
+
+        return np.vstack(
+            [
+                np.tile(points, (sets_number, 1)),
+                np.tile(self.__mean, (points_number % 6, 1)),
+            ]
+        )
+
+    def add_points(self, points: ArrayNx3[float]) -> None:
+        """
+        Updates statistics by new points
+
+        Parameters
+        ----------
+        points: ArrayNx3[float]
+            Points to add
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        if len(points) == 0:
+            return
+
+        mean = points.mean(axis=0)
+        centered_points = points - mean
+        self.__update(
+            len(points),
+            mean,
+            centered_points.T @ centered_points,
+            points.min(axis=0),
+            points.max(axis=0),
+        )
+
+    def merge(self, statistics: "VoxelStatistics") -> None:
+        """
+        Updates statistics by statistics of other points (for example, points of other pose)
+
+        Parameters
+        ----------
+        statistics: VoxelStatistics
+            Statistics to merge
+        """
+        self.__update(
+            statistics.count,
+            statistics.mean,
+            statistics.scatter,
+            statistics.min_bound,
+            statistics.max_bound,
+        )
+
+    def __update(
+        self,
+        count: int,
+        mean: Array3[float],
+        scatter: Array3x3[float],
+        min_bound: Array3[float],
+        max_bound: Array3[float],
+    ) -> None:
+        """
+        Combines statistics with statistics of other points
+        """
+        if count == 0:
+            return
+
+        total_count = self.__count + count
+        delta = mean - self.__mean
+        self.__scatter = (
+            self.__scatter
+            + scatter
+            + np.outer(delta, delta) * self.__count * count / total_count
+        )
+        self.__mean = self.__mean + delta * count / total_count
+        self.__count = total_count
+        self.__min_bound = np.minimum(self.__min_bound, min_bound)
+        self.__max_bound = np.maximum(self.__max_bound, max_bound)
+        self.__eigenvalues = None
@@ -0,0 +1,99 @@
+import mrob
+import numpy as np
+import open3d as o3d
+import pytest
+from octreelib.grid import Grid, GridConfig
+
+import os
+from typing import Callable, List, Union
+
+from sova.typing import ArrayNx3, ArrayNx4x4
+from sova.utils import OptimisedPoseReadWriter
+
+
+@pytest.fixture
+def three_planes() -> Callable[..., np.ndarray]:
+    """
+    Returns generator of points of three orthogonal planes (x = 0.5, y = 0.5 and z = 0.5)
+    inside cube with edge 4. Every plane has a third of points, extra columns (for example,
+    intensity) are uniform too
+    """
+
+    def generate(
+        random_generator: np.random.Generator,
+        points_number: int = 300,
+        columns_number: int = 3,
+    ) -> np.ndarray:
+        points = random_generator.uniform(0, 4, (points_number, columns_number))
+        first_end, second_end = points_number // 3, 2 * points_number // 3
+        points[:first_end, 0] = 0.5
+        points[first_end:second_end, 1] = 0.5
+        points[second_end:, 2] = 0.5
+
+        return points
+
+    return generate
+
+
+@pytest.fixture
+def planar_grid() -> Callable[..., Grid]:
+    """
+    Returns builder of grid with unit voxels and three orthogonal planes of poses,
+    every voxel has the same number of points of the pose
+    """
+
+    def build(points_per_voxel: Union[int, List[int]], perturbation: float = 0) -> Grid:
+        random_generator = np.random.default_rng(0)
+        grid = Grid(GridConfig(voxel_edge_length=1))
+        if isinstance(points_per_voxel, int):
+            points_per_voxel = [points_per_voxel] * 3
+        for pose_number, pose_points_per_voxel in enumerate(points_per_voxel):
+            points = []
+            for u in range(2):
+                for v in range(2):
+                    voxel_points = random_generator.uniform(
+                        0.1, 0.9, (pose_points_per_voxel, 3)
+                    )
+                    voxel_points[:, :2] += [u, v]
+                    voxel_points[:, 2] = 0.5
+                    points.append(voxel_points)
+                    points.append(voxel_points[:, [2, 0, 1]] + [3, 0, 0])
+                    points.append(voxel_points[:, [0, 2, 1]] + [0, 3, 0])
+            points = np.vstack(points) + random_generator.normal(
+                0, 0.01, (len(points) * pose_points_per_voxel, 3)
+            )
+            pose = mrob.geometry.SE3(random_generator.normal(0, perturbation, 6)).T()
+            grid.insert_points(pose_number, points @ pose[:3, :3].T + pose[:3, 3])
+
+        return grid
+
+    return build
+
+
+@pytest.fixture
+def write_hilti_dataset() -> Callable[
+    [str, List[ArrayNx3[float]], ArrayNx4x4[float]], str
+]:
+    """
+    Returns writer of dataset in Hilti layout: `clouds/{n}.pcd` and `poses/{n}.txt`
+    """
+
+    def write(
+        dataset_path: str,
+        point_clouds: List[ArrayNx3[float]],
+        poses: ArrayNx4x4[float],
+    ) -> str:
+        os.makedirs(os.path.join(dataset_path, "clouds"))
+        os.makedirs(os.path.join(dataset_path, "poses"))
+        for scan_number, (points, pose) in enumerate(zip(point_clouds, poses)):
+            o3d.io.write_point_cloud(
+                os.path.join(dataset_path, "clouds", f"{scan_number}.pcd"),
+                o3d.geometry.PointCloud(o3d.utility.Vector3dVector(points)),
+            )
+            OptimisedPoseReadWriter.write(
+                os.path.join(dataset_path, "poses", f"{scan_number}.txt"), pose
+            )
+
+        return str(dataset_path)
+
+    return write
@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+from sova.utils import CachedReader, HiltiReader
+
+
+class CountingReader(HiltiReader):
+    def __init__(self):
+        self.scans_number = 0
+
+    def read_scan(self, dataset_path: str, scan_number: int):
+        scan = super().read_scan(dataset_path, scan_number)
+        self.scans_number += 1
+        return scan
+
+
+@pytest.fixture
+def dataset_path(tmp_path, write_hilti_dataset) -> str:
+    random_generator = np.random.default_rng(0)
+    poses = np.tile(np.eye(4), (4, 1, 1))
+    poses[:, :3, 3] = random_generator.uniform(-10, 10, (4, 3))
+
+    return write_hilti_dataset(
+        str(tmp_path / "dataset"),
+        [
+            random_generator.uniform(-10, 10, (points_number, 3))
+            for points_number in [100, 1, 37, 250]
+        ],
+        poses,
+    )
+
+
+@pytest.mark.parametrize("cache_directory", [None, "store"])
+def test_cached_reader(dataset_path: str, cache_directory, tmp_path):
+    cache_path = None if cache_directory is None else str(tmp_path / cache_directory)
+    counting_reader = CountingReader()
+    reader = CachedReader(counting_reader, cache_path)
+
+    scans = list(reader.read_scans(dataset_path, 0, 4))
+
+    assert counting_reader.scans_number == 4
+    assert os.path.isdir(reader.cache_path(dataset_path))
+    for scan_number, (points, pose) in enumerate(scans):
+        expected_point_cloud, expected_pose = HiltiReader().read_scan(
+            dataset_path, scan_number
+        )
+        assert np.allclose(points, np.asarray(expected_point_cloud.points), atol=1e-5)
+        assert np.allclose(pose, expected_pose)
+        assert points.dtype == np.float32
+        assert not points.flags.writeable
+
+    # Store is built once and reused by other readers, including unpickled ones
+    counting_reader = CountingReader()
+    reader = CachedReader(counting_reader, cache_path)
+    for reused_reader in [reader, pickle.loads(pickle.dumps(reader))]:
+        points, _ = reused_reader.read_scan(dataset_path, 3)
+        assert isinstance(points, np.memmap)
+        assert np.array_equal(points, scans[3][0])
+    assert counting_reader.scans_number == 0
+
+
+def test_cached_reader_missing_scan(dataset_path: str):
+    with pytest.raises(ValueError):
+        CachedReader(HiltiReader()).read_scan(dataset_path, 4)
+
+
+def test_cached_reader_concurrent_build(dataset_path: str, tmp_path):
+    cache_path = str(tmp_path / "store")
+    readers = [CachedReader(HiltiReader(), cache_path) for _ in range(4)]
+
+    # Threads of every reader and different readers (like processes) build the same store at once
+    with ThreadPoolExecutor(4) as executor:
+        patches = list(
+            executor.map(
+                lambda reader: reader.read_patch(dataset_path, 0, 4, 8), readers
+            )
+        )
+
+    expected_points, expected_poses = HiltiReader().read_patch(dataset_path, 0, 4)
+    for points, poses in patches:
+        assert np.allclose(poses, expected_poses)
+        for scan_points, expected_scan_points in zip(points, expected_points):
+            assert np.allclose(scan_points, expected_scan_points, atol=1e-5)
+    assert sorted(os.listdir(tmp_path)) == ["dataset", "store"]
+
+
+class ArrayReader(HiltiReader):
+    def read_scan(self, dataset_path: str, scan_number: int):
+        point_cloud, pose = super().read_scan(dataset_path, scan_number)
+        return np.asarray(point_cloud.points), pose
+
+
+def test_cached_reader_array_scans(dataset_path: str):
+    reader = CachedReader(ArrayReader())
+
+    points, pose = reader.read_scan(dataset_path, 2)
+
+    expected_points, expected_pose = ArrayReader().read_scan(dataset_path, 2)
+    assert np.allclose(points, expected_points, atol=1e-5)
+    assert np.array_equal(pose, expected_pose)
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from typing import Optional
+
+from sova.utils import HiltiReader
+
+
+@pytest.fixture
+def dataset_path(tmp_path, write_hilti_dataset) -> str:
+    random_generator = np.random.default_rng(0)
+    poses = np.tile(np.eye(4), (6, 1, 1))
+    poses[:, :3, 3] = random_generator.uniform(-10, 10, (6, 3))
+
+    return write_hilti_dataset(
+        str(tmp_path / "dataset"),
+        [
+            random_generator.uniform(-10, 10, (10 * scan_number + 1, 3))
+            for scan_number in range(6)
+        ],
+        poses,
+    )
+
+
+@pytest.mark.parametrize(
+    "start, end, workers_number",
+    [(0, 6, None), (1, 5, 1), (2, 6, 3), (3, 3, None)],
+)
+def test_read_patch(
+    dataset_path: str, start: int, end: int, workers_number: Optional[int]
+):
+    reader = HiltiReader()
+
+    points, poses = reader.read_patch(dataset_path, start, end, workers_number)
+
+    expected_scans = list(reader.read_scans(dataset_path, start, end))
+    assert len(points) == len(expected_scans)
+    assert poses.shape == (end - start, 4, 4)
+    for scan_points, pose, (expected_point_cloud, expected_pose) in zip(
+        points, poses, expected_scans
+    ):
+        assert np.array_equal(scan_points, np.asarray(expected_point_cloud.points))
+        assert np.array_equal(pose, expected_pose)
+
+
+def test_read_patch_incorrect_workers_number(dataset_path: str):
+    with pytest.raises(ValueError):
+        HiltiReader().read_patch(dataset_path, 0, 2, 0)
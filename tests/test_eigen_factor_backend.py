@@ -0,0 +1,242 @@
+import mrob
+import numpy as np
+import pytest
+
+from collections import defaultdict
+from typing import Optional
+
+from sova.backend import EigenFactorBackend
+from sova.filter import PlanarityFilter, PosesNumberFilter
+
+
+@pytest.fixture
+def weights_scale(monkeypatch) -> bool:
+    """
+    Lets backends compress points on mrob which ignores weights, where compression
+    scales the cost by the ratio instead of keeping it. Returns whether weights are ignored
+    """
+    ignores_weights = not EigenFactorBackend.honours_point_weights()
+    monkeypatch.setattr(
+        EigenFactorBackend, "honours_point_weights", staticmethod(lambda: True)
+    )
+
+    return ignores_weights
+
+
+@pytest.mark.parametrize("compression_ratio", [1, 5, 10])
+def test_compressed_eigen_factor_backend(
+    compression_ratio: int, planar_grid, weights_scale: bool
+):
+    expected_output = EigenFactorBackend(poses_number=3, iterations_number=100).process(
+        planar_grid(60)
+    )
+    actual_output = EigenFactorBackend(
+        poses_number=3, iterations_number=100, compression_ratio=compression_ratio
+    ).process(planar_grid(60))
+
+    # Moments of every voxel and pose are scaled by the same ratio, weights restore them
+    assert actual_output.metrics[0].value == pytest.approx(
+        expected_output.metrics[0].value / (compression_ratio if weights_scale else 1)
+    )
+    assert np.allclose(actual_output.poses, expected_output.poses, atol=1e-3)
+
+
+@pytest.mark.parametrize("compression_ratio", [1, 3, 10])
+def test_compressed_eigen_factor_backend_unequal_poses(
+    compression_ratio: int, planar_grid, weights_scale: bool
+):
+    # Poses have different numbers of points, the least one limits the ratio of voxels by 4
+    points_per_voxel = [60, 24, 96]
+    # Robust kernels depend on the scale of the cost, so the minimum is compared without them
+    expected_output = EigenFactorBackend(
+        poses_number=3, iterations_number=100, robust_type=mrob.QUADRATIC
+    ).process(planar_grid(points_per_voxel))
+    actual_output = EigenFactorBackend(
+        poses_number=3,
+        iterations_number=100,
+        robust_type=mrob.QUADRATIC,
+        compression_ratio=compression_ratio,
+    ).process(planar_grid(points_per_voxel))
+
+    assert actual_output.metrics[0].value == pytest.approx(
+        expected_output.metrics[0].value
+        / (min(compression_ratio, 4) if weights_scale else 1)
+    )
+    assert np.allclose(actual_output.poses, expected_output.poses, atol=1e-3)
+
+
+def test_compression_requires_point_weights(monkeypatch):
+    monkeypatch.setattr(
+        EigenFactorBackend, "honours_point_weights", staticmethod(lambda: False)
+    )
+
+    EigenFactorBackend(poses_number=1, iterations_number=1, compression_ratio=1)
+    with pytest.raises(ValueError):
+        EigenFactorBackend(poses_number=1, iterations_number=1, compression_ratio=5)
+
+
+def test_incorrect_compression_ratio():
+    with pytest.raises(ValueError):
+        EigenFactorBackend(poses_number=1, iterations_number=1, compression_ratio=0.5)
+
+
+@pytest.mark.parametrize(
+    "solve_attempts, time_budget, expected_attempts",
+    [
+        (3, None, 3),
+        (1, None, 1),
+        (100, 1e-9, 1),
+    ],
+)
+def test_bounded_solve(
+    solve_attempts: int,
+    time_budget: Optional[float],
+    expected_attempts: int,
+    planar_grid,
+):
+    grid = planar_grid(60, perturbation=0.05)
+    # Single LM iteration is not enough to converge
+    backend = EigenFactorBackend(
+        poses_number=3,
+        iterations_number=1,
+        solve_attempts=solve_attempts,
+        time_budget=time_budget,
+    )
+    output = backend.process(grid)
+
+    metrics = {metric.name: metric.value for metric in output.metrics}
+    assert not output.converged
+    assert metrics["Converged"] == 0
+    assert metrics["Solve attempts"] == expected_attempts
+    assert metrics["chi2"] <= metrics["FGraph initial error"]
+    assert len(output.poses) == 3
+
+
+class MaskedGraph:
+    """
+    Graph which provides robust mask (rejects all features after the second run)
+    and whose error grows after the second run
+    """
+
+    graph_type = mrob.FGraph
+
+    def __init__(self, robust_type: int) -> None:
+        self.graph = self.graph_type(robust_type)
+        self.runs_number = 0
+
+    def __getattr__(self, name: str):
+        return getattr(self.graph, name)
+
+    def solve(self, method: int, iterations_number: int) -> int:
+        self.graph.solve(method, iterations_number)
+        self.runs_number += 1
+        return 0
+
+    def chi2(self, evaluate: bool) -> float:
+        return [10.0, 5.0, 7.0][self.runs_number]
+
+    def get_eigen_factors_robust_mask(self):
+        is_rejected = self.runs_number == 2
+        return defaultdict(lambda: is_rejected)
+
+
+def test_unused_features_of_best_state(monkeypatch, planar_grid):
+    monkeypatch.setattr(mrob, "FGraph", MaskedGraph)
+
+    output = EigenFactorBackend(
+        poses_number=3, iterations_number=1, solve_attempts=2
+    ).process(planar_grid(60, perturbation=0.05))
+
+    # The first run has the least error, so features rejected by the second run are used
+    assert output.metrics[2].value == 5.0
+    assert output.unused_features == []
+
+    monkeypatch.setattr(
+        MaskedGraph, "chi2", lambda self, evaluate: 10.0 - self.runs_number
+    )
+    output = EigenFactorBackend(
+        poses_number=3, iterations_number=1, solve_attempts=2
+    ).process(planar_grid(60, perturbation=0.05))
+
+    # The last run has the least error, so all features are rejected
+    assert len(output.unused_features) > 0
+
+
+def test_initial_poses(planar_grid):
+    with pytest.raises(ValueError):
+        EigenFactorBackend(
+            poses_number=3, iterations_number=1, initial_poses=[np.eye(4)] * 2
+        )
+
+    backend = EigenFactorBackend(poses_number=3, iterations_number=100)
+    output = backend.process(planar_grid(60, perturbation=0.05))
+    # Backend builds new graph on every run, so the same backend is warm started by its output
+    backend.initial_poses = output.poses
+    warm_output = backend.process(planar_grid(60, perturbation=0.05))
+
+    assert warm_output.metrics[0].value == pytest.approx(output.metrics[2].value)
+
+
+# Capping is checked on mrob which ignores weights of points too, see test_max_points_warning
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+@pytest.mark.parametrize("subsampling", ["uniform", "stratified"])
+def test_subsampled_eigen_factor_backend(subsampling: str, planar_grid):
+    expected_output = EigenFactorBackend(poses_number=3, iterations_number=100).process(
+        planar_grid(60)
+    )
+    actual_output = EigenFactorBackend(
+        poses_number=3,
+        iterations_number=100,
+        max_points=20,
+        subsampling=subsampling,
+        seed=0,
+    ).process(planar_grid(60))
+
+    assert actual_output.converged
+    assert np.allclose(actual_output.poses, expected_output.poses, atol=1e-2)
+
+
+@pytest.mark.parametrize("honours_point_weights", [True, False])
+def test_max_points_warning(honours_point_weights: bool, monkeypatch, recwarn):
+    monkeypatch.setattr(
+        EigenFactorBackend,
+        "honours_point_weights",
+        staticmethod(lambda: honours_point_weights),
+    )
+
+    EigenFactorBackend(poses_number=1, iterations_number=1)
+    EigenFactorBackend(poses_number=1, iterations_number=1, max_points=20)
+
+    # Capping changes weights of voxels if mrob ignores weights of points
+    assert [warning.category for warning in recwarn] == (
+        [] if honours_point_weights else [RuntimeWarning]
+    )
+
+
+@pytest.mark.parametrize(
+    "max_points, subsampling",
+    [(2, "uniform"), (10, "voxel")],
+)
+def test_incorrect_subsampling(max_points: int, subsampling: str):
+    with pytest.raises(ValueError):
+        EigenFactorBackend(
+            poses_number=1,
+            iterations_number=1,
+            max_points=max_points,
+            subsampling=subsampling,
+        )
+
+
+def test_feature_filters(planar_grid):
+    output = EigenFactorBackend(poses_number=3, iterations_number=100).process(
+        planar_grid(60, perturbation=0.01)
+    )
+    # Six of twelve voxels are left, so the graph and its initial error are smaller
+    filtered_output = EigenFactorBackend(
+        poses_number=3,
+        iterations_number=100,
+        feature_filters=[PosesNumberFilter(3), PlanarityFilter(6)],
+    ).process(planar_grid(60, perturbation=0.01))
+
+    assert filtered_output.converged
+    assert filtered_output.metrics[0].value < output.metrics[0].value
@@ -0,0 +1,257 @@
+import numpy as np
+import pytest
+from octreelib.grid import Grid, GridConfig
+
+from typing import Callable, Type
+
+from sova.executor import Executor, ProcessExecutor, SerialExecutor, ThreadExecutor
+from sova.filter import EmptyVoxel
+from sova.grid import VoxelHashGrid
+from sova.segmenter import (
+    CAPESegmenter,
+    CountSegmenter,
+    NumpyRansacSegmenter,
+    SegmenterChain,
+)
+from sova.subdivider import (
+    CountSubdivider,
+    EigenValueSubdivider,
+    SizeSubdivider,
+    Subdivider,
+)
+
+
+def leaves_set(grid, pose_number: int):
+    return sorted(
+        (
+            tuple(leaf.corner_min),
+            leaf.edge_length,
+            tuple(sorted(map(tuple, leaf.get_points()))),
+        )
+        for leaf in grid.get_leaf_points(pose_number)
+    )
+
+
+def double(points):
+    return np.vstack([points, points])
+
+
+class StatisticsCountSubdivider(CountSubdivider):
+    """
+    Count subdivider which may be checked only by statistics of points
+    """
+
+    def __call__(self, points):
+        raise AssertionError("Subdivider must be checked by statistics")
+
+
+class PointsCountSubdivider(Subdivider):
+    """
+    Subdivider which decides only by points (doesn't override `check_statistics`)
+    """
+
+    def __init__(self, count: int) -> None:
+        self.count = count
+
+    def __call__(self, points):
+        return len(points) > self.count
+
+
+class BatchCountSegmenter(CountSegmenter):
+    """
+    Count segmenter which records sizes of batches it has segmented
+    """
+
+    def __init__(self, count: int) -> None:
+        super().__init__(count)
+        self.batch_sizes = []
+
+    def segment_batch(self, voxels_points, map_function):
+        self.batch_sizes.append(len(voxels_points))
+        return map_function(self, voxels_points)
+
+
+def fill_grid(grid_type: Type, seed: int = 0):
+    random_generator = np.random.default_rng(seed)
+    grid = grid_type(GridConfig(voxel_edge_length=4))
+    for pose_number in range(3):
+        grid.insert_points(pose_number, random_generator.uniform(-5, 7, (300, 3)))
+
+    return grid
+
+
+@pytest.mark.parametrize(
+    "executor_factory",
+    [
+        SerialExecutor,
+        lambda: ThreadExecutor(2),
+        lambda: ProcessExecutor(2),
+    ],
+)
+@pytest.mark.parametrize("grid_type", [Grid, VoxelHashGrid])
+def test_executor(executor_factory: Callable[[], Executor], grid_type: Type):
+    subdividers = [CountSubdivider(60), SizeSubdivider(1)]
+    segmenters = [CountSegmenter(3), CountSegmenter(5)]
+
+    expected_grid = fill_grid(grid_type)
+    expected_grid.subdivide(subdividers)
+    for segmenter in segmenters:
+        expected_grid.map_leaf_points(segmenter)
+    expected_grid.filter([EmptyVoxel()])
+
+    actual_grid = fill_grid(grid_type)
+    with executor_factory() as executor:
+        executor.subdivide(actual_grid, subdividers)
+        for segmenter in segmenters:
+            executor.map_leaf_points(actual_grid, segmenter)
+        executor.filter(actual_grid, [EmptyVoxel()])
+
+    for pose_number in range(3):
+        assert leaves_set(actual_grid, pose_number) == leaves_set(
+            expected_grid, pose_number
+        )
+        assert actual_grid.n_points(pose_number) == expected_grid.n_points(pose_number)
+
+
+@pytest.mark.parametrize(
+    "executor_factory",
+    [
+        SerialExecutor,
+        lambda: ThreadExecutor(2),
+        lambda: ProcessExecutor(2),
+    ],
+)
+@pytest.mark.parametrize("grid_type", [Grid, VoxelHashGrid])
+def test_executor_segment_batch(
+    executor_factory: Callable[[], Executor], grid_type: Type
+):
+    segmenter = BatchCountSegmenter(5)
+
+    expected_grid = fill_grid(grid_type)
+    expected_grid.subdivide([CountSubdivider(60)])
+    expected_grid.map_leaf_points(CountSegmenter(5))
+
+    actual_grid = fill_grid(grid_type)
+    with executor_factory() as executor:
+        executor.subdivide(actual_grid, [CountSubdivider(60)])
+        executor.map_leaf_points(actual_grid, segmenter)
+
+    # Executors give points of all leaves to segmenters which override `segment_batch`
+    assert segmenter.segments_batch
+    assert not CountSegmenter(5).segments_batch
+    assert len(segmenter.batch_sizes) == 1 and segmenter.batch_sizes[0] > 0
+    for pose_number in range(3):
+        assert leaves_set(actual_grid, pose_number) == leaves_set(
+            expected_grid, pose_number
+        )
+
+
+@pytest.mark.parametrize(
+    "executor_factory",
+    [
+        SerialExecutor,
+        lambda: ThreadExecutor(2),
+        lambda: ProcessExecutor(2),
+    ],
+)
+def test_executor_points_subdivider(executor_factory: Callable[[], Executor]):
+    # Subdividers without statistics are checked by points together with ones with statistics
+    subdividers = [PointsCountSubdivider(60), SizeSubdivider(1)]
+
+    expected_grid = fill_grid(VoxelHashGrid)
+    expected_grid.subdivide([CountSubdivider(60), SizeSubdivider(1)])
+
+    actual_grid = fill_grid(VoxelHashGrid)
+    with executor_factory() as executor:
+        executor.subdivide(actual_grid, subdividers)
+
+    assert not PointsCountSubdivider(60).checks_statistics
+    for pose_number in range(3):
+        assert leaves_set(actual_grid, pose_number) == leaves_set(
+            expected_grid, pose_number
+        )
+
+
+@pytest.mark.parametrize(
+    "executor_factory",
+    [
+        SerialExecutor,
+        lambda: ThreadExecutor(2),
+        lambda: ProcessExecutor(2),
+    ],
+)
+def test_executor_statistics(executor_factory: Callable[[], Executor]):
+    subdividers = [EigenValueSubdivider(0.2), SizeSubdivider(1)]
+    segmenter = CAPESegmenter(correlation=10)
+
+    expected_grid = fill_grid(VoxelHashGrid)
+    expected_grid.subdivide(subdividers)
+    expected_grid.map_leaf_points(segmenter)
+
+    actual_grid = fill_grid(VoxelHashGrid)
+    with executor_factory() as executor:
+        executor.subdivide(actual_grid, subdividers)
+        executor.map_leaf_points(actual_grid, segmenter)
+        # Subdividers of VoxelHashGrid nodes are checked without points
+        executor.subdivide(fill_grid(VoxelHashGrid), [StatisticsCountSubdivider(60)])
+
+    for pose_number in range(3):
+        assert leaves_set(actual_grid, pose_number) == leaves_set(
+            expected_grid, pose_number
+        )
+
+
+@pytest.mark.parametrize(
+    "executor_factory",
+    [
+        SerialExecutor,
+        lambda: ThreadExecutor(2),
+        lambda: ProcessExecutor(2),
+    ],
+)
+@pytest.mark.parametrize("grid_type", [Grid, VoxelHashGrid])
+def test_executor_segmenter_chain(
+    executor_factory: Callable[[], Executor], grid_type: Type
+):
+    chain = SegmenterChain(
+        [CountSegmenter(5), CAPESegmenter(correlation=10), CountSegmenter(15)]
+    )
+
+    expected_grid = fill_grid(grid_type)
+    expected_grid.subdivide([CountSubdivider(60)])
+    expected_grid.map_leaf_points(chain)
+
+    actual_grid = fill_grid(grid_type)
+    with executor_factory() as executor:
+        executor.subdivide(actual_grid, [CountSubdivider(60)])
+        durations = executor.map_chain_leaf_points(actual_grid, chain)
+
+    assert len(durations) == 3
+    for pose_number in range(3):
+        assert leaves_set(actual_grid, pose_number) == leaves_set(
+            expected_grid, pose_number
+        )
+
+
+@pytest.mark.parametrize(
+    "executor",
+    [SerialExecutor(), ThreadExecutor(2), ProcessExecutor(2, tasks_per_worker=1)],
+)
+def test_executor_map(executor: Executor):
+    random_generator = np.random.default_rng(0)
+    points = [random_generator.uniform(0, 1, (count, 3)) for count in [5, 0, 40, 1]]
+
+    with executor:
+        # Points are larger than input, so process workers pickle them instead of shared memory
+        doubled_points = executor.map(double, points)
+        lengths = executor.map(len, points)
+        segmented_points = executor.map(
+            NumpyRansacSegmenter(threshold=0.5, seed=0), points[2:3]
+        )
+
+    for leaf_points, doubled_leaf_points, leaf_length in zip(
+        points, doubled_points, lengths
+    ):
+        assert np.array_equal(doubled_leaf_points, np.vstack([leaf_points] * 2))
+        assert leaf_length == len(leaf_points)
+    assert np.array_equal(segmented_points[0], points[2])
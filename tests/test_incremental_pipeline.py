@@ -0,0 +1,105 @@
+import mrob
+import numpy as np
+import pytest
+from octreelib.grid import GridConfig
+
+from sova.backend import EigenFactorBackend
+from sova.pipeline import IncrementalPipeline, PipelineRuntimeParameters
+from sova.segmenter import CountSegmenter
+from sova.subdivider import SizeSubdivider
+
+
+def test_incremental_pipeline(three_planes):
+    random_generator = np.random.default_rng(0)
+    pipeline = IncrementalPipeline(
+        window_size=2,
+        subdividers=[SizeSubdivider(2)],
+        segmenters=[CountSegmenter(5)],
+        filters=[],
+        grid_configuration=GridConfig(voxel_edge_length=4),
+    )
+
+    poses = []
+    for _ in range(3):
+        points = three_planes(random_generator)
+        poses.append(mrob.geometry.SE3(random_generator.normal(0, 0.01, 6)).T())
+        pipeline.insert(points, poses[-1])
+
+    assert np.all(pipeline.poses == poses[1:])
+
+    output = pipeline.run(
+        EigenFactorBackend(poses_number=2, iterations_number=10),
+        PipelineRuntimeParameters(),
+    )
+    assert len(output.poses) == 2
+
+
+def test_incorrect_incremental_pipeline():
+    with pytest.raises(ValueError):
+        IncrementalPipeline(0, [], [], [], GridConfig())
+
+
+def test_warm_started_incremental_pipeline():
+    random_generator = np.random.default_rng(0)
+    # Three planes in separate voxels, so points of every leaf belong to one plane
+    planes_points = []
+    for u in range(3):
+        for v in range(3):
+            points = random_generator.uniform(0.05, 0.95, (40, 3))
+            points[:, :2] += [u, v]
+            points[:, 2] = 0.5
+            planes_points.extend(
+                [
+                    points,
+                    points[:, [2, 0, 1]] + [4, 0, 0],
+                    points[:, [0, 2, 1]] + [0, 4, 0],
+                ]
+            )
+    map_points = np.vstack(planes_points)
+
+    warm_pipeline, cold_pipeline = [
+        IncrementalPipeline(
+            window_size=3,
+            subdividers=[],
+            segmenters=[CountSegmenter(5)],
+            filters=[],
+            grid_configuration=GridConfig(voxel_edge_length=1),
+        )
+        for _ in range(2)
+    ]
+    initial_errors = []
+    for scan_number in range(4):
+        pose = mrob.geometry.SE3(random_generator.normal(0, 0.02, 6)).T()
+        inverse_pose = np.linalg.inv(pose)
+        local_points = map_points @ inverse_pose[:3, :3].T + inverse_pose[:3, 3]
+        local_points += random_generator.normal(0, 0.001, local_points.shape)
+        # Scans are inserted with erroneous poses which backend corrects
+        erroneous_pose = (
+            pose @ mrob.geometry.SE3(random_generator.normal(0, 0.02, 6)).T()
+        )
+        warm_pipeline.insert(local_points, erroneous_pose)
+        cold_pipeline.insert(local_points, erroneous_pose)
+        if scan_number < 2:
+            continue
+
+        warm_start_poses = warm_pipeline.warm_start_poses
+        assert warm_start_poses.shape == (3, 4, 4)
+        assert np.allclose(warm_start_poses[0], np.eye(4))
+
+        warm_output = warm_pipeline.run(
+            EigenFactorBackend(
+                poses_number=3, iterations_number=100, initial_poses=warm_start_poses
+            ),
+            PipelineRuntimeParameters(),
+        )
+        cold_output = cold_pipeline.run(
+            EigenFactorBackend(poses_number=3, iterations_number=100),
+            PipelineRuntimeParameters(),
+        )
+        initial_errors.append(
+            (warm_output.metrics[0].value, cold_output.metrics[0].value)
+        )
+
+    # The first window has no previous corrections, the next one starts from them
+    assert initial_errors[0][0] == pytest.approx(initial_errors[0][1])
+    assert initial_errors[1][0] < initial_errors[1][1]
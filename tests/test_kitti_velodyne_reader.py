@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+import os
+
+from sova.utils import KittiReader, KittiVelodyneReader
+
+CALIBRATION = (
+    "P0: 1 0 0 0 0 1 0 0 0 0 1 0\n"
+    "P1: 1 0 0 0 0 1 0 0 0 0 1 0\n"
+    "P2: 1 0 0 0 0 1 0 0 0 0 1 0\n"
+    "P3: 1 0 0 0 0 1 0 0 0 0 1 0\n"
+    "Tr: 0 -1 0 0.5 0 0 -1 -0.1 1 0 0 -0.3\n"
+)
+
+
+@pytest.fixture
+def sequence_path(tmp_path) -> str:
+    random_generator = np.random.default_rng(0)
+    os.makedirs(tmp_path / "velodyne")
+    os.makedirs(tmp_path / "poses")
+    with open(tmp_path / "calib.txt", "w") as file:
+        file.write(CALIBRATION)
+    with open(tmp_path / "poses" / "calib.txt", "w") as file:
+        file.write(CALIBRATION)
+
+    trajectory = []
+    for scan_number, points_number in enumerate([10, 0, 25]):
+        random_generator.uniform(-10, 10, (points_number, 4)).astype(np.float32).tofile(
+            tmp_path / "velodyne" / f"{scan_number:06d}.bin"
+        )
+        pose = np.eye(4)[:3]
+        pose[:, 3] = random_generator.uniform(-10, 10, 3)
+        trajectory.append(pose.reshape(-1))
+        # The same pose in the format of converted KITTI dataset
+        np.savetxt(tmp_path / "poses" / f"{scan_number}.txt", pose.reshape(1, -1))
+    np.savetxt(tmp_path / "poses.txt", np.array(trajectory))
+
+    return str(tmp_path)
+
+
+@pytest.mark.parametrize("scan_number", [0, 1, 2])
+def test_kitti_velodyne_reader(sequence_path: str, scan_number: int):
+    reader = KittiVelodyneReader()
+
+    points, pose = reader.read_scan(sequence_path, scan_number)
+
+    scan = np.fromfile(
+        KittiVelodyneReader.scan_path(sequence_path, scan_number), dtype=np.float32
+    ).reshape(-1, 4)
+    assert np.array_equal(points, scan[:, :3])
+    assert np.array_equal(
+        KittiVelodyneReader.read_points(
+            KittiVelodyneReader.scan_path(sequence_path, scan_number), True
+        ),
+        scan,
+    )
+    assert np.allclose(
+        pose,
+        KittiReader.read_pose(
+            os.path.join(sequence_path, "poses", f"{scan_number}.txt")
+        ),
+    )
+    assert len(
+        reader.read_point_cloud(
+            KittiVelodyneReader.scan_path(sequence_path, scan_number)
+        ).points
+    ) == len(scan)
+
+
+def test_kitti_velodyne_reader_pose(sequence_path: str):
+    # Trajectory file has poses of all scans, so single pose can't be read from it
+    with pytest.raises(ValueError):
+        KittiVelodyneReader.read_pose(os.path.join(sequence_path, "poses.txt"))
+
+    poses = KittiVelodyneReader.read_poses(os.path.join(sequence_path, "poses.txt"))
+    assert len(poses) == 3
+    for scan_number, pose in enumerate(poses):
+        assert np.allclose(
+            pose, KittiVelodyneReader().read_scan(sequence_path, scan_number)[1]
+        )
@@ -0,0 +1,133 @@
+import numpy as np
+import pytest
+
+import pickle
+from typing import List
+
+from sova.utils import DatasetReader, LRUCachedReader, ScanCacheStatistics
+
+
+class ArrayReader(DatasetReader):
+    """
+    Reader of scans with 10 * (scan_number + 1) points, which counts reads of every scan
+    """
+
+    def __init__(self):
+        self.reads = []
+
+    @staticmethod
+    def read_pose(filename: str):
+        return np.eye(4)
+
+    @staticmethod
+    def read_point_cloud(filename: str):
+        raise NotImplementedError
+
+    def read_scan(self, dataset_path: str, scan_number: int):
+        self.reads.append(scan_number)
+        pose = np.eye(4)
+        pose[0, 3] = scan_number
+        return np.full((10 * (scan_number + 1), 3), scan_number, dtype=float), pose
+
+
+def scan_bytes(scan_number: int) -> int:
+    return 10 * (scan_number + 1) * 3 * 8 + 16 * 8
+
+
+@pytest.mark.parametrize(
+    "max_bytes, scan_numbers, expected_reads, expected_statistics",
+    [
+        (
+            10**6,
+            [0, 1, 0, 1, 2],
+            [0, 1, 2],
+            ScanCacheStatistics(2, 3, 0, sum(map(scan_bytes, [0, 1, 2])), 3),
+        ),
+        # Scans 0 and 1 fit, scan 2 evicts both of them
+        (
+            scan_bytes(2) + scan_bytes(0),
+            [0, 1, 0, 2, 1, 0],
+            [0, 1, 2, 1, 0],
+            ScanCacheStatistics(1, 5, 3, scan_bytes(1) + scan_bytes(0), 2),
+        ),
+        # Scans larger than cache aren't cached
+        (
+            scan_bytes(0),
+            [1, 1, 0, 0],
+            [1, 1, 0],
+            ScanCacheStatistics(1, 3, 0, scan_bytes(0), 1),
+        ),
+        (0, [0, 0], [0, 0], ScanCacheStatistics(0, 2, 0, 0, 0)),
+    ],
+)
+def test_lru_cached_reader(
+    max_bytes: int,
+    scan_numbers: List[int],
+    expected_reads: List[int],
+    expected_statistics: ScanCacheStatistics,
+):
+    array_reader = ArrayReader()
+    reader = LRUCachedReader(array_reader, max_bytes)
+
+    for scan_number in scan_numbers:
+        points, pose = reader.read_scan("dataset", scan_number)
+        assert len(points) == 10 * (scan_number + 1)
+        assert np.all(points == scan_number)
+        assert pose[0, 3] == scan_number
+        assert not points.flags.writeable
+
+    assert array_reader.reads == expected_reads
+    assert reader.statistics == expected_statistics
+    assert reader.statistics.bytes <= max_bytes
+
+
+def test_lru_cached_reader_shared_by_threads():
+    array_reader = ArrayReader()
+    reader = LRUCachedReader(array_reader, 10**6)
+
+    for _ in range(3):
+        points, poses = reader.read_patch("dataset", 0, 8, workers_number=4)
+        assert [scan_points[0, 0] for scan_points in points] == list(range(8))
+        assert np.array_equal(poses[:, 0, 3], np.arange(8))
+
+    statistics = reader.statistics
+    assert sorted(array_reader.reads) == list(range(8))
+    assert (statistics.hits, statistics.misses, statistics.scans) == (16, 8, 8)
+
+    unpickled_reader = pickle.loads(pickle.dumps(reader))
+    assert unpickled_reader.statistics == ScanCacheStatistics()
+    reader.clear()
+    assert reader.statistics.bytes == 0
+
+
+def test_lru_cached_reader_incorrect_size():
+    with pytest.raises(ValueError):
+        LRUCachedReader(ArrayReader(), -1)
+
+
+class MemoryMappedReader(ArrayReader):
+    """
+    Reader of scans, which serves points as views of memory-mapped file
+    """
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.points = np.memmap(path, dtype=float, mode="w+", shape=(100, 3))
+
+    def read_scan(self, dataset_path: str, scan_number: int):
+        self.reads.append(scan_number)
+        start, end = 10 * scan_number, 10 * (scan_number + 1)
+        return self.points[start:end], np.eye(4)
+
+
+def test_lru_cached_reader_memory_mapped(tmp_path):
+    memory_mapped_reader = MemoryMappedReader(str(tmp_path / "points.bin"))
+    reader = LRUCachedReader(memory_mapped_reader, 16 * 8 * 2)
+
+    for scan_number in [0, 1, 0, 1]:
+        points, _ = reader.read_scan("dataset", scan_number)
+        assert len(points) == 10
+
+    # Only poses are counted, so both scans fit
+    assert memory_mapped_reader.reads == [0, 1]
+    assert reader.statistics == ScanCacheStatistics(2, 2, 0, 16 * 8 * 2, 2)
@@ -0,0 +1,63 @@
+import mrob
+import numpy as np
+from octreelib.grid import GridConfig
+
+from sova.backend import EigenFactorBackend
+from sova.pipeline import (
+    MultiResolutionPipeline,
+    ResolutionLevel,
+    SequentialPipelineRuntimeParameters,
+)
+from sova.segmenter import CountSegmenter
+from sova.subdivider import SizeSubdivider
+
+
+def test_multi_resolution_pipeline(three_planes):
+    random_generator = np.random.default_rng(0)
+    point_clouds = [three_planes(random_generator, 600) for _ in range(3)]
+
+    pipeline = MultiResolutionPipeline(
+        point_clouds=point_clouds,
+        poses=[
+            mrob.geometry.SE3(random_generator.normal(0, 0.01, 6)).T() for _ in range(3)
+        ],
+        subdividers=[SizeSubdivider(1)],
+        segmenters=[CountSegmenter(5)],
+        filters=[],
+        backend=EigenFactorBackend(poses_number=3, iterations_number=100),
+        debug=False,
+        levels=[
+            ResolutionLevel(
+                grid_configuration=GridConfig(voxel_edge_length=4),
+                backend=EigenFactorBackend(poses_number=3, iterations_number=100),
+                subdividers=[],
+            )
+        ],
+    )
+    output = pipeline.run(
+        SequentialPipelineRuntimeParameters(
+            grid_configuration=GridConfig(voxel_edge_length=2),
+            initial_point_cloud_number=1,
+            collect_counters=True,
+        )
+    )
+
+    assert output.poses.shape == (3, 4, 4)
+    # The first pose is anchored on every level, so its accumulated correction is identity
+    assert np.allclose(output.poses[0], np.eye(4))
+    assert [metric.name for metric in output.metrics][:3] == [
+        "Level 0 FGraph initial error",
+        "Level 0 Iterations to converge",
+        "Level 0 chi2",
+    ]
+    assert len(output.metrics) == 10
+    assert output.converged
+
+    stages_names = [stage.name for stage in pipeline.statistics.stages]
+    assert stages_names[0] == "level_0_initial_insert"
+    assert stages_names[-1] == "level_1_backend"
+    # Coarse level has no subdividers, so its leaves are whole voxels
+    assert (
+        pipeline.statistics["level_0_subdivide"].leaves
+        < pipeline.statistics["level_1_subdivide"].leaves
+    )
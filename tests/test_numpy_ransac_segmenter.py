@@ -0,0 +1,138 @@
+import numpy as np
+import pytest
+
+from sova.segmenter import NumpyRansacSegmenter
+from sova.typing import ArrayNx3
+
+
+@pytest.mark.parametrize(
+    "points, threshold, initial_points, expected_points",
+    [
+        (
+            np.array([[0, 0, 0], [0, 0, 1], [0, 1, 0]]),
+            100,
+            3,
+            np.array([[0, 0, 0], [0, 0, 1], [0, 1, 0]]),
+        ),
+        (
+            np.array([[0, 0, 0], [0, 0, 1], [0, 1, 0], [0, 1, 1], [100, 100, 100]]),
+            0.001,
+            3,
+            np.array([[0, 0, 0], [0, 0, 1], [0, 1, 0], [0, 1, 1]]),
+        ),
+        (
+            np.array([[0, 0, 0], [0, 0, 1], [0, 1, 0]]),
+            0.001,
+            4,
+            np.empty((0, 3)),
+        ),
+        (
+            np.array([[0, 0, 0], [1, 1, 1], [2, 2, 2], [3, 3, 3]]),
+            0.001,
+            3,
+            np.empty((0, 3)),
+        ),
+    ],
+)
+def test_numpy_ransac_segmenter(
+    points: ArrayNx3[float],
+    threshold: float,
+    initial_points: int,
+    expected_points: ArrayNx3[float],
+):
+    ransac_segmenter = NumpyRansacSegmenter(
+        threshold=threshold, initial_points=initial_points, seed=0
+    )
+    actual_points = ransac_segmenter(points)
+    assert len(actual_points) == len(expected_points)
+    assert np.all(actual_points == expected_points)
+
+
+def test_numpy_ransac_segmenter_noisy_plane():
+    random_generator = np.random.default_rng(0)
+    points = random_generator.uniform(0, 1, (500, 3))
+    points[:400, 2] = 0.5 + random_generator.normal(0, 0.001, 400)
+
+    actual_points = NumpyRansacSegmenter(
+        threshold=0.01, initial_points=3, iterations=200, batch_size=64, seed=0
+    )(points)
+
+    assert len(actual_points) >= 400
+    assert np.all(np.abs(actual_points[:, 2] - 0.5) < 0.01)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_numpy_ransac_segmenter_distinct_samples(seed: int):
+    points = np.array([[0, 0, 0], [0, 0, 1], [0, 1, 0]])
+
+    # Initial points are drawn without replacement, so the only sample defines the plane
+    actual_points = NumpyRansacSegmenter(
+        threshold=0.001, initial_points=3, iterations=1, seed=seed
+    )(points)
+
+    assert np.array_equal(actual_points, points)
+
+
+@pytest.mark.parametrize("points_number", [3, 11, 12, 1000])
+def test_numpy_ransac_segmenter_sample(points_number: int):
+    segmenter = NumpyRansacSegmenter(initial_points=3, seed=0)
+
+    samples = segmenter._NumpyRansacSegmenter__sample(500, points_number)
+
+    assert samples.shape == (500, 3)
+    assert np.all((samples >= 0) & (samples < points_number))
+    sorted_samples = np.sort(samples, axis=1)
+    assert np.all(sorted_samples[:, 1:] != sorted_samples[:, :-1])
+
+
+@pytest.mark.parametrize(
+    "confidence, batch_size, expected_iterations",
+    [(None, 64, 1000), (0.99, 8, 8)],
+)
+def test_numpy_ransac_segmenter_iterations(
+    confidence: float, batch_size: int, expected_iterations
+):
+    random_generator = np.random.default_rng(0)
+    points = random_generator.uniform(0, 1, (500, 3))
+    points[:, 2] = 0.5
+
+    ransac_segmenter = NumpyRansacSegmenter(
+        threshold=0.01,
+        initial_points=3,
+        iterations=1000,
+        batch_size=batch_size,
+        confidence=confidence,
+        seed=0,
+    )
+    assert len(ransac_segmenter(points)) == 500
+    ransac_segmenter(points[:2])
+
+    # Plane with all points is found in the first batch, so adaptive mode stops immediately
+    assert ransac_segmenter.iterations_used == expected_iterations
+    assert ransac_segmenter.calls_number == 2
+
+
+def test_numpy_ransac_segmenter_adaptive_noisy_plane():
+    random_generator = np.random.default_rng(0)
+    points = random_generator.uniform(0, 1, (500, 3))
+    points[:400, 2] = 0.5 + random_generator.normal(0, 0.001, 400)
+
+    ransac_segmenter = NumpyRansacSegmenter(
+        threshold=0.01,
+        initial_points=3,
+        iterations=5000,
+        batch_size=16,
+        confidence=0.999,
+        seed=0,
+    )
+    actual_points = ransac_segmenter(points)
+
+    assert len(actual_points) >= 400
+    # About 10 iterations are required for 80% of inliers
+    assert ransac_segmenter.iterations_used <= 32
+
+
+@pytest.mark.parametrize("confidence", [0, 1, 1.5])
+def test_incorrect_numpy_ransac_segmenter(confidence: float):
+    with pytest.raises(ValueError):
+        NumpyRansacSegmenter(confidence=confidence)
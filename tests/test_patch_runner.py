@@ -0,0 +1,162 @@
+import mrob
+import numpy as np
+import pytest
+import yaml
+
+import logging
+import os
+from collections import defaultdict
+
+from sova.backend import EigenFactorBackend
+from sova.pipeline import PatchRunner, YAMLConfigurationReader
+from sova.utils import HiltiReader
+
+
+@pytest.fixture
+def configuration_path(tmp_path, three_planes, write_hilti_dataset) -> str:
+    random_generator = np.random.default_rng(0)
+    dataset_path = write_hilti_dataset(
+        str(tmp_path / "dataset"),
+        [three_planes(random_generator) for _ in range(4)],
+        # Scans are taken at the same place, so initial poses are perturbed identities
+        [mrob.geometry.SE3(random_generator.normal(0, 0.01, 6)).T() for _ in range(4)],
+    )
+
+    configuration = {
+        "dataset": {
+            "type": "hilti",
+            "path": dataset_path,
+            "patches": {"start": 0, "end": 4, "step": 2, "iterations": 1},
+        },
+        "pipeline": {
+            "grid": {"voxel_edge_length": 4},
+            "subdividers": {"size": 2},
+            "segmenters": {"count": {"count": 5}},
+            "backend": {
+                "type": "eigen_factor",
+                "parameters": {"iterations_number": 10, "robust_type": "QUADRATIC"},
+            },
+            "output": str(tmp_path / "output"),
+        },
+    }
+    path = tmp_path / "configuration.yaml"
+    with open(path, "w") as file:
+        yaml.safe_dump(configuration, file)
+
+    return str(path)
+
+
+def test_patch_runner_patches(configuration_path: str):
+    runner = PatchRunner(
+        configuration=YAMLConfigurationReader(configuration_path),
+        dataset_reader=HiltiReader(),
+    )
+    assert runner.patches == [(0, 2), (2, 4)]
+
+
+def test_patch_runner_incorrect_workers_number(configuration_path: str):
+    with pytest.raises(ValueError):
+        PatchRunner(
+            configuration=YAMLConfigurationReader(configuration_path),
+            dataset_reader=HiltiReader(),
+            workers_number=0,
+        )
+
+
+def test_patch_runner_parallel(configuration_path: str, tmp_path):
+    configuration = YAMLConfigurationReader(configuration_path)
+    sequential_results = list(
+        PatchRunner(configuration, HiltiReader(), workers_number=1).run()
+    )
+    parallel_results = list(
+        PatchRunner(configuration, HiltiReader(), workers_number=2).run()
+    )
+
+    assert [(start, end) for start, end, _ in parallel_results] == [(0, 2), (2, 4)]
+    for (_, _, expected_poses), (_, _, actual_poses) in zip(
+        sequential_results, parallel_results
+    ):
+        assert np.allclose(expected_poses, actual_poses)
+
+    PatchRunner(configuration, HiltiReader(), workers_number=2).write(str(tmp_path))
+    for pose_number in range(4):
+        assert os.path.exists(tmp_path / f"{pose_number}.txt")
+
+
+def test_patch_runner_logging(configuration_path: str, capsys, caplog):
+    configuration = YAMLConfigurationReader(configuration_path)
+    with caplog.at_level(logging.INFO, logger="sova.pipeline.patch_runner"):
+        list(PatchRunner(configuration, HiltiReader(), workers_number=1).run())
+
+    # Progress is logged instead of printed
+    output = capsys.readouterr().out
+    assert "Processing" not in output and "Stages" not in output
+    assert "Processing 0 to 1..." in caplog.messages
+    assert any(
+        message.startswith("Patch 2-3, iteration 0") for message in caplog.messages
+    )
+
+
+class RejectingGraph:
+    """
+    Graph which provides robust mask rejecting its first plane feature
+    """
+
+    graph_type = mrob.FGraph
+
+    def __init__(self, robust_type: int) -> None:
+        self.graph = self.graph_type(robust_type)
+
+    def __getattr__(self, name: str):
+        return getattr(self.graph, name)
+
+    def get_eigen_factors_robust_mask(self):
+        return defaultdict(bool, {0: True})
+
+
+def test_patch_runner_prune_rejected_features(configuration_path: str, monkeypatch):
+    with open(configuration_path) as file:
+        configuration = yaml.safe_load(file)
+    configuration["dataset"]["patches"]["iterations"] = 2
+    configuration["dataset"]["patches"]["prune_rejected_features"] = True
+    configuration["pipeline"]["backend"]["parameters"]["robust_type"] = "HUBER"
+    with open(configuration_path, "w") as file:
+        yaml.safe_dump(configuration, file)
+    monkeypatch.setattr(mrob, "FGraph", RejectingGraph)
+    # Features of graph, rejected features and errors before and after solving of every run of backend
+    runs = []
+    process = EigenFactorBackend.process
+
+    def recording_process(self, grid):
+        output = process(self, grid)
+        runs.append(
+            (
+                set(self._planes),
+                set(output.unused_features),
+                output.metrics[0].value,
+                output.metrics[2].value,
+            )
+        )
+        return output
+
+    monkeypatch.setattr(EigenFactorBackend, "process", recording_process)
+
+    configuration = YAMLConfigurationReader(configuration_path)
+    results = list(PatchRunner(configuration, HiltiReader(), workers_number=1).run())
+
+    assert configuration.patches_prune_rejected_features
+    assert [(start, end) for start, end, _ in results] == [(0, 2), (2, 4)]
+    for _, _, poses in results:
+        assert len(poses) == 2
+    assert len(runs) == 4
+    # Iterations of patch share the filter, so features rejected by the first one aren't in the next graph
+    for first_run, second_run in zip(runs[::2], runs[1::2]):
+        first_features, rejected_features, first_initial_error, first_error = first_run
+        second_features, _, second_initial_error, second_error = second_run
+        assert len(rejected_features) == 1
+        assert rejected_features <= first_features
+        assert rejected_features.isdisjoint(second_features)
+        # Poses of every iteration are no worse than the ones it started from
+        assert first_error <= first_initial_error
+        assert second_initial_error <= first_initial_error
+        assert second_error <= second_initial_error
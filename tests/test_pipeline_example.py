@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+import yaml
+
+import os
+import subprocess
+import sys
+
+CALIBRATION = (
+    "P0: 1 0 0 0 0 1 0 0 0 0 1 0\n"
+    "P1: 1 0 0 0 0 1 0 0 0 0 1 0\n"
+    "P2: 1 0 0 0 0 1 0 0 0 0 1 0\n"
+    "P3: 1 0 0 0 0 1 0 0 0 0 1 0\n"
+    "Tr: 1 0 0 0 0 1 0 0 0 0 1 0\n"
+)
+
+
+@pytest.mark.parametrize("memory_cache_bytes", [0, 10**6])
+def test_pipeline_example_kitti_velodyne_cache(
+    tmp_path, memory_cache_bytes: int, three_planes
+):
+    random_generator = np.random.default_rng(0)
+    sequence_path = tmp_path / "sequence"
+    os.makedirs(sequence_path / "velodyne")
+    with open(sequence_path / "calib.txt", "w") as file:
+        file.write(CALIBRATION)
+    for scan_number in range(4):
+        points = three_planes(random_generator, columns_number=4).astype(np.float32)
+        points.tofile(sequence_path / "velodyne" / f"{scan_number:06d}.bin")
+    np.savetxt(sequence_path / "poses.txt", np.tile(np.eye(4)[:3].reshape(-1), (4, 1)))
+
+    configuration = {
+        "dataset": {
+            "type": "kitti_velodyne",
+            "path": str(sequence_path),
+            "cache": True,
+            "memory_cache_bytes": memory_cache_bytes,
+            "patches": {"start": 0, "end": 4, "step": 2, "iterations": 1},
+        },
+        "pipeline": {
+            "grid": {"voxel_edge_length": 4},
+            "subdividers": {"size": 2},
+            "segmenters": {"count": {"count": 5}},
+            "backend": {
+                "type": "eigen_factor",
+                "parameters": {"iterations_number": 10, "robust_type": "QUADRATIC"},
+            },
+            "output": str(tmp_path / "output"),
+            "workers": 2,
+        },
+    }
+    configuration_path = tmp_path / "configuration.yaml"
+    with open(configuration_path, "w") as file:
+        yaml.safe_dump(configuration, file)
+
+    subprocess.run(
+        [
+            sys.executable,
+            os.path.join("examples", "pipeline.py"),
+            "--configuration_path",
+            str(configuration_path),
+        ],
+        check=True,
+    )
+
+    assert os.path.exists(sequence_path / "cache" / "points.bin")
+    for pose_number in range(4):
+        pose = np.loadtxt(tmp_path / "output" / "poses" / f"{pose_number}.txt")
+        assert pose.shape == (4, 4)
+        assert np.allclose(pose[:3, :3] @ pose[:3, :3].T, np.eye(3), atol=1e-6)
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+from sklearn.decomposition import PCA
+
+from sova.segmenter import CAPESegmenter
+from sova.subdivider import EigenValueSubdivider
+from sova.utils import covariance_eigenvalues
+
+
+def pca_eigenvalues(points):
+    try:
+        with np.errstate(invalid="ignore"):
+            standardized_points = (points - points.mean(axis=0)) / points.std(axis=0)
+        pca = PCA(n_components=3)
+        pca.fit_transform(standardized_points)
+    except ValueError:
+        return np.full(3, np.nan)
+
+    return np.sort(pca.explained_variance_)
+
+
+@pytest.fixture
+def voxels_points():
+    random_generator = np.random.default_rng(0)
+    voxels_points = []
+    for voxel_number in range(200):
+        points = random_generator.normal(
+            100, random_generator.uniform(0.01, 1, 3), (voxel_number % 50 + 3, 3)
+        )
+        if voxel_number % 4 == 0:
+            # Nearly planar voxel
+            points[:, 2] = 100 + random_generator.normal(0, 1e-4, len(points))
+        voxels_points.append(points)
+
+    planar_points = random_generator.uniform(0, 1, (20, 3))
+    planar_points[:, 0] = 0.5
+    voxels_points.append(planar_points)
+
+    return voxels_points
+
+
+def test_covariance_eigenvalues(voxels_points):
+    expected_eigenvalues = np.array(
+        [pca_eigenvalues(points) for points in voxels_points]
+    )
+    actual_eigenvalues = covariance_eigenvalues(voxels_points)
+
+    assert np.all(np.isnan(actual_eigenvalues[-1]))
+    assert np.allclose(actual_eigenvalues, expected_eigenvalues, equal_nan=True)
+    assert np.all(np.isnan(covariance_eigenvalues([np.zeros((1, 3))])))
+
+
+@pytest.mark.parametrize("correlation, value", [(10, 0.05), (100, 0.5), (1000, 1e-4)])
+def test_planarity_decisions(voxels_points, correlation: float, value: float):
+    for points in voxels_points:
+        min_eigenvalue, _, max_eigenvalue = pca_eigenvalues(points)
+        is_planar = len(points) > 10 and max_eigenvalue / min_eigenvalue <= correlation
+        should_be_split = min_eigenvalue > value
+
+        assert (len(CAPESegmenter(correlation)(points)) > 0) == is_planar
+        assert EigenValueSubdivider(value)(points) == should_be_split
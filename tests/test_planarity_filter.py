@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+from octreelib.grid import Grid, GridConfig
+
+from sova.filter import PlanarityFilter
+from sova.grid import VoxelIndex
+
+
+@pytest.mark.parametrize("max_features_number", [1, 2, 3, 10])
+@pytest.mark.parametrize("single_pose_voxels_number", [0, 2])
+def test_planarity_filter(max_features_number: int, single_pose_voxels_number: int):
+    random_generator = np.random.default_rng(0)
+    grid = Grid(GridConfig(voxel_edge_length=1))
+    # Thickness of cloud grows with voxel number, so voxels are ranked by their order
+    thicknesses = [0.001, 0.01, 0.1, 0.9]
+    for pose_number in range(2):
+        points = []
+        for voxel, thickness in enumerate(thicknesses):
+            voxel_points = random_generator.uniform(0.05, 0.95, (50, 3))
+            voxel_points[:, 2] = 0.5 + random_generator.uniform(
+                -thickness / 2, thickness / 2, 50
+            )
+            voxel_points[:, 0] += voxel
+            points.append(voxel_points)
+        if pose_number == 0:
+            # Perfectly planar voxels seen only by the first pose mustn't be left
+            for voxel in range(single_pose_voxels_number):
+                voxel_points = random_generator.uniform(0.05, 0.95, (50, 3))
+                voxel_points[:, 2] = 0.5
+                voxel_points[:, 1] += voxel + 1
+                points.append(voxel_points)
+        grid.insert_points(pose_number, np.vstack(points))
+    voxel_index = VoxelIndex(grid, 2)
+    voxel_ids = sorted(
+        [
+            voxel_id
+            for voxel_id in voxel_index.voxel_ids
+            if len(voxel_index.get_pose_numbers(voxel_id)) == 2
+        ],
+        key=lambda voxel_id: voxel_index.get_points(voxel_id, 0)[0, 0],
+    )
+
+    filtered_index = PlanarityFilter(max_features_number)(voxel_index)
+
+    assert filtered_index.voxel_ids == sorted(voxel_ids[:max_features_number])
+    assert len(voxel_index) == len(thicknesses) + single_pose_voxels_number
+
+
+def test_incorrect_planarity_filter():
+    with pytest.raises(ValueError):
+        PlanarityFilter(0)
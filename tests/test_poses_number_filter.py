@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+from octreelib.grid import Grid, GridConfig
+
+from sova.filter import PosesNumberFilter
+from sova.grid import VoxelIndex
+
+
+@pytest.mark.parametrize(
+    "min_poses_number, expected_voxels_number",
+    [(1, 4), (2, 3), (3, 1), (4, 0)],
+)
+def test_poses_number_filter(min_poses_number: int, expected_voxels_number: int):
+    grid = Grid(GridConfig(voxel_edge_length=1))
+    # Voxels along x axis are observed by 3, 2, 1 and 2 poses
+    voxels_poses = [[0, 1, 2], [0, 1], [2], [1, 2]]
+    for pose_number in range(3):
+        grid.insert_points(
+            pose_number,
+            np.array(
+                [
+                    [voxel + 0.5, 0.5, 0.5]
+                    for voxel, pose_numbers in enumerate(voxels_poses)
+                    if pose_number in pose_numbers
+                ]
+            ),
+        )
+    voxel_index = VoxelIndex(grid, 3)
+
+    filtered_index = PosesNumberFilter(min_poses_number)(voxel_index)
+
+    assert len(filtered_index) == expected_voxels_number
+    for voxel_id in filtered_index.voxel_ids:
+        assert len(filtered_index.get_pose_numbers(voxel_id)) >= min_poses_number
+
+
+def test_incorrect_poses_number_filter():
+    with pytest.raises(ValueError):
+        PosesNumberFilter(0)
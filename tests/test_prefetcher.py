@@ -0,0 +1,46 @@
+import pytest
+
+import threading
+
+from sova.utils import Prefetcher
+
+
+@pytest.mark.parametrize("items, size", [([], 1), ([1, 2, 3], 1), (range(10), 3)])
+def test_prefetcher(items, size: int):
+    assert list(Prefetcher(items, size)) == list(items)
+
+
+def test_prefetcher_bounded_queue():
+    read_items = []
+    first_item_read = threading.Event()
+
+    def items():
+        for item in range(10):
+            read_items.append(item)
+            first_item_read.set()
+            yield item
+
+    with Prefetcher(items(), size=2) as prefetcher:
+        first_item_read.wait()
+        prefetcher._thread.join(timeout=0.5)
+        # Two items are waiting in the queue and one more is blocked on putting
+        assert read_items == [0, 1, 2]
+        assert next(prefetcher) == 0
+
+
+def test_prefetcher_exception():
+    def items():
+        yield 1
+        raise RuntimeError("Reading error")
+
+    prefetcher = Prefetcher(items())
+    assert next(prefetcher) == 1
+    with pytest.raises(RuntimeError):
+        next(prefetcher)
+    with pytest.raises(StopIteration):
+        next(prefetcher)
+
+
+def test_incorrect_prefetcher():
+    with pytest.raises(ValueError):
+        Prefetcher([], 0)
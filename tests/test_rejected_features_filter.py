@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+from octreelib.grid import Grid, GridConfig
+
+from typing import List
+
+from sova.filter import RejectedFeaturesFilter
+from sova.grid import VoxelIndex
+
+
+@pytest.mark.parametrize(
+    "rejected_voxels, expected_voxels",
+    [
+        ([], [0, 1, 2, 3]),
+        ([1], [0, 2, 3]),
+        ([0, 3, 3], [1, 2]),
+        ([0, 1, 2, 3], []),
+    ],
+)
+def test_rejected_features_filter(
+    rejected_voxels: List[int], expected_voxels: List[int]
+):
+    grid = Grid(GridConfig(voxel_edge_length=1))
+    points = np.array([[voxel + 0.5, 0.5, 0.5] for voxel in range(4)])
+    for pose_number in range(2):
+        grid.insert_points(pose_number, points)
+    voxel_index = VoxelIndex(grid, 2)
+    voxel_ids = sorted(
+        voxel_index.voxel_ids,
+        key=lambda voxel_id: voxel_index.get_points(voxel_id, 0)[0, 0],
+    )
+
+    rejected_features = RejectedFeaturesFilter()
+    # Rejected features are accumulated by several iterations
+    for voxel in rejected_voxels:
+        rejected_features.add([voxel_ids[voxel]])
+    filtered_index = rejected_features(voxel_index)
+
+    assert rejected_features.voxel_ids == {
+        voxel_ids[voxel] for voxel in rejected_voxels
+    }
+    assert filtered_index.voxel_ids == sorted(
+        voxel_ids[voxel] for voxel in expected_voxels
+    )
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from typing import List
+
+from sova.segmenter import (
+    CountSegmenter,
+    IdenticalSegmenter,
+    NumpyRansacSegmenter,
+    Segmenter,
+    SegmenterChain,
+)
+
+
+@pytest.mark.parametrize(
+    "segmenters",
+    [
+        [IdenticalSegmenter()],
+        [CountSegmenter(5), NumpyRansacSegmenter(threshold=0.1, seed=0)],
+        [NumpyRansacSegmenter(threshold=0.1, seed=0), CountSegmenter(50)],
+    ],
+)
+def test_segmenter_chain(segmenters: List[Segmenter]):
+    random_generator = np.random.default_rng(0)
+    points = np.vstack(
+        [
+            np.column_stack(
+                [random_generator.uniform(0, 1, (40, 2)), np.full(40, 0.5)]
+            ),
+            random_generator.uniform(0, 1, (20, 3)),
+        ]
+    )
+
+    expected_points = points
+    for segmenter in segmenters:
+        expected_points = segmenter(expected_points)
+
+    # Segmenters with random generators are recreated to make the same choices
+    chain = SegmenterChain(
+        [
+            (
+                NumpyRansacSegmenter(threshold=0.1, seed=0)
+                if isinstance(segmenter, NumpyRansacSegmenter)
+                else segmenter
+            )
+            for segmenter in segmenters
+        ]
+    )
+    actual_points = chain(points)
+
+    assert np.array_equal(actual_points, expected_points)
+
+
+def test_segmenter_chain_short_circuit():
+    ransac_segmenter = NumpyRansacSegmenter(seed=0)
+    chain = SegmenterChain([CountSegmenter(10), ransac_segmenter])
+
+    actual_points = chain(np.zeros((5, 3)))
+
+    assert actual_points.shape == (0, 3)
+    assert ransac_segmenter.calls_number == 0
+
+
+def test_empty_segmenter_chain():
+    with pytest.raises(ValueError):
+        SegmenterChain([])
@@ -4,14 +4,15 @@ import open3d as o3d
 import pytest
 from octreelib.grid import GridConfig, VisualizationConfig
 
+import copy
 import os
 from typing import List
 
 from sova.backend import Backend, EigenFactorBackend
 from sova.filter import Filter
 from sova.pipeline import SequentialPipeline, SequentialPipelineRuntimeParameters
-from sova.segmenter import CountSegmenter, Segmenter
-from sova.subdivider import CountSubdivider, Subdivider
+from sova.segmenter import CountSegmenter, Segmenter, SegmenterChain
+from sova.subdivider import CountSubdivider, SizeSubdivider, Subdivider
 from sova.typing import ArrayNx3, ArrayNx4x4
 
 
@@ -65,3 +66,149 @@ def test_sequential_pipeline(
     )
 
     assert output is not None
+
+
+@pytest.mark.parametrize(
+    "points, pose, dtype",
+    [
+        (
+            np.random.rand(100, 3),
+            np.array(
+                [
+                    [0, -1, 0, 1],
+                    [1, 0, 0, 2],
+                    [0, 0, 1, 3],
+                    [0, 0, 0, 1],
+                ],
+                dtype=float,
+            ),
+            np.float64,
+        ),
+        (
+            np.random.rand(100, 3),
+            np.array(
+                [
+                    [1, 0, 0, -1],
+                    [0, 0, -1, 0],
+                    [0, 1, 0, 5],
+                    [0, 0, 0, 1],
+                ],
+                dtype=float,
+            ),
+            np.float32,
+        ),
+    ],
+)
+def test_sequential_pipeline_transform(
+    points: ArrayNx3[float],
+    pose: ArrayNx4x4[float],
+    dtype: type,
+):
+    point_cloud = o3d.geometry.PointCloud(o3d.utility.Vector3dVector(points))
+    expected_points = np.asarray(copy.deepcopy(point_cloud).transform(pose).points)
+
+    for point_clouds in [[point_cloud, points[:10]], [points, points[:10]]]:
+        sequential_pipeline = SequentialPipeline(
+            point_clouds=point_clouds,
+            poses=[pose, pose],
+            subdividers=[],
+            segmenters=[],
+            filters=[],
+            backend=EigenFactorBackend(poses_number=2, iterations_number=1),
+            debug=False,
+        )
+        buffer = sequential_pipeline._allocate_points_buffer(dtype)
+        actual_points = sequential_pipeline._transform_point_cloud(0, buffer)
+
+        assert buffer.shape == (100, 3)
+        assert actual_points.dtype == dtype
+        assert np.allclose(actual_points, expected_points, atol=1e-5)
+        assert np.allclose(
+            sequential_pipeline._transform_point_cloud(1, buffer),
+            expected_points[:10],
+            atol=1e-5,
+        )
+
+
+@pytest.mark.parametrize("collect_counters", [True, False])
+def test_sequential_pipeline_statistics(collect_counters: bool, three_planes):
+    random_generator = np.random.default_rng(0)
+    point_clouds = [three_planes(random_generator) for _ in range(2)]
+
+    sequential_pipeline = SequentialPipeline(
+        point_clouds=point_clouds,
+        poses=[
+            mrob.geometry.SE3(random_generator.normal(0, 0.01, 6)).T() for _ in range(2)
+        ],
+        subdividers=[SizeSubdivider(2)],
+        segmenters=[CountSegmenter(5), CountSegmenter(20)],
+        filters=[],
+        backend=EigenFactorBackend(poses_number=2, iterations_number=10),
+        debug=False,
+    )
+    assert sequential_pipeline.statistics is None
+
+    sequential_pipeline.run(
+        SequentialPipelineRuntimeParameters(
+            grid_configuration=GridConfig(voxel_edge_length=4),
+            collect_counters=collect_counters,
+        )
+    )
+    statistics = sequential_pipeline.statistics
+
+    assert [stage.name for stage in statistics.stages] == [
+        "initial_insert",
+        "subdivide",
+        "distribution",
+        "transform",
+        "segmenter_0_CountSegmenter",
+        "segmenter_1_CountSegmenter",
+        "filter",
+        "backend",
+    ]
+    assert all(stage.duration >= 0 for stage in statistics.stages)
+    assert statistics.duration == sum(stage.duration for stage in statistics.stages)
+    assert statistics["transform"].points == 600
+    if collect_counters:
+        assert statistics["initial_insert"].points == 300
+        assert statistics["initial_insert"].leaves < statistics["subdivide"].leaves
+        assert statistics["distribution"].points == 600
+        assert (
+            statistics["segmenter_1_CountSegmenter"].points
+            <= statistics["segmenter_0_CountSegmenter"].points
+            <= 600
+        )
+    else:
+        assert statistics["distribution"].points is None
+        assert statistics["distribution"].leaves is None
+
+
+def test_sequential_pipeline_chain_statistics():
+    random_generator = np.random.default_rng(0)
+    point_clouds = [random_generator.uniform(0, 4, (300, 3)) for _ in range(2)]
+
+    sequential_pipeline = SequentialPipeline(
+        point_clouds=point_clouds,
+        poses=[np.eye(4)] * 2,
+        subdividers=[SizeSubdivider(2)],
+        segmenters=[SegmenterChain([CountSegmenter(5), CountSegmenter(20)])],
+        filters=[],
+        backend=EigenFactorBackend(poses_number=2, iterations_number=10),
+        debug=False,
+    )
+    sequential_pipeline.run(
+        SequentialPipelineRuntimeParameters(
+            grid_configuration=GridConfig(voxel_edge_length=4),
+            collect_counters=True,
+        )
+    )
+    statistics = sequential_pipeline.statistics
+
+    # Segmenters of chain are recorded before the chain, which keeps traversal of grid and counters
+    assert [stage.name for stage in statistics.stages][4:7] == [
+        "segmenter_0_SegmenterChain_0_CountSegmenter",
+        "segmenter_0_SegmenterChain_1_CountSegmenter",
+        "segmenter_0_SegmenterChain",
+    ]
+    assert all(stage.duration >= 0 for stage in statistics.stages)
+    assert statistics["segmenter_0_SegmenterChain"].points <= 600
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+from octreelib.grid import GridConfig
+
+from sova.grid import SlidingWindowGrid
+from sova.segmenter import CountSegmenter
+from sova.subdivider import CountSubdivider
+
+
+@pytest.fixture
+def grid() -> SlidingWindowGrid:
+    grid = SlidingWindowGrid(GridConfig(voxel_edge_length=2))
+    grid.insert_points(0, np.array([[0.5, 0.5, 0.5], [1.5, 1.5, 1.5], [2.5, 0, 0]]))
+    grid.subdivide([CountSubdivider(2)], [0])
+    grid.insert_points(
+        1,
+        np.array([[0.5, 0.5, 0.6], [0.5, 0.5, 0.7], [4.5, 0.5, 0.5], [5.5, 1.5, 1.5]]),
+    )
+    grid.subdivide([CountSubdivider(2)], [1])
+
+    return grid
+
+
+def test_sliding_window_grid_subdivision(grid: SlidingWindowGrid):
+    # Voxel [0, 0, 0] keeps the scheme of pose 0, voxel [4, 0, 0] is subdivided by pose 1
+    assert grid.poses_number == 2
+    assert grid.n_leaves(0) == 3
+    assert grid.n_leaves(1) == 3
+    assert [leaf.edge_length for leaf in grid.get_leaf_points(1)] == [1, 1, 1]
+
+
+def test_sliding_window_grid_map_leaf_points(grid: SlidingWindowGrid):
+    grid.map_leaf_points(CountSegmenter(1), [1])
+
+    assert grid.n_points(0) == 3
+    assert grid.n_points(1) == 2
+    assert np.all(grid.get_points(1) == [[0.5, 0.5, 0.6], [0.5, 0.5, 0.7]])
+
+
+def test_sliding_window_grid_remove_pose(grid: SlidingWindowGrid):
+    expected_points = grid.get_points(1)
+    grid.remove_pose(0)
+
+    assert grid.poses_number == 1
+    assert np.all(grid.get_points(0) == expected_points)
+
+    grid.insert_points(1, np.array([[2.5, 0.5, 0.5], [3.5, 1.5, 1.5]]))
+    grid.subdivide([CountSubdivider(2)], [1])
+
+    # Voxel [2, 0, 0] has been removed together with pose 0, so it is subdivided again
+    assert [leaf.edge_length for leaf in grid.get_leaf_points(1)] == [1, 1]
+    with pytest.raises(ValueError):
+        grid.insert_points(0, np.empty((0, 3)))
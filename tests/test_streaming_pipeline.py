@@ -0,0 +1,57 @@
+import mrob
+import numpy as np
+import pytest
+from octreelib.grid import GridConfig
+
+from sova.backend import EigenFactorBackend
+from sova.pipeline import SequentialPipelineRuntimeParameters, StreamingPipeline
+from sova.segmenter import CountSegmenter
+from sova.subdivider import SizeSubdivider
+
+
+@pytest.mark.parametrize(
+    "scans_number, window_size, expected_windows",
+    [
+        (4, 2, [(0, 2), (2, 4)]),
+        (5, 2, [(0, 2), (2, 4), (4, 5)]),
+        (3, 3, [(0, 3)]),
+    ],
+)
+def test_streaming_pipeline(scans_number, window_size, expected_windows, three_planes):
+    random_generator = np.random.default_rng(0)
+    read_scans = []
+
+    def scans():
+        for scan_number in range(scans_number):
+            points = three_planes(random_generator)
+            read_scans.append(scan_number)
+            yield points, mrob.geometry.SE3(random_generator.normal(0, 0.01, 6)).T()
+
+    pipeline = StreamingPipeline(
+        scans=scans(),
+        window_size=window_size,
+        subdividers=[SizeSubdivider(2)],
+        segmenters=[CountSegmenter(5)],
+        filters=[],
+        backend_factory=lambda start, end: EigenFactorBackend(
+            poses_number=end - start, iterations_number=10
+        ),
+    )
+
+    windows = []
+    for start, end, poses in pipeline.run(
+        SequentialPipelineRuntimeParameters(
+            grid_configuration=GridConfig(voxel_edge_length=4)
+        )
+    ):
+        # Scans are read lazily: only scans of solved windows have been consumed
+        assert read_scans == list(range(end))
+        assert len(poses) == end - start
+        windows.append((start, end))
+
+    assert windows == expected_windows
+
+
+def test_incorrect_streaming_pipeline():
+    with pytest.raises(ValueError):
+        StreamingPipeline([], 0, [], [], [], EigenFactorBackend)
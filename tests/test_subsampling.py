@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from sova.utils import stratified_subsample, uniform_subsample
+
+
+@pytest.mark.parametrize("subsample", [uniform_subsample, stratified_subsample])
+@pytest.mark.parametrize(
+    "points_number, count", [(100, 10), (100, 99), (10, 10), (5, 10)]
+)
+def test_subsample(subsample, points_number: int, count: int):
+    points = np.random.default_rng(0).uniform(0, 1, (points_number, 3))
+
+    subsampled_points = subsample(points, count, np.random.default_rng(1))
+
+    assert len(subsampled_points) == min(points_number, count)
+    # Chosen points are distinct points of the input in their original order
+    indices = [
+        np.flatnonzero(np.all(points == point, axis=1))[0]
+        for point in subsampled_points
+    ]
+    assert indices == sorted(set(indices))
+
+
+def test_stratified_subsample_coverage():
+    random_generator = np.random.default_rng(0)
+    # Dense cluster in one corner of the plane and sparse points everywhere else
+    points = np.vstack(
+        [
+            random_generator.uniform(0, 0.1, (900, 3)),
+            random_generator.uniform(0, 1, (100, 3)),
+        ]
+    )
+    points[:, 2] = 0
+
+    subsampled_points = stratified_subsample(points, 50, np.random.default_rng(1))
+
+    assert np.count_nonzero(np.all(subsampled_points[:, :2] > 0.1, axis=1)) > 25
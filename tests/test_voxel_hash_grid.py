@@ -0,0 +1,106 @@
+import mrob
+import numpy as np
+import pytest
+from octreelib.grid import Grid, GridConfig
+
+from typing import List
+
+from sova.backend import EigenFactorBackend
+from sova.filter import EmptyVoxel
+from sova.grid import VoxelHashGrid
+from sova.pipeline import SequentialPipeline, SequentialPipelineRuntimeParameters
+from sova.segmenter import CountSegmenter
+from sova.subdivider import CountSubdivider, SizeSubdivider, Subdivider
+
+
+def leaves_set(grid, pose_number: int):
+    return sorted(
+        (
+            tuple(leaf.corner_min),
+            leaf.edge_length,
+            tuple(sorted(map(tuple, leaf.get_points()))),
+        )
+        for leaf in grid.get_leaf_points(pose_number)
+    )
+
+
+@pytest.mark.parametrize(
+    "subdividers",
+    [
+        [SizeSubdivider(1)],
+        [CountSubdivider(20)],
+        [CountSubdivider(60), SizeSubdivider(2)],
+    ],
+)
+def test_voxel_hash_grid(subdividers: List[Subdivider]):
+    random_generator = np.random.default_rng(0)
+    octree_grid = Grid(GridConfig(voxel_edge_length=4))
+    voxel_hash_grid = VoxelHashGrid(GridConfig(voxel_edge_length=4))
+    for pose_number in range(3):
+        points = random_generator.uniform(-5, 7, (200, 3))
+        octree_grid.insert_points(pose_number, points)
+        voxel_hash_grid.insert_points(pose_number, points)
+
+    octree_grid.subdivide(subdividers)
+    voxel_hash_grid.subdivide(subdividers)
+    # Points of new pose are distributed using existing subdivision scheme
+    points = random_generator.uniform(-5, 7, (200, 3))
+    octree_grid.insert_points(3, points)
+    voxel_hash_grid.insert_points(3, points)
+
+    for grid in [octree_grid, voxel_hash_grid]:
+        grid.map_leaf_points(CountSegmenter(1))
+        grid.filter([EmptyVoxel()])
+
+    for pose_number in range(4):
+        assert leaves_set(voxel_hash_grid, pose_number) == leaves_set(
+            octree_grid, pose_number
+        )
+        assert voxel_hash_grid.n_points(pose_number) == octree_grid.n_points(
+            pose_number
+        )
+        assert voxel_hash_grid.n_leaves(pose_number) == octree_grid.n_leaves(
+            pose_number
+        )
+        assert voxel_hash_grid.n_nodes(pose_number) == octree_grid.n_nodes(pose_number)
+
+
+def test_voxel_hash_grid_insert_existing_pose():
+    grid = VoxelHashGrid(GridConfig(voxel_edge_length=4))
+    grid.insert_points(0, np.zeros((1, 3)))
+    with pytest.raises(ValueError):
+        grid.insert_points(0, np.zeros((1, 3)))
+
+
+def test_sequential_pipeline_voxel_hash_grid(three_planes):
+    random_generator = np.random.default_rng(0)
+    point_clouds = [three_planes(random_generator) for _ in range(2)]
+    poses = [
+        mrob.geometry.SE3(random_generator.normal(0, 0.01, 6)).T() for _ in range(2)
+    ]
+
+    statistics = []
+    for grid_type in [Grid, VoxelHashGrid]:
+        pipeline = SequentialPipeline(
+            point_clouds=point_clouds,
+            poses=poses,
+            subdividers=[SizeSubdivider(2)],
+            segmenters=[CountSegmenter(5)],
+            filters=[],
+            backend=EigenFactorBackend(poses_number=2, iterations_number=10),
+            debug=False,
+        )
+        pipeline.run(
+            SequentialPipelineRuntimeParameters(
+                grid_configuration=GridConfig(voxel_edge_length=4),
+                grid_type=grid_type,
+            )
+        )
+        statistics.append(
+            [
+                (stage.voxels, stage.leaves, stage.points)
+                for stage in pipeline.statistics.stages
+            ]
+        )
+
+    assert statistics[0] == statistics[1]
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+from octreelib.grid import Grid, GridConfig
+
+from typing import Type
+
+from sova.grid import VoxelHashGrid, VoxelIndex
+from sova.subdivider import CountSubdivider
+
+
+@pytest.mark.parametrize("grid_type", [Grid, VoxelHashGrid])
+def test_voxel_index(grid_type: Type):
+    random_generator = np.random.default_rng(0)
+    grid = grid_type(GridConfig(voxel_edge_length=4))
+    for pose_number in range(3):
+        # Every pose covers its own part of the space, so some voxels are seen by one pose only
+        grid.insert_points(
+            pose_number, random_generator.uniform(-5 + pose_number, 7, (300, 3))
+        )
+    grid.subdivide([CountSubdivider(60)])
+
+    voxel_index = VoxelIndex(grid, 3)
+
+    voxels_poses = {}
+    for pose_number in range(3):
+        for voxel in grid.get_leaf_points(pose_number):
+            voxels_poses.setdefault(voxel.id, []).append(pose_number)
+            assert np.array_equal(
+                voxel_index.get_points(voxel.id, pose_number), voxel.get_points()
+            )
+
+    assert voxel_index.voxel_ids == sorted(voxels_poses.keys())
+    assert len(voxel_index) == len(voxels_poses)
+    assert len(voxel_index.points) == sum(grid.n_points(pose) for pose in range(3))
+    for voxel_id, pose_numbers in voxels_poses.items():
+        assert voxel_index.get_pose_numbers(voxel_id) == pose_numbers
+        assert np.array_equal(
+            voxel_index.get_voxel_points(voxel_id),
+            np.vstack(
+                [voxel_index.get_points(voxel_id, pose) for pose in pose_numbers]
+            ),
+        )
+        for pose_number in set(range(3)) - set(pose_numbers):
+            assert len(voxel_index.get_points(voxel_id, pose_number)) == 0
+
+    shared_voxels = dict(voxel_index.items(min_poses_number=2))
+    assert set(shared_voxels.keys()) == {
+        voxel_id
+        for voxel_id, pose_numbers in voxels_poses.items()
+        if len(pose_numbers) >= 2
+    }
+    for voxel_id, poses_points in shared_voxels.items():
+        assert [pose_number for pose_number, _ in poses_points] == voxels_poses[
+            voxel_id
+        ]
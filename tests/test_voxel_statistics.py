@@ -0,0 +1,133 @@
+import numpy as np
+import pytest
+
+from typing import List
+
+from sova.segmenter import CAPESegmenter
+from sova.subdivider import (
+    CountSubdivider,
+    EigenValueSubdivider,
+    SizeSubdivider,
+    Subdivider,
+)
+from sova.typing import ArrayNx3
+from sova.utils import VoxelStatistics, covariance_eigenvalues
+
+random_generator = np.random.default_rng(0)
+
+
+@pytest.mark.parametrize(
+    "poses_points",
+    [
+        [random_generator.normal(0, 1, (count, 3)) for count in [20, 1, 0, 7]],
+        # Large coordinates with small spread must not lose precision
+        [random_generator.normal(1e6, 1e-2, (100, 3)) for _ in range(3)],
+        [
+            np.column_stack([random_generator.uniform(0, 1, (30, 2)), np.zeros(30)])
+            for _ in range(2)
+        ],
+    ],
+)
+def test_voxel_statistics(poses_points: List[ArrayNx3[float]]):
+    points = np.vstack(poses_points)
+
+    incremental_statistics = VoxelStatistics()
+    merged_statistics = VoxelStatistics()
+    for pose_points in poses_points:
+        incremental_statistics.add_points(pose_points)
+        merged_statistics.merge(VoxelStatistics(pose_points))
+
+    for statistics in [incremental_statistics, merged_statistics]:
+        assert statistics.count == len(points)
+        assert np.allclose(statistics.sum, points.sum(axis=0), rtol=1e-12)
+        assert np.allclose(statistics.mean, points.mean(axis=0), rtol=1e-12)
+        assert np.allclose(statistics.covariance, np.cov(points.T), atol=1e-12)
+        assert np.allclose(statistics.outer_products_sum, points.T @ points, rtol=1e-9)
+        assert np.array_equal(statistics.min_bound, points.min(axis=0))
+        assert np.array_equal(statistics.max_bound, points.max(axis=0))
+        assert np.allclose(
+            statistics.eigenvalues,
+            covariance_eigenvalues([points])[0],
+            atol=1e-9,
+            equal_nan=True,
+        )
+
+
+@pytest.mark.parametrize("points_number", [6, 7, 12, 23, 60])
+def test_equivalent_points(points_number: int):
+    points = random_generator.normal(100, [1, 2, 0.01], (50, 3))
+    homogeneous_points = np.column_stack([points, np.ones(len(points))])
+
+    equivalent_points = VoxelStatistics(points).equivalent_points(points_number)
+    homogeneous_equivalent_points = np.column_stack(
+        [equivalent_points, np.ones(len(equivalent_points))]
+    )
+
+    assert equivalent_points.shape == (points_number, 3)
+    assert np.allclose(
+        homogeneous_equivalent_points.T @ homogeneous_equivalent_points,
+        homogeneous_points.T @ homogeneous_points * points_number / len(points),
+    )
+    with pytest.raises(ValueError):
+        VoxelStatistics(points).equivalent_points(5)
+
+
+def test_batch_voxel_statistics():
+    voxels_points = [
+        random_generator.normal(1e3, [1, 2, 0.01], (count, 3))
+        for count in [0, 1, 2, 30, 0, 7]
+    ]
+    voxels_points[3][:, 2] = 1e3
+
+    for points, batch_statistics in zip(
+        voxels_points, VoxelStatistics.batch(voxels_points)
+    ):
+        statistics = VoxelStatistics(points)
+
+        assert batch_statistics.count == statistics.count
+        assert np.allclose(batch_statistics.mean, statistics.mean)
+        assert np.allclose(batch_statistics.scatter, statistics.scatter)
+        assert np.array_equal(batch_statistics.min_bound, statistics.min_bound)
+        assert np.array_equal(batch_statistics.max_bound, statistics.max_bound)
+        assert np.allclose(
+            batch_statistics.eigenvalues, statistics.eigenvalues, equal_nan=True
+        )
+
+
+def test_empty_voxel_statistics():
+    statistics = VoxelStatistics(np.empty((0, 3)))
+
+    assert statistics.count == 0
+    assert np.all(statistics.sum == 0)
+    assert np.all(np.isnan(statistics.covariance))
+    assert np.all(np.isnan(statistics.eigenvalues))
+
+
+@pytest.mark.parametrize(
+    "subdivider",
+    [
+        CountSubdivider(10),
+        SizeSubdivider(1),
+        EigenValueSubdivider(0.1),
+    ],
+)
+def test_subdivider_statistics(subdivider: Subdivider):
+    for count in [0, 2, 10, 50]:
+        for scale in [0.5, 3]:
+            points = random_generator.uniform(0, scale, (count, 3))
+            points[:, 2] *= 0.01
+
+            assert subdivider.check_statistics(VoxelStatistics(points)) == subdivider(
+                points
+            )
+
+
+@pytest.mark.parametrize("correlation", [1.5, 3, 30])
+def test_cape_statistics(correlation: float):
+    cape_segmenter = CAPESegmenter(correlation=correlation)
+    for count in [5, 11, 50]:
+        points = random_generator.normal(0, [1, 2, 0.3], (count, 3))
+
+        assert cape_segmenter.is_planar(VoxelStatistics(points)) == (
+            len(cape_segmenter(points)) > 0
+        )
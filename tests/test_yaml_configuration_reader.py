@@ -1,13 +1,28 @@
 import mrob
 import pytest
+import yaml
 from octreelib.grid import GridConfig
 
+import os
 from typing import List
 
 from sova.backend import Backend, EigenFactorBackend
-from sova.filter import Filter
+from sova.executor import ThreadExecutor
+from sova.filter import (
+    EmptyVoxel,
+    FeatureFilter,
+    Filter,
+    PlanarityFilter,
+    PosesNumberFilter,
+)
+from sova.grid import VoxelHashGrid
 from sova.pipeline import YAMLConfigurationReader
-from sova.segmenter import RansacSegmenter, Segmenter
+from sova.segmenter import (
+    CountSegmenter,
+    RansacSegmenter,
+    Segmenter,
+    SegmenterChain,
+)
 from sova.subdivider import SizeSubdivider, Subdivider
 
 
@@ -84,6 +99,62 @@ def test_correct_configuration(
         assert backend.__dict__[field] == actual_backend.__dict__[field]
 
 
+@pytest.mark.parametrize(
+    "yaml_configuration_path, "
+    "workers_number, "
+    "filters, "
+    "feature_filters, "
+    "segmenters, "
+    "grid_type, "
+    "executor_type, "
+    "executor_workers_number",
+    [
+        (
+            "tests/data/yaml_configurations/correct_configuration_extended.yaml",
+            4,
+            [EmptyVoxel()],
+            [PosesNumberFilter(3), PlanarityFilter(100)],
+            [SegmenterChain([CountSegmenter(5), RansacSegmenter(0.01, 6, 5000)])],
+            VoxelHashGrid,
+            ThreadExecutor,
+            2,
+        ),
+    ],
+)
+def test_correct_extended_configuration(
+    yaml_configuration_path: str,
+    workers_number: int,
+    filters: List[Filter],
+    feature_filters: List[FeatureFilter],
+    segmenters: List[Segmenter],
+    grid_type: type,
+    executor_type: type,
+    executor_workers_number: int,
+):
+    yaml_reader = YAMLConfigurationReader(yaml_configuration_path)
+
+    assert yaml_reader.dataset_cache_path is None
+    assert yaml_reader.dataset_memory_cache_bytes == 0
+    assert workers_number == yaml_reader.workers_number
+    assert len(filters) == len(yaml_reader.filters)
+    for filter_, actual_filter in zip(filters, yaml_reader.filters):
+        assert type(filter_) is type(actual_filter)
+    assert len(feature_filters) == len(yaml_reader.feature_filters)
+    for feature_filter, actual_feature_filter in zip(
+        feature_filters, yaml_reader.feature_filters
+    ):
+        assert type(feature_filter) is type(actual_feature_filter)
+    assert len(segmenters) == len(yaml_reader.segmenters)
+    for segmenter, actual_segmenter in zip(segmenters, yaml_reader.segmenters):
+        assert type(segmenter) is type(actual_segmenter)
+    assert grid_type == yaml_reader.grid_type
+    with yaml_reader.executor as executor:
+        assert isinstance(executor, executor_type)
+        assert executor.workers_number == executor_workers_number
+    actual_backend = yaml_reader.backend(0, 10)
+    assert len(actual_backend.__dict__["_feature_filters"]) == len(feature_filters)
+
+
 @pytest.mark.parametrize(
     "yaml_configuration_path, missed_field",
     [
@@ -128,6 +199,7 @@ def test_incorrect_yaml_configuration_reader(
         _ = yaml_reader.patches_step
         _ = yaml_reader.patches_iterations
         _ = yaml_reader.output_directory
+        _ = yaml_reader.workers_number
         _ = yaml_reader.subdividers
         _ = yaml_reader.filters
         _ = yaml_reader.segmenters
@@ -138,3 +210,47 @@ def test_incorrect_yaml_configuration_reader(
         str(excinfo.value) == f"'{missed_field}' must be set"
         or str(excinfo.value) == f"{missed_field} must be not empty"
     )
+
+
+@pytest.mark.parametrize("executor_type", ["thread", "process"])
+@pytest.mark.parametrize("workers_number", [1, 4, 1000])
+def test_executor_workers_number(tmp_path, executor_type: str, workers_number: int):
+    yaml_configuration_path = tmp_path / "configuration.yaml"
+    with open(yaml_configuration_path, "w") as file:
+        yaml.safe_dump(
+            {
+                "pipeline": {
+                    "executor": {"type": executor_type},
+                    "workers": workers_number,
+                }
+            },
+            file,
+        )
+
+    with YAMLConfigurationReader(str(yaml_configuration_path)).executor as executor:
+        # Processors are divided between workers of PatchRunner
+        assert executor.workers_number == max(
+            1, (os.cpu_count() or 1) // workers_number
+        )
+
+
+@pytest.mark.parametrize(
+    "pipeline_configuration, expected_message",
+    [
+        ({"grid": {"type": "kd_tree"}}, "Unknown grid type kd_tree"),
+        ({"executor": {"type": "gpu"}}, "Unknown executor type gpu"),
+    ],
+)
+def test_unknown_grid_and_executor_types(
+    tmp_path, pipeline_configuration: dict, expected_message: str
+):
+    yaml_configuration_path = tmp_path / "configuration.yaml"
+    with open(yaml_configuration_path, "w") as file:
+        yaml.safe_dump({"pipeline": pipeline_configuration}, file)
+    yaml_reader = YAMLConfigurationReader(str(yaml_configuration_path))
+
+    with pytest.raises(ValueError) as excinfo:
+        _ = yaml_reader.grid_type
+        _ = yaml_reader.executor
+
+    assert str(excinfo.value) == expected_message